@@ -34,6 +34,15 @@ MERGE_PROFILE_SCHEMA = {
             "additionalProperties": {
                 "enum": ["kept_primary", "kept_duplicate", "kept_longest"]
             }
+        },
+        "resolutions_by_user": {
+            "type": "object",
+            "additionalProperties": {
+                "type": "object",
+                "additionalProperties": {
+                    "enum": ["kept_primary", "kept_duplicate", "kept_longest"]
+                }
+            }
         }
     }
 }
@@ -53,25 +62,36 @@ def ensure_logs_directory() -> Path:
 def log_merge_event(
     primary_id: int,
     merged_ids: List[int], 
-    field_resolutions: Dict[str, str]
+    resolutions_by_user: Dict[int, Dict[str, str]]
 ) -> None:
     """Log a merge profile event to the structured log file.
     
+    The whole merge is written as a single JSON line. ``field_resolutions``
+    holds the final decision per field (later merge users win), while
+    ``resolutions_by_user`` keeps each merge user's decisions separately.
+    
     Args:
         primary_id: ID of the primary user that was kept
         merged_ids: List of user IDs that were merged into primary
-        field_resolutions: Dictionary mapping field names to resolution decisions
+        resolutions_by_user: Maps each merge user ID to its field resolution decisions
     """
     logs_dir = ensure_logs_directory()
     log_file = logs_dir / "merge_profile.log"
     
+    field_resolutions = {}
+    for resolutions in resolutions_by_user.values():
+        field_resolutions.update(resolutions)
+    
     # Create log entry
     log_entry = {
         "event": "MERGE_PROFILE",
         "timestamp": datetime.now().isoformat() + "Z",
         "primary_id": primary_id,
         "merged_ids": merged_ids,
-        "field_resolutions": field_resolutions
+        "field_resolutions": field_resolutions,
+        "resolutions_by_user": {
+            str(user_id): resolutions for user_id, resolutions in resolutions_by_user.items()
+        }
     }
     
     # Validate against schema if jsonschema is available
@@ -2,9 +2,10 @@
 
 from datetime import datetime
 from enum import Enum
-from typing import Optional, List
+from operator import attrgetter
+from typing import ClassVar, Optional, List, Tuple
 
-from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean, ForeignKey, UniqueConstraint, Index
+from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean, ForeignKey, UniqueConstraint, Index, DDL, case, event, or_
 from sqlalchemy.orm import declarative_base, relationship
 from sqlalchemy.sql import func
 
@@ -18,6 +19,34 @@ class ProfileRole(Enum):
     ORG_MEMBER = "org_member"
 
 
+# Email suffixes that classify a user as an organization member
+ORG_MEMBER_EMAIL_SUFFIXES = ('@tournamentorg.com', '@admin.com')
+
+# Every character str.strip() removes (all whitespace lies below U+3001), so SQL
+# TRIM can blank the same emails that classify_role treats as missing
+_STRIP_CHARACTERS = ''.join(ch for ch in map(chr, range(0x3001)) if ch.isspace())
+
+
+def classify_role(email: Optional[str]) -> ProfileRole:
+    """Classify a user role from their email address.
+    
+    Args:
+        email: The user's email address, if any
+        
+    Returns:
+        ProfileRole: The role classification for that email
+    """
+    # For now, we'll implement basic logic. In future phases, org_member
+    # would check for actual organization membership
+    if email and email.strip():
+        # Users with tournament org emails or admin privileges would be org_member
+        if email.endswith(ORG_MEMBER_EMAIL_SUFFIXES):
+            return ProfileRole.ORG_MEMBER
+        return ProfileRole.REGISTERED_USER
+    else:
+        return ProfileRole.UNREGISTERED_USER
+
+
 class User(Base):
     """User model for storing user account information."""
     
@@ -34,10 +63,22 @@ class User(Base):
     tnba_id = Column(String(50), nullable=True)
     created_at = Column(DateTime, default=func.now())
     deleted_at = Column(DateTime, nullable=True)
+    # Row version for optimistic concurrency; bumped on every ORM update
+    version = Column(Integer, nullable=False, server_default='1')
     
     # Relationships
     organization_memberships = relationship("OrganizationMembership", back_populates="user", cascade="all, delete-orphan")
     
+    # ORM updates run as UPDATE ... WHERE id = ? AND version = ? and raise
+    # StaleDataError if another transaction changed the row in the meantime
+    __mapper_args__ = {"version_id_col": version}
+    
+    # Profile fields compared and carried over when merging users
+    MERGEABLE_FIELDS: ClassVar[Tuple[str, ...]] = ('email', 'phone', 'address', 'usbc_id', 'tnba_id')
+    
+    # Fetches the MERGEABLE_FIELDS values of a user as a tuple in one call
+    _merge_getter: ClassVar[attrgetter] = attrgetter(*MERGEABLE_FIELDS)
+    
     def soft_delete(self) -> None:
         """Soft delete the user by setting deleted_at timestamp."""
         self.deleted_at = func.now()
@@ -52,16 +93,31 @@ class User(Base):
         Returns:
             ProfileRole: The user's role classification
         """
-        # For now, we'll implement basic logic. In future phases, org_member
-        # would check for actual organization membership
-        if self.email and self.email.strip():
-            # Users with tournament org emails or admin privileges would be org_member
-            if (self.email.endswith('@tournamentorg.com') or 
-                self.email.endswith('@admin.com')):
-                return ProfileRole.ORG_MEMBER
-            return ProfileRole.REGISTERED_USER
-        else:
-            return ProfileRole.UNREGISTERED_USER
+        return classify_role(self.email)
+    
+    @classmethod
+    def role_expression(cls):
+        """Build the SQL equivalent of get_role() for filtering in the database.
+        
+        Returns:
+            SQL CASE expression evaluating to the ProfileRole value of each row
+        """
+        # Suffixes are compared with = rather than LIKE, which ignores case on
+        # SQLite; str.endswith() is case-sensitive
+        return case(
+            (
+                or_(cls.email.is_(None), func.trim(cls.email, _STRIP_CHARACTERS) == ''),
+                ProfileRole.UNREGISTERED_USER.value
+            ),
+            (
+                or_(*(
+                    func.substr(cls.email, func.length(cls.email) - len(suffix) + 1) == suffix
+                    for suffix in ORG_MEMBER_EMAIL_SUFFIXES
+                )),
+                ProfileRole.ORG_MEMBER.value
+            ),
+            else_=ProfileRole.REGISTERED_USER.value
+        )
     
     def is_registered_user(self) -> bool:
         """Check if user is a registered user (has email).
@@ -241,6 +297,54 @@ class Role(Base):
         return f"<Role(id={self.id}, name='{self.name}', organization_id={self.organization_id})>"
 
 
+# Case-insensitive name lookups compare lower(name); index the expressions so they can seek.
+# Permission and role names are unique per organization regardless of case, which lets
+# the create commands insert first and rely on the database to reject duplicates.
+Index('ix_organization_lower_name', func.lower(Organization.name))
+Index('ix_permission_org_lower_name', Permission.organization_id, func.lower(Permission.name), unique=True)
+Index('ix_role_org_lower_name', Role.organization_id, func.lower(Role.name), unique=True)
+
+# Partial-match user searches use ILIKE '%term%', which a btree index cannot serve.
+# On PostgreSQL, pg_trgm GIN indexes let those predicates use an index scan instead
+# of a sequential scan; other databases skip these indexes.
+event.listen(
+    Base.metadata,
+    'before_create',
+    DDL('CREATE EXTENSION IF NOT EXISTS pg_trgm').execute_if(dialect='postgresql')
+)
+Index('ix_users_first_name_trgm', User.first_name, postgresql_using='gin',
+      postgresql_ops={'first_name': 'gin_trgm_ops'}).ddl_if(dialect='postgresql')
+Index('ix_users_last_name_trgm', User.last_name, postgresql_using='gin',
+      postgresql_ops={'last_name': 'gin_trgm_ops'}).ddl_if(dialect='postgresql')
+Index('ix_users_email_trgm', User.email, postgresql_using='gin',
+      postgresql_ops={'email': 'gin_trgm_ops'}).ddl_if(dialect='postgresql')
+Index('ix_users_phone_trgm', User.phone, postgresql_using='gin',
+      postgresql_ops={'phone': 'gin_trgm_ops'}).ddl_if(dialect='postgresql')
+Index('ix_users_address_trgm', User.address, postgresql_using='gin',
+      postgresql_ops={'address': 'gin_trgm_ops'}).ddl_if(dialect='postgresql')
+
+# User listings always exclude soft-deleted users and order by id, name or newest first,
+# with id as the final tie-breaker.
+# Partial indexes over active users in each sort order let a paginated listing read
+# rows in index order and stop at the LIMIT instead of sorting the whole table.
+_active_users = User.deleted_at.is_(None)
+Index('ix_users_active_id', User.id,
+      sqlite_where=_active_users, postgresql_where=_active_users)
+Index('ix_users_active_name', User.last_name, User.first_name, User.id,
+      sqlite_where=_active_users, postgresql_where=_active_users)
+Index('ix_users_active_created', User.created_at.desc(), User.id,
+      sqlite_where=_active_users, postgresql_where=_active_users)
+
+# Exact-match filters on external IDs among active users (email is already served
+# by its unique index). Names match scripts/add_unique_indexes.sql.
+Index('idx_users_usbc_id_active', User.usbc_id,
+      sqlite_where=_active_users & User.usbc_id.isnot(None),
+      postgresql_where=_active_users & User.usbc_id.isnot(None))
+Index('idx_users_tnba_id_active', User.tnba_id,
+      sqlite_where=_active_users & User.tnba_id.isnot(None),
+      postgresql_where=_active_users & User.tnba_id.isnot(None))
+
+
 class RolePermission(Base):
     """Association table for Role-Permission many-to-many relationship."""
     
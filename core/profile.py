@@ -32,7 +32,7 @@ def get_profile(
     """
     try:
         if user_id is not None:
-            user = session.query(User).filter(User.id == user_id).first()
+            user = session.get(User, user_id)
         elif email is not None:
             user = session.query(User).filter(User.email == email).first()
         elif usbc_id is not None:
@@ -102,7 +102,7 @@ def edit_profile(
         True if successful, False otherwise
     """
     try:
-        user = session.query(User).filter(User.id == user_id).first()
+        user = session.get(User, user_id)
         if not user:
             return False
             
@@ -144,7 +144,7 @@ def delete_profile(session: Session, user_id: int) -> bool:
         True if successful, False if user not found
     """
     try:
-        user = session.query(User).filter(User.id == user_id).first()
+        user = session.get(User, user_id)
         if not user:
             return False
             
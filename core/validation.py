@@ -0,0 +1,32 @@
+"""Input normalization helpers for the 4th Arrow Tournament Control application."""
+
+from functools import lru_cache
+from typing import Optional, Tuple
+
+
+@lru_cache(maxsize=1024)
+def normalize_text(
+    value: str, max_length: int, allow_empty: bool = False
+) -> Tuple[str, Optional[str]]:
+    """Strip surrounding whitespace and enforce a maximum length.
+    
+    Problems are returned rather than raised, so both valid and invalid
+    results are cached and repeated validation of the same input is a lookup.
+    
+    Args:
+        value: Text to normalize
+        max_length: Maximum allowed length after stripping
+        allow_empty: Whether an empty result is acceptable
+        
+    Returns:
+        Tuple[str, Optional[str]]: The stripped text, and a description of the
+        problem (e.g. "cannot be empty") or None if the text is valid
+    """
+    normalized = value.strip() if value else ""
+    if not normalized and not allow_empty:
+        return normalized, "cannot be empty"
+    
+    if len(normalized) > max_length:
+        return normalized, f"cannot exceed {max_length} characters"
+    
+    return normalized, None
@@ -9,8 +9,7 @@ from core.auth import auth_manager, AuthenticationError
 from core.profile import get_profile, display_profile, edit_profile, delete_profile
 from storage.database import db_manager
 from src.commands.create import create_user, validate_create_args
-from src.commands.merge import merge_profiles, validate_merge_args, handle_merge_errors
-from src.commands.list_users import list_users, display_users
+from src.commands.merge import LOCK_MODES, merge_profiles, validate_merge_args, handle_merge_errors
 from src.commands.create_organization import create_organization_command
 from src.commands.edit_organization import edit_organization_command
 from src.commands.create_org_permission import create_org_permission_command
@@ -20,11 +19,21 @@ from src.commands.remove_org_user import remove_org_user_command
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
 
-@click.group()
-def cli():
+class CLIGroup(click.Group):
+    """Command group that records whether a subcommand was asked only for help."""
+    
+    def parse_args(self, ctx: click.Context, args: list) -> list:
+        ctx.meta["help_only"] = any(arg in ctx.help_option_names for arg in args)
+        return super().parse_args(ctx, args)
+
+
+@click.group(cls=CLIGroup)
+@click.pass_context
+def cli(ctx: click.Context):
     """4th Arrow Tournament Control CLI."""
-    # Initialize database tables
-    db_manager.create_tables()
+    # Initialize database tables, unless the subcommand is only printing help
+    if not ctx.meta.get("help_only"):
+        db_manager.create_tables()
 
 
 @cli.command()
@@ -48,7 +57,7 @@ def signup(
 ):
     """Sign up a new user account."""
     try:
-        session = db_manager.get_session()
+        session = db_manager.Session()
         try:
             user = auth_manager.create_user(
                 session=session,
@@ -79,7 +88,7 @@ def signup(
 def login(email: str, password: str):
     """Log in with email and password."""
     try:
-        session = db_manager.get_session()
+        session = db_manager.Session()
         try:
             user = auth_manager.authenticate_user(session, email, password)
         finally:
@@ -109,7 +118,7 @@ def get_profile_cmd(user_id: Optional[int], email: Optional[str], usbc_id: Optio
         sys.exit(1)
     
     try:
-        session = db_manager.get_session()
+        session = db_manager.Session()
         try:
             user = get_profile(session=session, user_id=user_id, email=email, usbc_id=usbc_id, tnba_id=tnba_id)
         finally:
@@ -140,7 +149,7 @@ def edit_profile_cmd(user_id: int, first: Optional[str], last: Optional[str], ph
         sys.exit(1)
     
     try:
-        session = db_manager.get_session()
+        session = db_manager.Session()
         try:
             success = edit_profile(session=session, user_id=user_id, first=first, last=last, phone=phone, address=address)
             if success:
@@ -172,7 +181,7 @@ def delete_profile_cmd(user_id: int, confirm: Optional[str]):
         sys.exit(1)
     
     try:
-        session = db_manager.get_session()
+        session = db_manager.Session()
         try:
             success = delete_profile(session=session, user_id=user_id)
             if success:
@@ -275,7 +284,10 @@ def create(
               help='Automatically prefer longer values in conflicts')
 @click.option('--no-interactive', is_flag=True, default=False,
               help='Use automatic resolution without prompts')
-def merge(main_id: int, merge_id: tuple, dry_run: bool, resolution_mode: str, no_interactive: bool):
+@click.option('--lock-mode', type=click.Choice(LOCK_MODES), default='wait', show_default=True,
+              help='How to handle users locked by another operation: wait, fail (nowait) or skip')
+def merge(main_id: int, merge_id: tuple, dry_run: bool, resolution_mode: str, no_interactive: bool,
+          lock_mode: str):
     """Merge one or more user profiles into a main profile.
     
     This command consolidates duplicate user profiles by merging all data
@@ -294,6 +306,9 @@ def merge(main_id: int, merge_id: tuple, dry_run: bool, resolution_mode: str, no
         
         # Auto-resolve conflicts preferring main user values
         python main.py merge -m 3 -i 5 --prefer-main --no-interactive
+        
+        # Fail straight away (exit code 6) if another merge holds the users
+        python main.py merge -m 3 -i 5 --lock-mode nowait
     """
     merge_ids = list(merge_id)
     
@@ -302,7 +317,8 @@ def merge(main_id: int, merge_id: tuple, dry_run: bool, resolution_mode: str, no
         merge_ids=merge_ids,
         dry_run=dry_run,
         resolution_mode=resolution_mode,
-        no_interactive=no_interactive
+        no_interactive=no_interactive,
+        lock_mode=lock_mode
     )
     
     if exit_code != 0:
@@ -418,7 +434,7 @@ def list_users_cmd(
             sys.exit(4)
         
         # Call enhanced list users function
-        users_data = list_users_enhanced(
+        result = list_users_enhanced(
             first=first,
             last=last,
             email=email,
@@ -435,7 +451,7 @@ def list_users_cmd(
         
         # Success message for CSV export
         if csv_path:
-            click.echo(f"Exported {len(users_data)} users to {csv_path}")
+            click.echo(f"Exported {result} users to {csv_path}")
         
     except SQLAlchemyError as e:
         click.echo(f"ERROR: Database error occurred: {e}", err=True)
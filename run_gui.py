@@ -9,6 +9,7 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 try:
     from src.gui.app import create_app
+    from storage.database import db_manager
     print("Successfully imported create_app")
 except ImportError as e:
     print(f"Failed to import create_app: {e}")
@@ -17,7 +18,8 @@ except ImportError as e:
 if __name__ == '__main__':
     print("Starting Flask application...")
     try:
-        # Create and run the app (database init happens inside create_app)
+        # Make sure the database schema exists, then create and run the app
+        db_manager.create_tables()
         app = create_app()
         print("App created successfully, starting server...")
         app.run(debug=True, host='127.0.0.1', port=4000)
@@ -2,7 +2,9 @@
 """Simple script to run the GUI application."""
 
 from src.gui.app import create_app
+from storage.database import db_manager
 
 if __name__ == '__main__':
+    db_manager.create_tables()
     app = create_app()
     app.run(debug=True, host='127.0.0.1', port=4000)
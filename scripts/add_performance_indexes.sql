@@ -0,0 +1,22 @@
+-- Indexes backing hot-path lookups
+-- New databases get these from the model definitions via create_all();
+-- run this script to add them to an existing database.
+
+-- Case-insensitive organization lookup by name
+CREATE INDEX IF NOT EXISTS ix_organization_lower_name ON organizations(lower(name));
+
+-- Case-insensitive permission lookup and uniqueness by name within an organization
+-- (fails if the table already holds names differing only by case; resolve those first)
+DROP INDEX IF EXISTS ix_permission_org_lower_name;
+CREATE UNIQUE INDEX ix_permission_org_lower_name ON permissions(organization_id, lower(name));
+
+-- Case-insensitive role lookup and uniqueness by name within an organization
+DROP INDEX IF EXISTS ix_role_org_lower_name;
+CREATE UNIQUE INDEX ix_role_org_lower_name ON roles(organization_id, lower(name));
+
+-- Active-user listing in each sort order (id, last/first name, newest first)
+CREATE INDEX IF NOT EXISTS ix_users_active_id ON users(id) WHERE deleted_at IS NULL;
+DROP INDEX IF EXISTS ix_users_active_name;
+CREATE INDEX ix_users_active_name ON users(last_name, first_name, id) WHERE deleted_at IS NULL;
+DROP INDEX IF EXISTS ix_users_active_created;
+CREATE INDEX ix_users_active_created ON users(created_at DESC, id) WHERE deleted_at IS NULL;
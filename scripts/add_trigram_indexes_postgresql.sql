@@ -0,0 +1,14 @@
+-- Trigram indexes backing partial-match user searches (PostgreSQL only)
+-- list-users filters names, email, phone and address with ILIKE '%term%', which
+-- a btree index cannot serve; GIN trigram indexes let PostgreSQL use an index scan
+-- for patterns of three or more characters.
+-- New databases get these from the model definitions via create_all();
+-- run this script to add them to an existing database.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS ix_users_first_name_trgm ON users USING gin (first_name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS ix_users_last_name_trgm ON users USING gin (last_name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS ix_users_email_trgm ON users USING gin (email gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS ix_users_phone_trgm ON users USING gin (phone gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS ix_users_address_trgm ON users USING gin (address gin_trgm_ops);
@@ -22,6 +22,6 @@ WHERE deleted_at IS NULL AND usbc_id IS NOT NULL;
 CREATE INDEX IF NOT EXISTS idx_users_tnba_id_active ON users(tnba_id)
 WHERE deleted_at IS NULL AND tnba_id IS NOT NULL;
 
--- Composite index for name-based searches among active users
-CREATE INDEX IF NOT EXISTS idx_users_names_active ON users(last_name, first_name)
-WHERE deleted_at IS NULL;
\ No newline at end of file
+-- Name-based searches among active users use ix_users_active_name, declared in
+-- core/models.py (see add_performance_indexes.sql); drop the older duplicate
+DROP INDEX IF EXISTS idx_users_names_active;
\ No newline at end of file
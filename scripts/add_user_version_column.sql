@@ -0,0 +1,5 @@
+-- Row version column used for optimistic concurrency on users
+-- New databases get this column from the model definition via create_all();
+-- run this script once to add it to an existing database.
+
+ALTER TABLE users ADD COLUMN version INTEGER NOT NULL DEFAULT 1;
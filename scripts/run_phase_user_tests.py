@@ -1,12 +1,13 @@
 """
 Phase User Comprehensive Test Runner
 
-This script runs all Phase User tests and generates a detailed coverage report.
-It includes performance benchmarking and test result summaries.
+This script runs all Phase User tests and, with --coverage, generates a detailed
+coverage report. It includes performance benchmarking and test result summaries.
 """
 
 import argparse
 import os
+import re
 import subprocess
 import sys
 import time
@@ -45,15 +46,45 @@ EXISTING_TEST_FILES = [
     "tests/gui/test_gui_forms.py",
 ]
 
+# pytest's final summary line, e.g. "== 2 failed, 40 passed, 1 skipped in 3.10s =="
+_SUMMARY_LINE_RE = re.compile(r"^=*\s*(\d+ \w+.* in [\d.]+s\b.*?)\s*=*$", re.MULTILINE)
+_SUMMARY_COUNT_RE = re.compile(r"(\d+) (passed|failed|skipped|errors?)\b")
+# pytest-cov term report total, e.g. "TOTAL    1200    180    85%"
+_COVERAGE_RE = re.compile(r"TOTAL\s+\d+\s+\d+\s+(\d+)%")
+
+
+def _scan_existing_files(test_files):
+    """Return the subset of test_files that exist on disk.
+    
+    Each parent directory is read once with os.scandir instead of issuing a
+    stat() call per listed file.
+    """
+    existing = set()
+    for directory in {os.path.dirname(test_file) for test_file in test_files}:
+        try:
+            with os.scandir(directory or ".") as entries:
+                existing.update(
+                    os.path.join(directory, entry.name)
+                    for entry in entries
+                    if entry.is_file()
+                )
+        except FileNotFoundError:
+            continue
+    return existing
+
 
 class TestRunner:
     """Comprehensive test runner for Phase User functionality."""
     
-    def __init__(self, verbose=False, coverage=True, markers=None, parallel=False):
+    def __init__(self, verbose=False, coverage=False, markers=None, parallel=False,
+                 last_failed=False, failed_first=False, testmon=False):
         self.verbose = verbose
         self.coverage = coverage
         self.markers = markers
         self.parallel = parallel
+        self.last_failed = last_failed
+        self.failed_first = failed_first
+        self.testmon = testmon
         self.results = {}
         self.start_time = None
         self.end_time = None
@@ -68,6 +99,8 @@ class TestRunner:
         print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"Coverage: {'Enabled' if self.coverage else 'Disabled'}")
         print(f"Parallel: {'Enabled' if self.parallel else 'Disabled'}")
+        if self.last_failed or self.failed_first or self.testmon:
+            print(f"Selection: {' '.join(self._selection_args())}")
         if self.markers:
             print(f"Markers: {self.markers}")
         print("="*70 + "\n")
@@ -94,22 +127,25 @@ class TestRunner:
             cmd.extend(["-m", self.markers])
         
         if self.parallel:
-            cmd.extend(["-n", "auto"])
+            # loadscope keeps a module's tests on one worker so module-scoped
+            # fixtures are built once per worker rather than once per test
+            cmd.extend(["-n", "auto", "--dist=loadscope"])
+        
+        cmd.extend(self._selection_args())
         
         # Add all test files
         all_test_files = []
+        existing = _scan_existing_files(PHASE_USER_TEST_FILES + EXISTING_TEST_FILES)
         
         # Add new comprehensive test files
         for test_file in PHASE_USER_TEST_FILES:
-            if Path(test_file).exists():
+            if test_file in existing:
                 all_test_files.append(test_file)
             else:
                 print(f"Warning: Test file not found: {test_file}")
         
         # Add existing test files
-        for test_file in EXISTING_TEST_FILES:
-            if Path(test_file).exists():
-                all_test_files.append(test_file)
+        all_test_files.extend(f for f in EXISTING_TEST_FILES if f in existing)
         
         if not all_test_files:
             print("Error: No test files found!")
@@ -117,6 +153,18 @@ class TestRunner:
         
         cmd.extend(all_test_files)
         
+        # Collect first so import/syntax errors fail in seconds rather than
+        # after the full (possibly parallel, instrumented) run has started
+        collect = subprocess.run(
+            ["pytest", "--collect-only", "-q", "-p", "no:cacheprovider"] + all_test_files,
+            capture_output=True,
+            text=True,
+        )
+        if collect.returncode != 0:
+            print("Error: Test collection failed, aborting run\n")
+            print(collect.stdout + collect.stderr)
+            return False
+        
         # Run tests
         print(f"Running {len(all_test_files)} test files...\n")
         
@@ -156,6 +204,7 @@ class TestRunner:
         cmd = ["pytest", "-v"]
         if self.coverage:
             cmd.extend(["--cov=core", "--cov=src", "--cov-report=term"])
+        cmd.extend(self._selection_args())
         
         # Find existing test files
         existing_files = []
@@ -175,6 +224,22 @@ class TestRunner:
         result = subprocess.run(cmd)
         return result.returncode == 0
     
+    def _selection_args(self):
+        """Build pytest arguments that reuse .pytest_cache between runs.
+        
+        --last-failed/--failed-first read the failure set pytest records in
+        .pytest_cache, and --testmon limits the run to tests affected by
+        changed source (requires pytest-testmon).
+        """
+        args = []
+        if self.last_failed:
+            args.append("--last-failed")
+        if self.failed_first:
+            args.append("--failed-first")
+        if self.testmon:
+            args.append("--testmon")
+        return args
+    
     def run_performance_tests(self):
         """Run performance benchmarks for Phase User functionality."""
         print("\n" + "="*70)
@@ -188,9 +253,18 @@ class TestRunner:
             "Profile Merge": "tests.benchmark_profile_merge",
         }
         
-        for name, module in benchmarks.items():
+        benchmark_files = {
+            name: module.replace(".", "/") + ".py" for name, module in benchmarks.items()
+        }
+        existing = _scan_existing_files(list(benchmark_files.values()))
+        
+        for name, path in benchmark_files.items():
+            if path not in existing:
+                print(f"✗ {name}: {path} not found")
+                continue
+            
             print(f"Running {name} benchmark...")
-            cmd = ["pytest", "-v", f"tests/benchmarks/{module}.py::test_performance"]
+            cmd = ["pytest", "-v", f"{path}::test_performance"]
             
             start = time.time()
             result = subprocess.run(cmd, capture_output=True, text=True)
@@ -205,24 +279,22 @@ class TestRunner:
         """Process test results."""
         output = result.stdout + result.stderr
         
-        # Extract test statistics
-        import re
+        # Find test summary (the last matching line is pytest's final tally)
+        summary_lines = _SUMMARY_LINE_RE.findall(output)
         
-        # Find test summary
-        summary_match = re.search(
-            r"(\d+) passed|(\d+) failed|(\d+) skipped|(\d+) error",
-            output
-        )
-        
-        if summary_match:
-            self.results["passed"] = int(summary_match.group(1) or 0)
-            self.results["failed"] = int(summary_match.group(2) or 0)
-            self.results["skipped"] = int(summary_match.group(3) or 0)
-            self.results["errors"] = int(summary_match.group(4) or 0)
+        if summary_lines:
+            counts = {
+                "error" if kind.startswith("error") else kind: int(count)
+                for count, kind in _SUMMARY_COUNT_RE.findall(summary_lines[-1])
+            }
+            self.results["passed"] = counts.get("passed", 0)
+            self.results["failed"] = counts.get("failed", 0)
+            self.results["skipped"] = counts.get("skipped", 0)
+            self.results["errors"] = counts.get("error", 0)
         
         # Extract coverage
         if self.coverage:
-            coverage_match = re.search(r"TOTAL\s+\d+\s+\d+\s+(\d+)%", output)
+            coverage_match = _COVERAGE_RE.search(output)
             if coverage_match:
                 self.results["coverage"] = int(coverage_match.group(1))
         
@@ -295,9 +367,9 @@ def main():
     )
     
     parser.add_argument(
-        "--no-coverage",
+        "--coverage",
         action="store_true",
-        help="Disable coverage reporting"
+        help="Enable coverage reporting (off by default; CI passes this)"
     )
     
     parser.add_argument(
@@ -316,6 +388,26 @@ def main():
         help="Run tests in parallel"
     )
     
+    parser.add_argument(
+        "--lf", "--last-failed",
+        dest="last_failed",
+        action="store_true",
+        help="Only re-run tests that failed on the previous run"
+    )
+    
+    parser.add_argument(
+        "--ff", "--failed-first",
+        dest="failed_first",
+        action="store_true",
+        help="Run previously failed tests first, then the rest"
+    )
+    
+    parser.add_argument(
+        "--testmon",
+        action="store_true",
+        help="Only run tests affected by source changes (requires pytest-testmon)"
+    )
+    
     parser.add_argument(
         "--performance",
         action="store_true",
@@ -342,9 +434,12 @@ def main():
     # Initialize runner
     runner = TestRunner(
         verbose=args.verbose,
-        coverage=not args.no_coverage,
+        coverage=args.coverage,
         markers=args.markers,
-        parallel=args.parallel
+        parallel=args.parallel,
+        last_failed=args.last_failed,
+        failed_first=args.failed_first,
+        testmon=args.testmon
     )
     
     # Run tests
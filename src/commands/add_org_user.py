@@ -1,9 +1,10 @@
 """Add user to organization command implementation."""
 
 import sys
-from typing import List, Optional, Set
+from typing import Dict, List, Optional, Tuple
 
 import click
+from sqlalchemy import and_, func
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
@@ -35,60 +36,73 @@ def validate_organization_exists(session: Session, organization_id: int) -> Orga
     return organization
 
 
-def validate_user_exists(session: Session, user_id: int) -> Optional[User]:
-    """Validate that user exists and return it.
+def resolve_organization_and_role(
+    session: Session,
+    organization_id: int,
+    role_name: Optional[str] = None
+) -> Tuple[Organization, Optional[Role]]:
+    """Validate the organization and resolve an optional role in one query.
     
     Args:
         session: Database session
-        user_id: User ID to validate
+        organization_id: Organization ID to validate
+        role_name: Role name to resolve within the organization (case-insensitive)
         
     Returns:
-        User: The user object, or None if not found
-    """
-    user = session.query(User).filter(
-        User.id == user_id,
-        User.deleted_at.is_(None)
-    ).first()
-    
-    return user
-
-
-def validate_role_exists(session: Session, role_name: str, organization_id: int) -> Optional[Role]:
-    """Validate that role exists within the organization (case-insensitive).
-    
-    Args:
-        session: Database session
-        role_name: Role name to validate
-        organization_id: Organization ID where role should exist
+        Tuple[Organization, Optional[Role]]: The organization and the matching
+        role, or None if no role name was given or no such role exists
         
-    Returns:
-        Role: The role object, or None if not found
+    Raises:
+        click.ClickException: If organization doesn't exist
     """
-    role = session.query(Role).filter(
-        Role.name.ilike(role_name.strip()),
-        Role.organization_id == organization_id
+    if not role_name or not role_name.strip():
+        return validate_organization_exists(session, organization_id), None
+    
+    row = session.query(Organization, Role).outerjoin(
+        Role,
+        and_(
+            Role.organization_id == Organization.id,
+            func.lower(Role.name) == role_name.strip().lower()
+        )
+    ).filter(
+        Organization.id == organization_id,
+        Organization.deleted_at.is_(None)
     ).first()
     
-    return role
+    if not row:
+        raise click.ClickException(f"Organization with ID {organization_id} not found")
+    
+    return row[0], row[1]
 
 
-def check_user_membership(session: Session, user_id: int, organization_id: int) -> bool:
-    """Check if user is already a member of the organization.
+def fetch_user_membership_status(
+    session: Session,
+    user_ids: List[int],
+    organization_id: int
+) -> Dict[int, bool]:
+    """Look up which users exist and whether each already belongs to the organization.
     
     Args:
         session: Database session
-        user_id: User ID to check
-        organization_id: Organization ID to check
+        user_ids: User IDs to look up
+        organization_id: Organization ID to check membership in
         
     Returns:
-        bool: True if user is already a member
+        Dict[int, bool]: Maps each existing (non-deleted) user ID to True if the
+        user is already a member of the organization
     """
-    membership = session.query(OrganizationMembership).filter(
-        OrganizationMembership.user_id == user_id,
-        OrganizationMembership.organization_id == organization_id
-    ).first()
+    rows = session.query(User.id, OrganizationMembership.id).outerjoin(
+        OrganizationMembership,
+        and_(
+            OrganizationMembership.user_id == User.id,
+            OrganizationMembership.organization_id == organization_id
+        )
+    ).filter(
+        User.id.in_(user_ids),
+        User.deleted_at.is_(None)
+    ).all()
     
-    return membership is not None
+    return {user_id: membership_id is not None for user_id, membership_id in rows}
 
 
 def deduplicate_user_ids(user_ids: List[int]) -> List[int]:
@@ -100,15 +114,7 @@ def deduplicate_user_ids(user_ids: List[int]) -> List[int]:
     Returns:
         List[int]: Deduplicated list of user IDs
     """
-    seen: Set[int] = set()
-    result = []
-    
-    for user_id in user_ids:
-        if user_id not in seen:
-            seen.add(user_id)
-            result.append(user_id)
-    
-    return result
+    return list(dict.fromkeys(user_ids))
 
 
 def add_users_to_organization(
@@ -133,124 +139,102 @@ def add_users_to_organization(
         click.echo("Error: No users provided", err=True)
         sys.exit(5)
     
-    # Get database session
-    session = db_manager.get_session()
-    
     try:
-        # Validate organization exists
-        organization = validate_organization_exists(session, organization_id)
-        
-        # Validate role exists if provided
-        role = None
-        if role_name and role_name.strip():
-            role = validate_role_exists(session, role_name, organization_id)
-            if not role:
+        with db_manager.session_scope() as session:
+            # Validate organization exists and resolve the role (if provided) together
+            organization, role = resolve_organization_and_role(session, organization_id, role_name)
+            if role_name and role_name.strip() and not role:
                 click.echo(f"Error: Role '{role_name}' not found in organization {organization_id}", err=True)
                 sys.exit(4)
-        
-        # Process each user
-        successful_users = []
-        skipped_users = []
-        error_users = []
-        
-        for user_id in user_ids:
-            # Check if user exists
-            user = validate_user_exists(session, user_id)
-            if not user:
-                error_users.append(f"User {user_id}: User not found")
-                continue
             
-            # Check if user is already a member
-            if check_user_membership(session, user_id, organization_id):
-                skipped_users.append(f"User {user_id}: Already a member of organization {organization_id}")
-                continue
+            # Look up user existence and current membership for all users at once
+            membership_status = fetch_user_membership_status(session, user_ids, organization_id)
+            
+            # Process each user
+            successful_users = []
+            skipped_users = []
+            error_users = []
+            new_memberships = []
             
-            # Create membership
-            try:
-                membership = OrganizationMembership(
-                    user_id=user_id,
-                    organization_id=organization_id,
-                    role_id=role.id if role else None
-                )
-                session.add(membership)
+            for user_id in user_ids:
+                # Check if user exists
+                if user_id not in membership_status:
+                    error_users.append(f"User {user_id}: User not found")
+                    continue
                 
-                # Add to successful list for output
-                role_text = f" (role: {role.name})" if role else ""
-                successful_users.append(f"User {user_id}{role_text}")
+                # Check if user is already a member
+                if membership_status[user_id]:
+                    skipped_users.append(f"User {user_id}: Already a member of organization {organization_id}")
+                    continue
                 
-            except Exception as e:
-                error_users.append(f"User {user_id}: {str(e)}")
-                continue
-        
-        # Commit all successful operations
-        if successful_users:
-            try:
-                session.commit()
-            except IntegrityError as e:
-                session.rollback()
-                click.echo(f"Error: Database constraint violation: {str(e)}", err=True)
+                # Queue membership for a single bulk insert
+                new_memberships.append({
+                    "user_id": user_id,
+                    "organization_id": organization_id,
+                    "role_id": role.id if role else None
+                })
+                
+                # Add to successful list for output as (user_id, role_name)
+                successful_users.append((user_id, role.name if role else None))
+            
+            # Insert all new memberships in one statement and commit
+            if new_memberships:
+                try:
+                    session.bulk_insert_mappings(OrganizationMembership, new_memberships)
+                    session.commit()
+                except IntegrityError as e:
+                    session.rollback()
+                    click.echo(f"Error: Database constraint violation: {str(e)}", err=True)
+                    sys.exit(1)
+            
+            # Handle output based on results
+            if not successful_users and not skipped_users:
+                # All users failed
+                click.echo("Error: No users could be added", err=True)
+                for error_msg in error_users:
+                    click.echo(f"- {error_msg}", err=True)
                 sys.exit(1)
-        
-        # Handle output based on results
-        if not successful_users and not skipped_users:
-            # All users failed
-            click.echo("Error: No users could be added", err=True)
-            for error_msg in error_users:
-                click.echo(f"- {error_msg}", err=True)
-            sys.exit(1)
-        
-        # Display success results
-        if successful_users:
-            if len(successful_users) == 1:
-                # Single user success
-                user_info = successful_users[0]
-                if role:
-                    # Parse user info to extract user ID and role
-                    if " (role: " in user_info:
-                        user_part = user_info.split(" (role: ")[0]
-                        role_part = user_info.split(" (role: ")[1].rstrip(")")
-                        click.echo(f"{user_part} successfully added to organization {organization_id} with role '{role_part}'")
+            
+            # Display success results
+            if successful_users:
+                if len(successful_users) == 1:
+                    # Single user success
+                    user_id, added_role_name = successful_users[0]
+                    if added_role_name:
+                        click.echo(f"User {user_id} successfully added to organization {organization_id} with role '{added_role_name}'")
                     else:
-                        click.echo(f"{user_info} successfully added to organization {organization_id}")
+                        click.echo(f"User {user_id} successfully added to organization {organization_id}")
                 else:
-                    click.echo(f"{user_info} successfully added to organization {organization_id}")
-            else:
-                # Multiple users success
-                click.echo(f"Successfully added the following users to organization {organization_id}:")
-                for user_info in successful_users:
-                    click.echo(f"- {user_info}")
-        
-        # Display skipped results
-        if skipped_users or error_users:
-            if successful_users:
-                click.echo()  # Add blank line after success messages
-            click.echo("Skipped the following users:")
-            for skip_msg in skipped_users:
-                click.echo(f"- {skip_msg}")
-            for error_msg in error_users:
-                click.echo(f"- {error_msg}")
-        
-        # Exit with appropriate code for partial success scenarios
-        if successful_users and (skipped_users or error_users):
-            # Partial success - some users added, some skipped
-            pass  # Exit code 0 for partial success
-        elif not successful_users and skipped_users and not error_users:
-            # All users already members
-            sys.exit(3)
-        
+                    # Multiple users success
+                    click.echo(f"Successfully added the following users to organization {organization_id}:")
+                    for user_id, added_role_name in successful_users:
+                        role_text = f" (role: {added_role_name})" if added_role_name else ""
+                        click.echo(f"- User {user_id}{role_text}")
+            
+            # Display skipped results
+            if skipped_users or error_users:
+                if successful_users:
+                    click.echo()  # Add blank line after success messages
+                click.echo("Skipped the following users:")
+                for skip_msg in skipped_users:
+                    click.echo(f"- {skip_msg}")
+                for error_msg in error_users:
+                    click.echo(f"- {error_msg}")
+            
+            # Exit with appropriate code for partial success scenarios
+            if successful_users and (skipped_users or error_users):
+                # Partial success - some users added, some skipped
+                pass  # Exit code 0 for partial success
+            elif not successful_users and skipped_users and not error_users:
+                # All users already members
+                sys.exit(3)
+            
     except click.ClickException:
         # Re-raise ClickExceptions to maintain error codes
         raise
     except Exception as e:
-        session.rollback()
         click.echo(f"Error: Database error occurred: {str(e)}", err=True)
         sys.exit(1)
-    finally:
-        try:
-            session.close()
-        except Exception:
-            # Suppress session close errors
-            pass
 
 
 @click.command()
@@ -3,7 +3,7 @@
 import sys
 from typing import Optional
 
-from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.exc import IntegrityError
 
 from core.models import User
 from storage.database import db_manager
@@ -43,56 +43,50 @@ def create_user(
     if not last or not last.strip():
         raise ValueError("Last name cannot be empty")
     
-    # Clean string inputs
+    # Clean string inputs once so duplicate checks and the insert use identical values
     first = first.strip()
     last = last.strip()
+    address = address.strip() if address else None
+    usbc_id = usbc_id.strip() if usbc_id else None
+    tnba_id = tnba_id.strip() if tnba_id else None
+    phone = phone.strip() if phone else None
+    email = email.strip() if email else None
     
     # Create user object
     user = User(
         first_name=first,
         last_name=last,
-        address=address.strip() if address else None,
-        usbc_id=usbc_id.strip() if usbc_id else None,
-        tnba_id=tnba_id.strip() if tnba_id else None,
-        phone=phone.strip() if phone else None,
-        email=email.strip() if email else None
+        address=address,
+        usbc_id=usbc_id,
+        tnba_id=tnba_id,
+        phone=phone,
+        email=email
     )
     
     # Save to database
-    session = db_manager.get_session()
-    try:
+    with db_manager.session_scope() as session:
         # Check for duplicate email if provided
         if email:
-            existing_user = session.query(User).filter_by(email=email.strip()).first()
+            existing_user = session.query(User).filter_by(email=email).first()
             if existing_user:
                 raise IntegrityError("Email already exists", None, None)
         
         # Check for duplicate USBC ID if provided
         if usbc_id:
-            existing_user = session.query(User).filter_by(usbc_id=usbc_id.strip()).first()
+            existing_user = session.query(User).filter_by(usbc_id=usbc_id).first()
             if existing_user:
                 raise IntegrityError("USBC ID already exists", None, None)
         
         # Check for duplicate TNBA ID if provided
         if tnba_id:
-            existing_user = session.query(User).filter_by(tnba_id=tnba_id.strip()).first()
+            existing_user = session.query(User).filter_by(tnba_id=tnba_id).first()
             if existing_user:
                 raise IntegrityError("TNBA ID already exists", None, None)
         
         session.add(user)
         session.commit()
-        session.refresh(user)
         
         return user
-        
-    except IntegrityError:
-        session.rollback()
-        raise
-    except SQLAlchemyError:
-        session.rollback()
-        raise
-    finally:
-        session.close()
 
 
 def validate_create_args(first: str, last: str) -> None:
@@ -1,14 +1,16 @@
 """Create organization permission command implementation."""
 
 import sys
-from typing import Optional
+from typing import Optional, Tuple
 
 import click
+from sqlalchemy import exists, func, lambda_stmt, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from core.models import Organization, Permission
-from storage.database import db_manager
+from core.validation import normalize_text
+from storage.database import db_manager, is_foreign_key_violation, is_unique_violation
 
 
 def validate_permission_name(name: str) -> str:
@@ -23,12 +25,9 @@ def validate_permission_name(name: str) -> str:
     Raises:
         click.ClickException: If name is invalid
     """
-    if not name or not name.strip():
-        raise click.ClickException("Permission name cannot be empty")
-    
-    normalized_name = name.strip()
-    if len(normalized_name) > 64:
-        raise click.ClickException("Permission name cannot exceed 64 characters")
+    normalized_name, error = normalize_text(name, 64)
+    if error:
+        raise click.ClickException(f"Permission name {error}")
     
     return normalized_name
 
@@ -49,48 +48,40 @@ def validate_permission_description(description: Optional[str]) -> Optional[str]
         return None
     
     # Empty string is allowed
-    if description == "":
-        return ""
-    
-    normalized_description = description.strip()
-    if len(normalized_description) > 255:
-        raise click.ClickException("Permission description cannot exceed 255 characters")
+    normalized_description, error = normalize_text(description, 255, allow_empty=True)
+    if error:
+        raise click.ClickException(f"Permission description {error}")
     
     return normalized_description
 
 
-def check_organization_exists(session: Session, organization_id: int) -> bool:
-    """Check if organization with given ID exists.
+def check_organization_and_permission_exist(
+    session: Session,
+    organization_id: int,
+    name: str
+) -> Tuple[bool, bool]:
+    """Check organization existence and permission name availability in one query.
     
     Args:
         session: Database session
         organization_id: Organization ID to check
+        name: Permission name to check within the organization (case-insensitive)
         
     Returns:
-        bool: True if organization exists
+        Tuple[bool, bool]: Whether the organization exists, and whether a
+        permission with this name already exists in it
     """
-    existing = session.query(Organization).filter(
-        Organization.id == organization_id
-    ).first()
-    return existing is not None
-
-
-def check_permission_exists_in_org(session: Session, name: str, organization_id: int) -> bool:
-    """Check if permission with given name already exists in organization (case-insensitive).
-    
-    Args:
-        session: Database session
-        name: Permission name to check
-        organization_id: Organization ID to check within
-        
-    Returns:
-        bool: True if permission exists in the organization
-    """
-    existing = session.query(Permission).filter(
-        Permission.name.ilike(name),
-        Permission.organization_id == organization_id
-    ).first()
-    return existing is not None
+    lowered_name = name.lower()
+    # lambda_stmt caches the constructed statement; only the bound values change
+    stmt = lambda_stmt(lambda: select(
+        exists().where(Organization.id == organization_id),
+        exists().where(
+            Permission.organization_id == organization_id,
+            func.lower(Permission.name) == lowered_name
+        )
+    ))
+    organization_exists, permission_exists = session.execute(stmt).one()
+    return bool(organization_exists), bool(permission_exists)
 
 
 def create_org_permission(
@@ -115,50 +106,54 @@ def create_org_permission(
     normalized_name = validate_permission_name(name)
     normalized_description = validate_permission_description(description)
     
-    # Get database session
-    session = db_manager.get_session()
-    
     try:
-        # Check if organization exists
-        if not check_organization_exists(session, organization_id):
+        with db_manager.session_scope() as session:
+            # Check the organization and the name in one query. Databases created
+            # before the case-insensitive unique index was added only enforce
+            # case-sensitive uniqueness, so this check is what rejects case
+            # variants there; the constraints below still catch races
+            organization_exists, permission_exists = check_organization_and_permission_exist(
+                session, organization_id, normalized_name
+            )
+            if not organization_exists:
+                raise click.ClickException("Organization not found")
+            
+            if permission_exists:
+                raise click.ClickException("Permission with this name already exists in the organization")
+            
+            permission = Permission(
+                name=normalized_name,
+                description=normalized_description,
+                organization_id=organization_id
+            )
+            
+            # Add to session and commit
+            session.add(permission)
+            session.commit()
+            
+            return permission
+            
+    except IntegrityError as e:
+        # Classify the failed constraint from the driver's error code
+        # (SQLSTATE 23503 / 23505 or the SQLite equivalents) without re-querying
+        if is_foreign_key_violation(e):
             raise click.ClickException("Organization not found")
         
-        # Check if permission already exists in organization (case-insensitive)
-        if check_permission_exists_in_org(session, normalized_name, organization_id):
+        if is_unique_violation(e):
             raise click.ClickException("Permission with this name already exists in the organization")
         
-        # Create new permission
-        permission = Permission(
-            name=normalized_name,
-            description=normalized_description,
-            organization_id=organization_id
-        )
-        
-        # Add to session and commit
-        session.add(permission)
-        session.commit()
-        
-        # Refresh to ensure ID is loaded
-        session.refresh(permission)
-        
-        return permission
+        # Unrecognized driver error: fall back to checking the database
+        with db_manager.session_scope() as session:
+            organization_exists, permission_exists = check_organization_and_permission_exist(
+                session, organization_id, normalized_name
+            )
+        if not organization_exists:
+            raise click.ClickException("Organization not found")
         
-    except IntegrityError as e:
-        session.rollback()
-        error_str = str(e).lower()
-        if "unique" in error_str or "duplicate" in error_str:
+        if permission_exists:
             raise click.ClickException("Permission with this name already exists in the organization")
         else:
             raise click.ClickException(f"Database error: {str(e)}")
-    except Exception as e:
-        session.rollback()
-        raise
-    finally:
-        try:
-            session.close()
-        except Exception:
-            # Suppress session close errors to not interfere with main operation
-            pass
 
 
 @click.command()
@@ -1,14 +1,16 @@
 """Create organization role command implementation."""
 
 import sys
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
 import click
+from sqlalchemy import and_, exists, func, insert, lambda_stmt, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from core.models import Organization, Role, Permission, RolePermission
-from storage.database import db_manager
+from core.validation import normalize_text
+from storage.database import db_manager, is_unique_violation
 
 
 def validate_role_name(name: str) -> str:
@@ -23,12 +25,9 @@ def validate_role_name(name: str) -> str:
     Raises:
         click.ClickException: If name is invalid
     """
-    if not name or not name.strip():
-        raise click.ClickException("Role name cannot be empty")
-    
-    normalized_name = name.strip()
-    if len(normalized_name) > 64:
-        raise click.ClickException("Role name cannot exceed 64 characters")
+    normalized_name, error = normalize_text(name, 64)
+    if error:
+        raise click.ClickException(f"Role name {error}")
     
     return normalized_name
 
@@ -36,54 +35,58 @@ def validate_role_name(name: str) -> str:
 def parse_permissions_list(permissions_str: Optional[str]) -> List[str]:
     """Parse comma-separated permissions list.
     
+    Empty entries are dropped and repeated names are removed case-insensitively,
+    keeping the first spelling seen.
+    
     Args:
         permissions_str: Comma-separated permissions string
         
     Returns:
-        List[str]: List of normalized permission names
+        List[str]: List of normalized, unique permission names
     """
     if not permissions_str or not permissions_str.strip():
         return []
     
-    # Split, strip whitespace, and filter empty entries
-    permissions = [p.strip() for p in permissions_str.split(',')]
-    permissions = [p for p in permissions if p]  # Remove empty strings
+    # Split, strip whitespace, and skip empty or duplicate entries in one pass
+    seen = set()
+    permissions = []
+    for permission in permissions_str.split(','):
+        permission = permission.strip()
+        key = permission.lower()
+        if permission and key not in seen:
+            seen.add(key)
+            permissions.append(permission)
     
     return permissions
 
 
-def check_organization_exists(session: Session, organization_id: int) -> bool:
-    """Check if organization with given ID exists.
+def check_organization_and_role_exist(
+    session: Session,
+    organization_id: int,
+    name: str
+) -> Tuple[bool, bool]:
+    """Check organization existence and role name availability in one query.
     
     Args:
         session: Database session
         organization_id: Organization ID to check
+        name: Role name to check within the organization (case-insensitive)
         
     Returns:
-        bool: True if organization exists
-    """
-    existing = session.query(Organization).filter(
-        Organization.id == organization_id
-    ).first()
-    return existing is not None
-
-
-def check_role_exists_in_org(session: Session, name: str, organization_id: int) -> bool:
-    """Check if role with given name already exists in organization (case-insensitive).
-    
-    Args:
-        session: Database session
-        name: Role name to check
-        organization_id: Organization ID to check within
-        
-    Returns:
-        bool: True if role exists in the organization
+        Tuple[bool, bool]: Whether the organization exists, and whether a role
+        with this name already exists in it
     """
-    existing = session.query(Role).filter(
-        Role.name.ilike(name),
-        Role.organization_id == organization_id
-    ).first()
-    return existing is not None
+    lowered_name = name.lower()
+    # lambda_stmt caches the constructed statement; only the bound values change
+    stmt = lambda_stmt(lambda: select(
+        exists().where(Organization.id == organization_id),
+        exists().where(
+            Role.organization_id == organization_id,
+            func.lower(Role.name) == lowered_name
+        )
+    ))
+    organization_exists, role_exists = session.execute(stmt).one()
+    return bool(organization_exists), bool(role_exists)
 
 
 def validate_permissions_exist_in_org(
@@ -93,6 +96,9 @@ def validate_permissions_exist_in_org(
 ) -> List[Permission]:
     """Validate that all permission names exist in organization and return Permission objects.
     
+    The organization and its matching permissions are fetched together, so a
+    missing organization is reported without a separate query.
+    
     Args:
         session: Database session
         permission_names: List of permission names to validate
@@ -102,18 +108,35 @@ def validate_permissions_exist_in_org(
         List[Permission]: List of Permission objects
         
     Raises:
-        click.ClickException: If any permission doesn't exist
+        click.ClickException: If the organization or any permission doesn't exist
     """
     if not permission_names:
         return []
     
+    # Fetch the organization with all requested permissions in one query,
+    # matching names case-insensitively; lower each requested name only once
+    lowered_names = [perm_name.lower() for perm_name in permission_names]
+    rows = session.query(Organization.id, Permission).outerjoin(
+        Permission,
+        and_(
+            Permission.organization_id == Organization.id,
+            func.lower(Permission.name).in_(set(lowered_names))
+        )
+    ).filter(
+        Organization.id == organization_id
+    ).all()
+    if not rows:
+        raise click.ClickException("Organization not found")
+    
+    found = {
+        permission.name.lower(): permission
+        for _, permission in rows
+        if permission is not None
+    }
+    
     permissions = []
-    for perm_name in permission_names:
-        permission = session.query(Permission).filter(
-            Permission.name.ilike(perm_name),
-            Permission.organization_id == organization_id
-        ).first()
-        
+    for perm_name, lowered_name in zip(permission_names, lowered_names):
+        permission = found.get(lowered_name)
         if not permission:
             raise click.ClickException(f"Permission '{perm_name}' not found in organization")
         
@@ -144,65 +167,63 @@ def create_org_role(
     normalized_name = validate_role_name(name)
     permission_names = parse_permissions_list(permissions)
     
-    # Get database session
-    session = db_manager.get_session()
-    
     try:
-        # Check if organization exists
-        if not check_organization_exists(session, organization_id):
-            raise click.ClickException("Organization not found")
-        
-        # Check if role already exists in organization (case-insensitive)
-        if check_role_exists_in_org(session, normalized_name, organization_id):
-            raise click.ClickException("Role with this name already exists in the organization")
-        
-        # Validate all permissions exist in the organization
-        permission_objects = validate_permissions_exist_in_org(
-            session, permission_names, organization_id
-        )
-        
-        # Create new role
-        role = Role(
-            name=normalized_name,
-            organization_id=organization_id
-        )
-        
-        # Add to session and commit to get the role ID
-        session.add(role)
-        session.commit()
-        
-        # Refresh to ensure ID is loaded
-        session.refresh(role)
-        
-        # Create role-permission associations if permissions were provided
-        if permission_objects:
-            for permission in permission_objects:
-                role_permission = RolePermission(
-                    role_id=role.id,
-                    permission_id=permission.id
+        with db_manager.session_scope() as session:
+            # Older databases lack ix_role_org_lower_name, so case variants are
+            # only rejected here; the IntegrityError handler covers races
+            organization_exists, role_exists = check_organization_and_role_exist(
+                session, organization_id, normalized_name
+            )
+            if not organization_exists:
+                raise click.ClickException("Organization not found")
+            
+            if role_exists:
+                raise click.ClickException("Role with this name already exists in the organization")
+            
+            # Validate all requested permissions in one query
+            permission_objects = validate_permissions_exist_in_org(
+                session, permission_names, organization_id
+            )
+            
+            role = Role(
+                name=normalized_name,
+                organization_id=organization_id
+            )
+            
+            # Add to session and flush to get the role ID without committing
+            session.add(role)
+            session.flush()
+            
+            # Create role-permission associations in one multi-row insert; on
+            # PostgreSQL (psycopg2) SQLAlchemy's insertmanyvalues sends this as
+            # batched multi-row VALUES, the same as execute_values()
+            if permission_objects:
+                session.execute(
+                    insert(RolePermission),
+                    [
+                        {"role_id": role.id, "permission_id": permission.id}
+                        for permission in permission_objects
+                    ]
                 )
-                session.add(role_permission)
             
+            # Commit the role and its permissions together
             session.commit()
-        
-        return role
-        
+            
+            return role
+            
     except IntegrityError as e:
-        session.rollback()
-        error_str = str(e).lower()
-        if "unique" in error_str or "duplicate" in error_str:
+        # Work out which constraint failed only on this (rare) path
+        with db_manager.session_scope() as session:
+            organization_exists, role_exists = check_organization_and_role_exist(
+                session, organization_id, normalized_name
+            )
+        if not organization_exists:
+            raise click.ClickException("Organization not found")
+        
+        if role_exists or is_unique_violation(e):
             raise click.ClickException("Role with this name already exists in the organization")
         else:
             raise click.ClickException(f"Database error: {str(e)}")
-    except Exception as e:
-        session.rollback()
-        raise
-    finally:
-        try:
-            session.close()
-        except Exception:
-            # Suppress session close errors to not interfere with main operation
-            pass
 
 
 @click.command()
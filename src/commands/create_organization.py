@@ -5,10 +5,10 @@ from typing import Optional
 
 import click
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
 
 from core.models import Organization
-from storage.database import db_manager
+from core.validation import normalize_text
+from storage.database import db_manager, is_unique_violation
 
 
 def validate_organization_name(name: str) -> str:
@@ -23,30 +23,24 @@ def validate_organization_name(name: str) -> str:
     Raises:
         click.ClickException: If name is invalid
     """
-    if not name or not name.strip():
-        raise click.ClickException("Organization name cannot be empty")
-    
-    normalized_name = name.strip()
-    if len(normalized_name) > 255:
-        raise click.ClickException("Organization name cannot exceed 255 characters")
+    normalized_name, error = normalize_text(name, 255)
+    if error:
+        raise click.ClickException(f"Organization name {error}")
     
     return normalized_name
 
 
-def check_organization_exists(session: Session, name: str) -> bool:
-    """Check if organization with given name already exists (case-insensitive).
+def _clean_optional(value: Optional[str]) -> Optional[str]:
+    """Strip an optional field once, mapping blank values to None.
     
     Args:
-        session: Database session
-        name: Organization name to check
+        value: Field value to clean
         
     Returns:
-        bool: True if organization exists
+        Optional[str]: Stripped value, or None if empty
     """
-    existing = session.query(Organization).filter(
-        Organization.name.ilike(name)
-    ).first()
-    return existing is not None
+    value = value.strip() if value else ""
+    return value or None
 
 
 def create_organization(
@@ -74,46 +68,32 @@ def create_organization(
     # Validate and normalize name
     normalized_name = validate_organization_name(name)
     
-    # Get database session
-    session = db_manager.get_session()
-    
     try:
-        # Note: Database unique constraint will catch duplicates
-        
-        # Create new organization
-        organization = Organization(
-            name=normalized_name,
-            address=address.strip() if address and address.strip() else None,
-            phone=phone.strip() if phone and phone.strip() else None,
-            email=email.strip() if email and email.strip() else None,
-            website=website.strip() if website and website.strip() else None
-        )
-        
-        # Add to session and commit
-        session.add(organization)
-        session.commit()
-        
-        # Refresh to ensure ID is loaded
-        session.refresh(organization)
-        
-        return organization
-        
+        with db_manager.session_scope() as session:
+            # Note: Database unique constraint will catch duplicates
+            
+            # Create new organization
+            organization = Organization(
+                name=normalized_name,
+                address=_clean_optional(address),
+                phone=_clean_optional(phone),
+                email=_clean_optional(email),
+                website=_clean_optional(website)
+            )
+            
+            # Add to session and commit
+            session.add(organization)
+            session.commit()
+            
+            return organization
+            
     except IntegrityError as e:
-        session.rollback()
-        error_str = str(e).lower()
-        if "unique" in error_str or "duplicate" in error_str:
+        if is_unique_violation(e):
             raise click.ClickException("Organization with this name already exists")
         else:
             raise click.ClickException(f"Database error: {str(e)}")
     except Exception as e:
-        session.rollback()
         raise click.ClickException(f"Database error: {str(e)}")
-    finally:
-        try:
-            session.close()
-        except Exception:
-            # Suppress session close errors to not interfere with main operation
-            pass
 
 
 @click.command()
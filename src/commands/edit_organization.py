@@ -1,9 +1,10 @@
 """Edit organization command implementation for the 4th Arrow Tournament Control application."""
 
 import sys
-from typing import Optional
+from typing import Dict, Optional
 
 import click
+from sqlalchemy import func, or_, update
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -36,60 +37,57 @@ def check_name_conflict(session: Session, new_name: str, organization_id: int) -
     Returns:
         True if name conflicts with existing organization, False otherwise
     """
-    existing_org = (
+    conflict = (
         session.query(Organization)
-        .filter(Organization.name.ilike(new_name))
+        .filter(func.lower(Organization.name) == new_name.lower())
         .filter(Organization.id != organization_id)
         .filter(Organization.deleted_at.is_(None))
-        .first()
+        .exists()
     )
-    return existing_org is not None
+    return session.query(conflict).scalar()
 
 
-def update_organization_fields(
-    organization: Organization,
+def organization_is_active(session: Session, organization_id: int) -> bool:
+    """Check if an organization exists and has not been soft-deleted.
+    
+    Args:
+        session: Database session
+        organization_id: ID of organization to check
+        
+    Returns:
+        True if the organization exists and is not deleted, False otherwise
+    """
+    organization = session.get(Organization, organization_id)
+    return organization is not None and organization.deleted_at is None
+
+
+def collect_organization_updates(
     name: Optional[str] = None,
     address: Optional[str] = None,
     phone: Optional[str] = None,
     email: Optional[str] = None,
     website: Optional[str] = None
-) -> bool:
-    """Update organization fields with provided values.
+) -> Dict[str, str]:
+    """Collect the organization fields that were provided.
     
     Args:
-        organization: Organization object to update
         name: New name (optional)
         address: New address (optional)
         phone: New phone (optional)
-        email: New email (optional)  
+        email: New email (optional)
         website: New website (optional)
         
     Returns:
-        True if any field was updated, False if no changes made
+        Mapping of column name to new value for every field that is not None
     """
-    updated = False
-    
-    if name is not None:
-        organization.name = name
-        updated = True
-        
-    if address is not None:
-        organization.address = address
-        updated = True
-        
-    if phone is not None:
-        organization.phone = phone
-        updated = True
-        
-    if email is not None:
-        organization.email = email
-        updated = True
-        
-    if website is not None:
-        organization.website = website
-        updated = True
-        
-    return updated
+    fields = {
+        'name': name,
+        'address': address,
+        'phone': phone,
+        'email': email,
+        'website': website
+    }
+    return {field: value for field, value in fields.items() if value is not None}
 
 
 @click.command()
@@ -131,41 +129,49 @@ def edit_organization_command(
         ]:
             validate_empty_field(field_name, value)
             
-        session = db_manager.get_session()
-        try:
-            # Find organization by ID
-            organization = (
-                session.query(Organization)
-                .filter(Organization.id == organization_id)
-                .filter(Organization.deleted_at.is_(None))
-                .first()
-            )
+        updates = collect_organization_updates(
+            name=name,
+            address=address,
+            phone=phone,
+            email=email,
+            website=website
+        )
             
-            if not organization:
-                click.echo("Organization not found.", err=True)
-                sys.exit(2)
+        with db_manager.session_scope() as session:
+            # No-op edit: only confirm the organization exists
+            if not updates:
+                if not organization_is_active(session, organization_id):
+                    click.echo("Organization not found.", err=True)
+                    sys.exit(2)
+                return
             
             # Check name conflict if name is being updated
             if name is not None and check_name_conflict(session, name, organization_id):
+                if not organization_is_active(session, organization_id):
+                    click.echo("Organization not found.", err=True)
+                    sys.exit(2)
                 click.echo("Organization name already exists.", err=True)
                 sys.exit(3)
             
-            # Update fields
-            updated = update_organization_fields(
-                organization=organization,
-                name=name,
-                address=address,
-                phone=phone,
-                email=email,
-                website=website
+            # Apply all changes in one UPDATE, skipped when every value already
+            # matches the row; no matched row means not found or nothing changed
+            result = session.execute(
+                update(Organization)
+                .where(Organization.id == organization_id)
+                .where(Organization.deleted_at.is_(None))
+                .where(or_(*(
+                    getattr(Organization, field).is_distinct_from(value)
+                    for field, value in updates.items()
+                )))
+                .values(**updates)
             )
+            if result.rowcount == 0:
+                if not organization_is_active(session, organization_id):
+                    click.echo("Organization not found.", err=True)
+                    sys.exit(2)
+                return
             
-            # Commit changes if any were made
-            if updated:
-                session.commit()
-                
-        finally:
-            session.close()
+            session.commit()
             
     except ValueError as e:
         if "Empty value not allowed" in str(e):
@@ -2,24 +2,50 @@
 
 import csv
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Tuple, Union
 
 import click
 from rich.console import Console
 from rich.table import Table
-from sqlalchemy.orm import Query
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import Engine, Select, bindparam, select
+from sqlalchemy.orm import Session
 
-from core.models import User, ProfileRole
-from storage.database import db_manager
-from utils.csv_writer import export_users_to_csv, validate_csv_path
+from core.models import User, ProfileRole, classify_role
+from storage.database import db_manager, is_in_memory_database
+from utils.csv_writer import USER_CSV_FIELDS, export_user_rows_to_csv, validate_csv_path
 
 
+# Columns needed to display or export a user (role is derived from email)
+USER_LIST_COLUMNS = (User.id, User.first_name, User.last_name, User.email, User.created_at)
+
+# Filter keys matched as case-insensitive substrings rather than exact values
+PARTIAL_MATCH_FILTERS = frozenset({'first', 'last', 'email', 'phone', 'address'})
+
+# Fetches the USER_LIST_COLUMNS values of a user or row in one call
+_get_user_fields = attrgetter('id', 'first_name', 'last_name', 'email', 'created_at')
+
+# Display labels for role values (e.g. "registered_user" -> "Registered User")
+ROLE_LABELS = {role.value: role.value.replace('_', ' ').title() for role in ProfileRole}
+
+# Column headers of the users table
+USER_TABLE_HEADERS = ("User ID", "Name", "Role", "Email", "Created")
+
+# Pages with more rows than this are printed as plain text rather than a Rich table
+PLAIN_TABLE_THRESHOLD = 200
+
+
+@lru_cache(maxsize=128)
 def parse_date_filter(date_str: str) -> datetime:
     """Parse YYYY-MM-DD format with timezone awareness.
     
+    Successful parses are cached (datetimes are immutable); invalid input
+    raises every time, since exceptions are never cached.
+    
     Args:
         date_str: Date string in YYYY-MM-DD format
         
@@ -36,64 +62,121 @@ def parse_date_filter(date_str: str) -> datetime:
         raise click.BadParameter(f"Invalid date format: {date_str}. Use YYYY-MM-DD")
 
 
-def build_enhanced_user_query(
-    session,
-    filters: Dict[str, str],
-    role: Optional[ProfileRole] = None,
-    created_since: Optional[datetime] = None,
-    order: str = "id"
-) -> Query:
-    """Build SQLAlchemy query with enhanced filters and ordering.
+def normalize_filters(**values: Optional[str]) -> Dict[str, str]:
+    """Strip filter values and drop the ones that are missing or blank.
     
     Args:
-        session: SQLAlchemy session object
-        filters: Dictionary of legacy filter key-value pairs
-        role: Profile role filter
-        created_since: Filter for users created after this date
+        **values: Filter values keyed by filter name (first, last, email, ...)
+        
+    Returns:
+        Dict[str, str]: Stripped, non-empty filter values
+    """
+    return {key: stripped for key, value in values.items() if value and (stripped := value.strip())}
+
+
+@lru_cache(maxsize=64)
+def build_user_statement(
+    filter_keys: FrozenSet[str],
+    has_role: bool = False,
+    has_created_since: bool = False,
+    order: str = "id",
+    columns_only: bool = False
+) -> Select:
+    """Build (and cache) the user listing statement for a combination of filters.
+    
+    Filter values are left as named bind parameters, so every call with the same
+    set of filters reuses one statement object and only the parameters change.
+    
+    Args:
+        filter_keys: Legacy filter keys in use (first, last, email, phone,
+            address, usbc_id, tnba_id)
+        has_role: Whether to filter by profile role
+        has_created_since: Whether to filter by creation date
         order: Ordering field (id, last_name, created_at)
+        columns_only: Select USER_LIST_COLUMNS instead of full User objects
         
     Returns:
-        SQLAlchemy Query object with applied filters and ordering
+        Select statement with bind parameters named after the filters
     """
-    query = session.query(User)
+    stmt = select(*USER_LIST_COLUMNS) if columns_only else select(User)
     
     # Filter out soft-deleted users
-    query = query.filter(User.deleted_at.is_(None))
+    stmt = stmt.where(User.deleted_at.is_(None))
     
     # Apply legacy partial match filters for string fields
-    if filters.get('first'):
-        query = query.filter(User.first_name.ilike(f"%{filters['first']}%"))
-    if filters.get('last'):
-        query = query.filter(User.last_name.ilike(f"%{filters['last']}%"))
-    if filters.get('email'):
-        query = query.filter(User.email.ilike(f"%{filters['email']}%"))
-    if filters.get('phone'):
-        query = query.filter(User.phone.ilike(f"%{filters['phone']}%"))
-    if filters.get('address'):
-        query = query.filter(User.address.ilike(f"%{filters['address']}%"))
+    # (served by pg_trgm GIN indexes on PostgreSQL; see core.models)
+    if 'first' in filter_keys:
+        stmt = stmt.where(User.first_name.ilike(bindparam('first')))
+    if 'last' in filter_keys:
+        stmt = stmt.where(User.last_name.ilike(bindparam('last')))
+    if 'email' in filter_keys:
+        stmt = stmt.where(User.email.ilike(bindparam('email')))
+    if 'phone' in filter_keys:
+        stmt = stmt.where(User.phone.ilike(bindparam('phone')))
+    if 'address' in filter_keys:
+        stmt = stmt.where(User.address.ilike(bindparam('address')))
     
     # Apply legacy exact match filters for ID fields
-    if filters.get('usbc_id'):
-        query = query.filter(User.usbc_id == filters['usbc_id'])
-    if filters.get('tnba_id'):
-        query = query.filter(User.tnba_id == filters['tnba_id'])
+    if 'usbc_id' in filter_keys:
+        stmt = stmt.where(User.usbc_id == bindparam('usbc_id'))
+    if 'tnba_id' in filter_keys:
+        stmt = stmt.where(User.tnba_id == bindparam('tnba_id'))
     
-    # Apply role filter - we'll filter in Python since role is computed
-    # Note: For production, this would be better with a database column or computed column
+    # Apply role filter in SQL so only matching rows are returned
+    if has_role:
+        stmt = stmt.where(User.role_expression() == bindparam('role'))
     
     # Apply date filter
-    if created_since:
-        query = query.filter(User.created_at >= created_since)
+    if has_created_since:
+        stmt = stmt.where(User.created_at >= bindparam('created_since'))
     
-    # Apply ordering
+    # Apply ordering; id breaks ties so pages fetched with separate OFFSET
+    # queries never repeat or skip rows that share a name or timestamp
     if order == "last_name":
-        query = query.order_by(User.last_name, User.first_name)
+        stmt = stmt.order_by(User.last_name, User.first_name, User.id)
     elif order == "created_at":
-        query = query.order_by(User.created_at.desc())
+        stmt = stmt.order_by(User.created_at.desc(), User.id)
     else:  # default to id
-        query = query.order_by(User.id)
+        stmt = stmt.order_by(User.id)
     
-    return query
+    return stmt
+
+
+def build_enhanced_user_query(
+    filters: Dict[str, str],
+    role: Optional[ProfileRole] = None,
+    created_since: Optional[datetime] = None,
+    order: str = "id",
+    columns_only: bool = False
+) -> Tuple[Select, Dict[str, Any]]:
+    """Build the user listing statement and its parameters.
+    
+    Args:
+        filters: Dictionary of legacy filter key-value pairs
+        role: Profile role filter
+        created_since: Filter for users created after this date
+        order: Ordering field (id, last_name, created_at)
+        columns_only: Select USER_LIST_COLUMNS instead of full User objects
+        
+    Returns:
+        Tuple[Select, Dict[str, Any]]: The cached statement and the parameter
+        values to execute it with
+    """
+    filters = {key: value for key, value in filters.items() if value}
+    stmt = build_user_statement(
+        frozenset(filters), role is not None, created_since is not None, order, columns_only
+    )
+    
+    params: Dict[str, Any] = {
+        key: f"%{value}%" if key in PARTIAL_MATCH_FILTERS else value
+        for key, value in filters.items()
+    }
+    if role is not None:
+        params['role'] = role.value
+    if created_since is not None:
+        params['created_since'] = created_since
+    
+    return stmt, params
 
 
 def list_users_enhanced(
@@ -109,7 +192,7 @@ def list_users_enhanced(
     order: str = "id",
     page_size: int = 50,
     csv_path: Optional[Path] = None
-) -> List[Dict[str, Any]]:
+) -> Union[List[Dict[str, Any]], int]:
     """List users with enhanced filtering, ordering, and export options.
     
     Args:
@@ -127,67 +210,97 @@ def list_users_enhanced(
         csv_path: If provided, export to CSV instead of displaying
         
     Returns:
-        List of dictionaries containing user data
+        List of dictionaries containing the displayed user data, or the number
+        of exported users when csv_path is given
         
     Raises:
         SQLAlchemyError: If database operation fails
     """
-    session = db_manager.get_session()
-    try:
+    with db_manager.session_scope() as session:
         # Build filters dictionary, excluding None/empty values
-        filters = {}
-        if first and first.strip():
-            filters['first'] = first.strip()
-        if last and last.strip():
-            filters['last'] = last.strip()
-        if email and email.strip():
-            filters['email'] = email.strip()
-        if phone and phone.strip():
-            filters['phone'] = phone.strip()
-        if address and address.strip():
-            filters['address'] = address.strip()
-        if usbc_id and usbc_id.strip():
-            filters['usbc_id'] = usbc_id.strip()
-        if tnba_id and tnba_id.strip():
-            filters['tnba_id'] = tnba_id.strip()
+        filters = normalize_filters(
+            first=first, last=last, email=email, phone=phone,
+            address=address, usbc_id=usbc_id, tnba_id=tnba_id
+        )
         
-        # Build and execute query
-        query = build_enhanced_user_query(session, filters, role, created_since, order)
-        all_users = query.all()
+        # Build the statement; rows are fetched below only as they are needed.
+        # Only the displayed columns are selected, so rows come back as plain
+        # tuples without building and tracking a User object per row
+        stmt, params = build_enhanced_user_query(
+            filters, role, created_since, order, columns_only=True
+        )
         
-        # Filter by role in Python (since role is computed)
-        if role:
-            filtered_users = [user for user in all_users if user.get_role() == role]
-        else:
-            filtered_users = all_users
-        
-        # Convert to dictionary format for consistent return type
-        users_data = []
-        for user in filtered_users:
-            users_data.append({
-                'id': user.id,
-                'name': f"{user.first_name} {user.last_name}",
-                'role': user.get_role().value,
-                'email': user.email or '',
-                'created_at': user.created_at.isoformat() if user.created_at else ''
-            })
-        
-        # Handle CSV export
+        # Handle CSV export, streaming rows straight from the database to the file
+        # as plain tuples, without building a dictionary per user
         if csv_path:
-            export_users_to_csv(users_data, csv_path)
-            return users_data
+            return export_user_rows_to_csv(
+                iter_users(session, stmt, params, convert=user_to_row), csv_path
+            )
         
-        # Handle pagination for table display
-        if page_size > 0 and len(users_data) > page_size:
-            return paginate_and_display(users_data, page_size)
+        # Handle pagination for table display, loading one page per query
+        if page_size > 0:
+            return paginate_and_display(session, stmt, params, page_size, order)
         else:
+            users_data = [user_to_dict(user) for user in session.execute(stmt, params).all()]
             display_users_table(users_data)
             return users_data
+
+
+def user_to_row(user: Any) -> Tuple[Any, ...]:
+    """Convert a user into a row of values in USER_CSV_FIELDS order.
+    
+    Args:
+        user: User object or row with the USER_LIST_COLUMNS attributes
         
-    except SQLAlchemyError:
-        raise
-    finally:
-        session.close()
+    Returns:
+        Tuple of id, name, role, email and created_at values
+    """
+    user_id, first_name, last_name, email, created_at = _get_user_fields(user)
+    return (
+        user_id,
+        f"{first_name} {last_name}",
+        classify_role(email).value,
+        email or '',
+        created_at.isoformat() if created_at else ''
+    )
+
+
+def user_to_dict(user: Any) -> Dict[str, Any]:
+    """Convert a user into the dictionary format used for display and export.
+    
+    Args:
+        user: User object or row with the USER_LIST_COLUMNS attributes
+        
+    Returns:
+        Dictionary containing user data
+    """
+    return dict(zip(USER_CSV_FIELDS, user_to_row(user)))
+
+
+def iter_users(
+    session: Session,
+    stmt: Select,
+    params: Dict[str, Any],
+    chunk: int = 1000,
+    convert: Callable[[Any], Any] = user_to_dict
+) -> Iterator[Any]:
+    """Stream converted users from a statement without loading them all.
+    
+    Rows are read through a server-side cursor where the driver supports one,
+    ``chunk`` rows at a time.
+    
+    Args:
+        session: Database session
+        stmt: User listing statement to stream
+        params: Bind parameter values for the statement
+        chunk: Number of rows to fetch per round trip
+        convert: Function applied to each row (user_to_dict or user_to_row)
+        
+    Returns:
+        Iterator of converted user data, one item per row
+    """
+    streaming = stmt.execution_options(stream_results=True, yield_per=chunk)
+    return map(convert, session.execute(streaming, params))
 
 
 # Backward compatibility function
@@ -217,40 +330,48 @@ def list_users(
     Raises:
         SQLAlchemyError: If database operation fails
     """
-    session = db_manager.get_session()
-    try:
+    with db_manager.session_scope() as session:
         # Build filters dictionary, excluding None/empty values
-        filters = {}
-        if first and first.strip():
-            filters['first'] = first.strip()
-        if last and last.strip():
-            filters['last'] = last.strip()
-        if email and email.strip():
-            filters['email'] = email.strip()
-        if phone and phone.strip():
-            filters['phone'] = phone.strip()
-        if address and address.strip():
-            filters['address'] = address.strip()
-        if usbc_id and usbc_id.strip():
-            filters['usbc_id'] = usbc_id.strip()
-        if tnba_id and tnba_id.strip():
-            filters['tnba_id'] = tnba_id.strip()
+        filters = normalize_filters(
+            first=first, last=last, email=email, phone=phone,
+            address=address, usbc_id=usbc_id, tnba_id=tnba_id
+        )
         
         # Build and execute query
-        query = build_enhanced_user_query(session, filters)
-        users = query.all()
+        stmt, params = build_enhanced_user_query(filters)
+        users = session.execute(stmt, params).scalars().all()
         
         return users
+
+
+def format_user_row(user: Dict[str, Any]) -> Tuple[str, str, str, str, str]:
+    """Format a user's data as the cells of a display row.
+    
+    Args:
+        user: Dictionary containing user data
         
-    except SQLAlchemyError:
-        raise
-    finally:
-        session.close()
+    Returns:
+        Tuple of ID, name, role label, email and created date strings
+    """
+    # created_at is ISO 8601, so the date is its first 10 characters; no
+    # need to parse it back into a datetime just to reformat it
+    created_display = str(user['created_at'])[:10] if user['created_at'] else ""
+    
+    return (
+        str(user['id']),
+        user['name'],
+        ROLE_LABELS.get(user['role']) or user['role'].replace('_', ' ').title(),
+        user['email'],
+        created_display
+    )
 
 
 def display_users_table(users_data: List[Dict[str, Any]]) -> None:
     """Display users in a formatted Rich table with zebra striping.
     
+    Pages larger than PLAIN_TABLE_THRESHOLD rows are printed as plain
+    fixed-width text instead, since Rich lays out and styles every cell.
+    
     Args:
         users_data: List of dictionaries containing user data
     """
@@ -260,6 +381,12 @@ def display_users_table(users_data: List[Dict[str, Any]]) -> None:
         console.print("No users found matching criteria.")
         return
     
+    rows = [format_user_row(user) for user in users_data]
+    
+    if len(rows) > PLAIN_TABLE_THRESHOLD:
+        console.print(format_plain_table(rows), markup=False, highlight=False)
+        return
+    
     # Create table with zebra striping
     table = Table(
         show_header=True,
@@ -274,68 +401,200 @@ def display_users_table(users_data: List[Dict[str, Any]]) -> None:
     table.add_column("Created", style="magenta")
     
     # Add rows
-    for user in users_data:
-        # Format created_at for display
-        created_display = ""
-        if user['created_at']:
-            try:
-                dt = datetime.fromisoformat(user['created_at'].replace('Z', '+00:00'))
-                created_display = dt.strftime("%Y-%m-%d")
-            except (ValueError, AttributeError):
-                created_display = str(user['created_at'])[:10]  # Fallback
-        
-        table.add_row(
-            str(user['id']),
-            user['name'],
-            user['role'].replace('_', ' ').title(),
-            user['email'],
-            created_display
-        )
+    for row in rows:
+        table.add_row(*row)
     
     console.print(table)
 
 
-def paginate_and_display(users_data: List[Dict[str, Any]], page_size: int) -> List[Dict[str, Any]]:
-    """Display users with pagination support.
+def format_plain_table(rows: List[Tuple[str, ...]]) -> str:
+    """Render display rows as a plain fixed-width text table.
     
     Args:
-        users_data: List of dictionaries containing user data
+        rows: Formatted rows as returned by format_user_row
+        
+    Returns:
+        str: Header, separator and rows joined into a single string
+    """
+    all_rows = [USER_TABLE_HEADERS] + rows
+    widths = [max(len(cell) for cell in column) for column in zip(*all_rows)]
+    
+    # User IDs are right-aligned, as in the Rich table
+    fmt = "  ".join(
+        f"{{:>{width}}}" if index == 0 else f"{{:<{width}}}"
+        for index, width in enumerate(widths)
+    )
+    separator = "  ".join("-" * width for width in widths)
+    
+    lines = [fmt.format(*USER_TABLE_HEADERS), separator]
+    lines.extend(fmt.format(*row) for row in rows)
+    return "\n".join(lines)
+
+
+def iter_user_pages(
+    session: Session,
+    stmt: Select,
+    params: Dict[str, Any],
+    page_size: int,
+    order: str = "id"
+) -> Iterator[Tuple[List[Dict[str, Any]], bool]]:
+    """Lazily fetch users one page at a time.
+    
+    Each page is loaded with its own LIMIT query only when the next page is
+    requested, so a consumer that stops early never reads the remaining rows.
+    When ordering by id, pages continue from the last id seen (keyset
+    pagination) instead of using OFFSET, which would rescan all earlier rows on
+    deep pages.
+    
+    Args:
+        session: Database session
+        stmt: Ordered user listing statement to paginate
+        params: Bind parameter values for the statement
+        page_size: Number of users per page
+        order: Ordering field the statement was built with (id, last_name, created_at)
+        
+    Yields:
+        Tuple of the page's user data and whether another page follows
+    """
+    page = 0
+    last_id = None
+    
+    while True:
+        if order == "id":
+            page_stmt = stmt if last_id is None else stmt.where(User.id > last_id)
+        else:
+            page_stmt = stmt.offset(page * page_size)
+        
+        # Fetch one extra row to learn whether another page follows
+        rows = session.execute(page_stmt.limit(page_size + 1), params).all()
+        has_more = len(rows) > page_size
+        page_users = rows[:page_size]
+        
+        yield [user_to_dict(user) for user in page_users], has_more
+        
+        if not has_more:
+            return
+        
+        page += 1
+        last_id = page_users[-1].id
+
+
+def open_prefetch_session(session: Session) -> Optional[Session]:
+    """Open a session for fetching pages on a background thread.
+    
+    Sessions are not thread-safe, so the background thread gets its own
+    session on the same engine. In-memory SQLite databases are excluded:
+    another thread would get its own connection, and with it a different,
+    empty database.
+    
+    Args:
+        session: The caller's session
+        
+    Returns:
+        A new session bound to the same engine, or None if pages cannot be
+        fetched on another thread
+    """
+    bind = session.get_bind()
+    if not isinstance(bind, Engine) or is_in_memory_database(bind.url):
+        return None
+    return Session(bind=bind)
+
+
+def paginate_and_display(
+    session: Session,
+    stmt: Select,
+    params: Dict[str, Any],
+    page_size: int,
+    order: str = "id"
+) -> List[Dict[str, Any]]:
+    """Display users with pagination support, fetching one page at a time.
+    
+    Pages come from iter_user_pages. In interactive use on a file-backed or
+    server database, the next page is fetched in the background while the user
+    reads the current one, so it is usually ready when they continue; quitting
+    stops any further fetching.
+    
+    Args:
+        session: Database session
+        stmt: Ordered user listing statement to paginate
+        params: Bind parameter values for the statement
         page_size: Number of users per page
+        order: Ordering field the statement was built with (id, last_name, created_at)
+        
+    Returns:
+        List of user data for the pages that were displayed
+    """
+    interactive = sys.stdin.isatty()
+    prefetch_session = open_prefetch_session(session) if interactive else None
+    if prefetch_session is None:
+        return _display_pages(iter_user_pages(session, stmt, params, page_size, order), interactive)
+    
+    # Every page, the first included, is fetched on the single worker thread,
+    # which alone uses prefetch_session; leaving the executor waits for any
+    # fetch still running before the session is closed
+    try:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pages = iter_user_pages(prefetch_session, stmt, params, page_size, order)
+            return _display_pages(pages, interactive, executor)
+    finally:
+        prefetch_session.close()
+
+
+def _display_pages(
+    pages: Iterator[Tuple[List[Dict[str, Any]], bool]],
+    interactive: bool,
+    executor: Optional[ThreadPoolExecutor] = None
+) -> List[Dict[str, Any]]:
+    """Show pages of users, prompting between them in interactive use.
+    
+    Args:
+        pages: Pages from iter_user_pages
+        interactive: Whether to wait for the user between pages
+        executor: Worker that fetches pages, the next one while the user
+            reads the current one; pages are fetched inline if None
         
     Returns:
-        List of all user data (same as input)
+        List of user data for the pages that were displayed
     """
     console = Console()
-    total_users = len(users_data)
-    pages = (total_users + page_size - 1) // page_size  # Ceiling division
+    users_data = []
+    
+    def fetch_next() -> Optional[Tuple[List[Dict[str, Any]], bool]]:
+        if executor is None:
+            return next(pages, None)
+        return executor.submit(next, pages, None).result()
     
-    for page in range(pages):
-        start_idx = page * page_size
-        end_idx = min(start_idx + page_size, total_users)
-        page_data = users_data[start_idx:end_idx]
+    page = fetch_next()
+    while page is not None:
+        page_data, has_more = page
+        users_data.extend(page_data)
         
         # Display current page
         display_users_table(page_data)
         
-        # Show pagination info if not last page
-        if page < pages - 1:
-            remaining = total_users - end_idx
-            
-            # Check if we're in an interactive environment
-            if not sys.stdin.isatty():
-                # Non-interactive environment - just show all results
-                console.print(f"\n[dim]Showing remaining {remaining} results...[/dim]")
-                continue
-            
-            console.print(f"\nNext {remaining} results... (press Enter to continue, 'q' to quit)")
-            
-            try:
-                user_input = input().strip().lower()
-                if user_input == 'q':
-                    break
-            except (KeyboardInterrupt, EOFError):
-                console.print("\n[yellow]Pagination interrupted by user[/yellow]")
+        if not has_more:
+            break
+        
+        # Check if we're in an interactive environment
+        if not interactive:
+            # Non-interactive environment - just show all results
+            console.print("\n[dim]Showing more results...[/dim]")
+            page = fetch_next()
+            continue
+        
+        # Start on the next page while the user reads this one
+        next_page = executor.submit(next, pages, None) if executor is not None else None
+        console.print("\nMore results... (press Enter to continue, 'q' to quit)")
+        
+        try:
+            user_input = input().strip().lower()
+            if user_input == 'q':
                 break
+        except (KeyboardInterrupt, EOFError):
+            console.print("\n[yellow]Pagination interrupted by user[/yellow]")
+            break
+        
+        page = next_page.result() if next_page is not None else next(pages, None)
     
     return users_data
 
@@ -3,39 +3,88 @@
 import json
 import sys
 from datetime import datetime
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Sequence, Tuple
 
 import click
 from rich.console import Console
 from rich.table import Table
 from rich import box
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import func, select, text, tuple_, update
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import OperationalError, SQLAlchemyError
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
 
 from core.models import User
 from core.logging import log_merge_event
-from storage.database import db_manager
+from storage.database import db_manager, is_lock_not_available
 
 console = Console()
 
 # Resolution modes
 RESOLUTION_MODES = ["prefer_main", "prefer_merge", "prefer_longest"]
 
+# How to handle users already locked by another operation: wait for the lock,
+# fail immediately (nowait), or leave locked users out (skip)
+LOCK_MODES = ["wait", "nowait", "skip"]
+
+# Columns read for each user taking part in a merge
+_MERGE_COLUMNS = (
+    User.id, User.first_name, User.last_name, User.deleted_at, User.version,
+    *(getattr(User, field) for field in User.MERGEABLE_FIELDS)
+)
+
+# Position of each mergeable field in User.MERGEABLE_FIELDS
+_FIELD_POSITIONS = {field: position for position, field in enumerate(User.MERGEABLE_FIELDS)}
+
+# Largest dry-run batch previewed as a Rich table; bigger batches and
+# non-terminal output are streamed as tab-separated lines instead
+DRY_RUN_TABLE_LIMIT = 50
+
+# Longest wait for row locks in the write phase on PostgreSQL
+MERGE_LOCK_TIMEOUT = "5s"
+
+# Exit code when users are locked by another operation in nowait mode
+LOCK_NOT_AVAILABLE_EXIT_CODE = 6
+
+# Exit code when a user was changed by another operation during the merge
+CONCURRENT_UPDATE_EXIT_CODE = 7
+
 
 def merge_profiles(
     main_id: int, 
     merge_ids: List[int],
     dry_run: bool = False,
     resolution_mode: Optional[str] = None,
-    no_interactive: bool = False
+    no_interactive: bool = False,
+    lock_mode: str = "wait"
 ) -> int:
     """Enhanced merge one or more user profiles into a main profile.
     
+    The merge runs in two phases. Users are first read, without row locks and
+    in an autocommit transaction, to validate them, resolve conflicts, show the
+    dry-run preview and ask for confirmation; no transaction is open while
+    waiting on the operator. The changes are then written in a short second
+    transaction that re-reads all involved users with a single SELECT ... FOR
+    UPDATE and checks nothing changed since the first read.
+    
+    Rows are locked in ascending ID order, independent of the order of
+    main_id and merge_ids. Keeping one global lock order means two merges
+    touching the same users always wait on each other instead of deadlocking.
+    On PostgreSQL that wait is capped at MERGE_LOCK_TIMEOUT.
+    
+    If another operation changed, deleted or removed one of the users between
+    the two phases (see User.version), nothing is written and exit code 7 is
+    returned.
+    
     Args:
         main_id: ID of the main user to merge into
         merge_ids: List of user IDs to merge into main_id
         dry_run: If True, show planned actions without executing
         resolution_mode: Auto-resolution mode for conflicts
         no_interactive: If True, use automatic resolution without prompts
+        lock_mode: One of LOCK_MODES; "nowait" fails with exit code 6 if any
+            user is locked elsewhere, "skip" treats locked users as not found
         
     Returns:
         Exit code (0 for success, other codes for errors)
@@ -48,94 +97,180 @@ def merge_profiles(
         # Validate arguments
         validate_merge_args(main_id, merge_ids)
         
+        # A repeated merge ID names the same user; keep the first occurrence
+        merge_ids = list(dict.fromkeys(merge_ids))
+        
+        # A dedicated session, so the caller's own session and any transaction
+        # it has open are left untouched
         session = db_manager.get_session()
         try:
-            # Lock and retrieve all users
+            user_ids = sorted({main_id, *merge_ids})
+            
+            # Phase 1: read a snapshot of all users without taking row locks.
+            # Plain rows are read rather than ORM objects, so the prompts below
+            # work on in-memory values and never reopen a transaction
             with session.begin():
-                # Get main user with row lock
-                main_user = session.query(User).filter_by(id=main_id).with_for_update().first()
-                if not main_user:
-                    click.echo(f"ERROR: Main user with ID {main_id} not found", err=True)
+                session.connection(execution_options={"isolation_level": "AUTOCOMMIT"})
+                users_by_id = _fetch_users(session, user_ids)
+            
+            main_user = users_by_id.get(main_id)
+            if not main_user:
+                click.echo(f"ERROR: Main user with ID {main_id} not found", err=True)
+                return 4
+            
+            if main_user.deleted_at is not None:
+                click.echo(f"ERROR: Main user with ID {main_id} is deleted", err=True)
+                return 4
+            
+            # Check all merge users were found and are active
+            merge_users = []
+            for merge_id in merge_ids:
+                merge_user = users_by_id.get(merge_id)
+                if not merge_user:
+                    click.echo(f"ERROR: Merge user with ID {merge_id} not found", err=True)
                     return 4
                 
-                if main_user.is_deleted():
-                    click.echo(f"ERROR: Main user with ID {main_id} is deleted", err=True)
+                if merge_user.deleted_at is not None:
+                    click.echo(f"ERROR: Merge user with ID {merge_id} is deleted", err=True)
                     return 4
                 
-                # Get all merge users with row locks
-                merge_users = []
-                for merge_id in merge_ids:
-                    merge_user = session.query(User).filter_by(id=merge_id).with_for_update().first()
-                    if not merge_user:
-                        click.echo(f"ERROR: Merge user with ID {merge_id} not found", err=True)
-                        return 4
-                    
-                    if merge_user.is_deleted():
-                        click.echo(f"ERROR: Merge user with ID {merge_id} is deleted", err=True)
-                        return 4
-                    
-                    merge_users.append(merge_user)
+                merge_users.append(merge_user)
+            
+            # Detect all conflicts across all users
+            all_conflicts = {}
+            # Resolution decisions per merge user: {user_id: {field: resolution}}
+            all_resolutions = {}
+            
+            # Working copy of the main user's values, updated as conflicts are
+            # resolved and fields filled; normalized once rather than per merge user
+            original_values = User._merge_getter(main_user)
+            main_values = list(original_values)
+            main_fields = _normalize_merge_fields(main_values)
+            
+            for merge_user in merge_users:
+                conflicts, fillable = _compare_merge_fields(main_fields, merge_user)
                 
-                # Detect all conflicts across all users
-                all_conflicts = {}
-                all_resolutions = {}
+                if conflicts:
+                    if dry_run:
+                        all_conflicts[merge_user.id] = conflicts
+                    else:
+                        # Resolve conflicts
+                        if no_interactive and not resolution_mode:
+                            # Check for email conflicts in non-interactive mode
+                            if 'email' in conflicts:
+                                click.echo("ERROR: Email conflict detected in non-interactive mode", err=True)
+                                return 2
+                        
+                        resolved_values = _resolve_conflicts(
+                            main_user, merge_user, conflicts,
+                            resolution_mode, no_interactive
+                        )
+                        
+                        # Apply resolved values to the main user's working values
+                        user_resolutions = all_resolutions.setdefault(merge_user.id, {})
+                        for field, (value, resolution) in resolved_values.items():
+                            main_values[_FIELD_POSITIONS[field]] = value
+                            user_resolutions[field] = resolution
                 
-                for merge_user in merge_users:
-                    conflicts = _detect_conflicts(main_user, merge_user)
+                # Fill fields the main user is missing; these never overlap
+                # with the conflicts resolved above
+                if not dry_run:
+                    for field, value in fillable.items():
+                        main_values[_FIELD_POSITIONS[field]] = value
+                        all_resolutions.setdefault(merge_user.id, {})[field] = "kept_duplicate"
                     
-                    if conflicts:
-                        if dry_run:
-                            all_conflicts[merge_user.id] = conflicts
-                        else:
-                            # Resolve conflicts
-                            if no_interactive and not resolution_mode:
-                                # Check for email conflicts in non-interactive mode
-                                if 'email' in conflicts:
-                                    click.echo("ERROR: Email conflict detected in non-interactive mode", err=True)
-                                    return 2
-                            
-                            resolved_values = _resolve_conflicts(
-                                main_user, merge_user, conflicts,
-                                resolution_mode, no_interactive
-                            )
-                            
-                            # Apply resolved values to main user
-                            for field, (value, resolution) in resolved_values.items():
-                                setattr(main_user, field, value)
-                                all_resolutions[field] = resolution
+                    # Re-normalize only if this merge user changed the main user
+                    if conflicts or fillable:
+                        main_fields = _normalize_merge_fields(main_values)
+            
+            if dry_run:
+                _show_dry_run_preview(main_user, merge_users, all_conflicts)
+                return 0
+            
+            # Show summary and get confirmation unless non-interactive
+            if not no_interactive and not _confirm_merge(main_user, merge_users):
+                click.echo("Merge operation cancelled.")
+                return 5
+            
+            # Phase 2: lock the users, check they are unchanged and write
+            with session.begin():
+                if session.get_bind().dialect.name == "postgresql":
+                    # Bound the wait for locks held elsewhere; a timeout fails
+                    # like nowait, with LOCK_NOT_AVAILABLE_EXIT_CODE
+                    session.execute(text(f"SET LOCAL lock_timeout = '{MERGE_LOCK_TIMEOUT}'"))
+                locked_by_id = _fetch_users(session, user_ids, lock_mode)
+                for user_id in user_ids:
+                    locked_user = locked_by_id.get(user_id)
+                    if locked_user is None and lock_mode == "skip":
+                        # Skipped rows are indistinguishable from missing ones
+                        role = "Main" if user_id == main_id else "Merge"
+                        click.echo(f"ERROR: {role} user with ID {user_id} not found or locked", err=True)
+                        return 4
                     
-                    # Merge non-conflicting fields
-                    if not dry_run:
-                        filled_fields = _merge_non_conflicting_fields(main_user, merge_user)
-                        for field in filled_fields:
-                            all_resolutions[field] = "kept_duplicate"
+                    if (
+                        locked_user is None
+                        or locked_user.deleted_at is not None
+                        or locked_user.version != users_by_id[user_id].version
+                    ):
+                        raise StaleDataError(f"User {user_id} changed since it was read")
                 
-                if dry_run:
-                    _show_dry_run_preview(main_user, merge_users, all_conflicts)
-                    return 0
+                # Write the resolved and filled values to the main user in one
+                # UPDATE (last write wins across merge users). Core updates skip
+                # the ORM version check, so it is repeated in the WHERE clause
+                final_values = {
+                    field: value
+                    for field, original, value in zip(
+                        User.MERGEABLE_FIELDS, original_values, main_values
+                    )
+                    if value != original
+                }
+                if final_values:
+                    result = session.execute(
+                        update(User)
+                        .where(User.id == main_id, User.version == locked_by_id[main_id].version)
+                        .values(version=User.version + 1, **final_values)
+                        .execution_options(synchronize_session=False)
+                    )
+                    if result.rowcount == 0:
+                        raise StaleDataError(f"User {main_id} changed since it was read")
                 
-                # Show summary and get confirmation unless non-interactive
-                if not no_interactive and not _confirm_merge(main_user, merge_users):
-                    click.echo("Merge operation cancelled.")
-                    return 5
-                
-                # Perform soft delete on merged users
-                for merge_user in merge_users:
-                    merge_user.soft_delete()
-                
-                # Commit transaction
-                session.commit()
-                
-                # Log the successful merge
-                log_merge_event(main_id, merge_ids, all_resolutions)
-                
-                click.echo("Profile merge completed successfully.")
-                return 0
+                # Soft delete all merged users in one UPDATE, matching each on
+                # the version it was read with
+                result = session.execute(
+                    update(User)
+                    .where(tuple_(User.id, User.version).in_([
+                        (merge_id, locked_by_id[merge_id].version) for merge_id in merge_ids
+                    ]))
+                    .values(deleted_at=func.now(), version=User.version + 1)
+                    .execution_options(synchronize_session=False)
+                )
+                if result.rowcount != len(merge_ids):
+                    raise StaleDataError("Merge users changed since they were read")
+            
+            # Log the successful merge
+            log_merge_event(main_id, merge_ids, all_resolutions)
+            
+            click.echo("Profile merge completed successfully.")
+            return 0
                 
         except KeyboardInterrupt:
             session.rollback()
             click.echo("\nMerge operation aborted by user.", err=True)
             return 5
+        except StaleDataError:
+            session.rollback()
+            click.echo(
+                "ERROR: A user was changed by another operation during the merge, please retry",
+                err=True
+            )
+            return CONCURRENT_UPDATE_EXIT_CODE
+        except OperationalError as e:
+            session.rollback()
+            if is_lock_not_available(e):
+                click.echo("ERROR: Users are locked by another operation, try again later", err=True)
+                return LOCK_NOT_AVAILABLE_EXIT_CODE
+            click.echo(f"ERROR: Database error occurred: {e}", err=True)
+            return 1
         except SQLAlchemyError as e:
             session.rollback()
             click.echo(f"ERROR: Database error occurred: {e}", err=True)
@@ -151,35 +286,83 @@ def merge_profiles(
         return handle_merge_errors(e)
 
 
-def _detect_conflicts(main_user: User, merge_user: User) -> Dict[str, Tuple[Any, Any]]:
-    """Detect conflicting field values between two users.
+def _fetch_users(
+    session: Session,
+    user_ids: List[int],
+    lock_mode: Optional[str] = None
+) -> Dict[int, Row]:
+    """Fetch the columns a merge needs for users by ID in one query.
+    
+    Rows are returned as plain Core rows, skipping ORM identity-map and
+    attribute bookkeeping; all writes go through Core UPDATE statements.
     
     Args:
-        main_user: Main user object
-        merge_user: User to merge
+        session: Database session
+        user_ids: User IDs to fetch
+        lock_mode: One of LOCK_MODES to lock the rows with SELECT ... FOR
+            UPDATE, or None to read without locking
         
     Returns:
-        Dictionary mapping field names to (main_value, merge_value) tuples
+        Dictionary mapping each found user ID to its row
     """
-    conflicts = {}
+    stmt = select(*_MERGE_COLUMNS).where(User.id.in_(user_ids)).order_by(User.id)
+    if lock_mode:
+        stmt = stmt.with_for_update(
+            nowait=lock_mode == "nowait",
+            skip_locked=lock_mode == "skip"
+        )
+    return {row.id: row for row in session.execute(stmt).all()}
+
+
+def _normalize_merge_fields(values: Sequence[Any]) -> Tuple[Tuple[Any, str], ...]:
+    """Pair a user's User.MERGEABLE_FIELDS values with their stripped text.
     
-    # Fields that can have conflicts
-    conflict_fields = ['email', 'phone', 'address', 'usbc_id', 'tnba_id']
+    Args:
+        values: Values in User.MERGEABLE_FIELDS order
+        
+    Returns:
+        Tuple of (value, stripped string) pairs in User.MERGEABLE_FIELDS order;
+        the stripped string is empty for missing values
+    """
+    return tuple(
+        (value, str(value).strip() if value else '')
+        for value in values
+    )
+
+
+def _compare_merge_fields(
+    main_fields: Tuple[Tuple[Any, str], ...],
+    merge_user: User
+) -> Tuple[Dict[str, Tuple[Any, Any]], Dict[str, Any]]:
+    """Compare the mergeable fields of the main user and a merge user in one pass.
     
-    for field in conflict_fields:
-        main_value = getattr(main_user, field)
-        merge_value = getattr(merge_user, field)
+    Args:
+        main_fields: Main user's values from _normalize_merge_fields
+        merge_user: User to merge
         
-        # Skip if both values are null/empty
-        if not main_value and not merge_value:
+    Returns:
+        Tuple of a dictionary mapping conflicting field names to
+        (main_value, merge_value) tuples, and a dictionary of fields the main
+        user is missing mapped to the merge user's value
+    """
+    conflicts = {}
+    fillable = {}
+    
+    for field, (main_value, main_text), merge_value in zip(
+        User.MERGEABLE_FIELDS, main_fields, User._merge_getter(merge_user)
+    ):
+        # Nothing to merge if the merge user has no value or the same value;
+        # identical values skip the string normalization below
+        if not merge_value or merge_value == main_value:
             continue
-            
-        # Only consider it a conflict if both values are non-empty and different
-        if (main_value and merge_value and 
-            str(main_value).strip() != str(merge_value).strip()):
+        
+        if not main_value:
+            fillable[field] = merge_value
+        elif main_text != str(merge_value).strip():
+            # Only a conflict if both values are non-empty and different
             conflicts[field] = (main_value, merge_value)
     
-    return conflicts
+    return conflicts, fillable
 
 
 def _resolve_conflicts(
@@ -248,32 +431,6 @@ def _resolve_conflicts(
     return resolved_values
 
 
-def _merge_non_conflicting_fields(main_user: User, merge_user: User) -> List[str]:
-    """Merge non-conflicting fields from merge_user into main_user.
-    
-    Args:
-        main_user: Main user object to update
-        merge_user: User to merge from
-        
-    Returns:
-        List of field names that were filled from merge_user
-    """
-    # Fields that can be merged
-    mergeable_fields = ['email', 'phone', 'address', 'usbc_id', 'tnba_id']
-    filled_fields = []
-    
-    for field in mergeable_fields:
-        main_value = getattr(main_user, field)
-        merge_value = getattr(merge_user, field)
-        
-        # If main user doesn't have a value but merge user does, use merge value
-        if not main_value and merge_value:
-            setattr(main_user, field, merge_value)
-            filled_fields.append(field)
-    
-    return filled_fields
-
-
 def _show_dry_run_preview(
     main_user: User, 
     merge_users: List[User], 
@@ -281,6 +438,9 @@ def _show_dry_run_preview(
 ) -> None:
     """Show a preview of planned merge actions in dry-run mode.
     
+    Small batches shown in a terminal get a Rich table; otherwise one
+    tab-separated line is printed per merge user as it is processed.
+    
     Args:
         main_user: Main user object
         merge_users: List of users to merge
@@ -289,31 +449,39 @@ def _show_dry_run_preview(
     console.print("\n[bold green]PLANNED MERGE ACTIONS (DRY RUN)[/bold green]")
     console.print(f"[cyan]Primary user:[/cyan] {main_user.first_name} {main_user.last_name} (ID {main_user.id})")
     
-    # Create table for merge summary
-    table = Table(title="Merge Summary", box=box.ROUNDED)
-    table.add_column("User ID", style="cyan", no_wrap=True)
-    table.add_column("Name", style="magenta")
-    table.add_column("Action", style="yellow")
-    table.add_column("Conflicts", style="red")
-    
-    for merge_user in merge_users:
-        conflicts = all_conflicts.get(merge_user.id, {})
-        conflict_str = ", ".join(conflicts.keys()) if conflicts else "None"
-        
-        table.add_row(
+    rows = (
+        (
             str(merge_user.id),
             f"{merge_user.first_name} {merge_user.last_name}",
             "Soft delete",
-            conflict_str
+            ", ".join(all_conflicts.get(merge_user.id, {})) or "None"
         )
+        for merge_user in merge_users
+    )
     
-    console.print(table)
+    if console.is_terminal and len(merge_users) <= DRY_RUN_TABLE_LIMIT:
+        # Create table for merge summary
+        table = Table(title="Merge Summary", box=box.ROUNDED)
+        table.add_column("User ID", style="cyan", no_wrap=True)
+        table.add_column("Name", style="magenta")
+        table.add_column("Action", style="yellow")
+        table.add_column("Conflicts", style="red")
+        for row in rows:
+            table.add_row(*row)
+        console.print(table)
+    else:
+        # Stream plain tab-separated rows for pipes and large batches, so
+        # output starts at once without building the whole table in memory
+        click.echo("\t".join(("User ID", "Name", "Action", "Conflicts")))
+        for row in rows:
+            click.echo("\t".join(row))
     
     # Show detailed conflicts if any
     if all_conflicts:
         console.print("\n[bold yellow]CONFLICT DETAILS:[/bold yellow]")
+        users_by_id = {user.id: user for user in merge_users}
         for user_id, conflicts in all_conflicts.items():
-            user = next(u for u in merge_users if u.id == user_id)
+            user = users_by_id[user_id]
             console.print(f"\n[cyan]User {user_id} ({user.first_name} {user.last_name}):[/cyan]")
             
             for field, (main_val, merge_val) in conflicts.items():
@@ -1,9 +1,10 @@
 """Remove user from organization command implementation."""
 
 import sys
-from typing import List, Optional, Set
+from typing import Dict, List
 
 import click
+from sqlalchemy import and_
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
@@ -35,41 +36,34 @@ def validate_organization_exists(session: Session, organization_id: int) -> Orga
     return organization
 
 
-def validate_user_exists(session: Session, user_id: int) -> Optional[User]:
-    """Validate that user exists and return it.
+def fetch_user_memberships(
+    session: Session,
+    user_ids: List[int],
+    organization_id: int
+) -> Dict[int, bool]:
+    """Look up which users exist and whether each belongs to the organization.
     
     Args:
         session: Database session
-        user_id: User ID to validate
+        user_ids: User IDs to look up
+        organization_id: Organization ID to check membership in
         
     Returns:
-        User: The user object, or None if not found
+        Dict[int, bool]: Maps each existing (non-deleted) user ID to True if
+        the user is a member of the organization
     """
-    user = session.query(User).filter(
-        User.id == user_id,
+    rows = session.query(User.id, OrganizationMembership.id).outerjoin(
+        OrganizationMembership,
+        and_(
+            OrganizationMembership.user_id == User.id,
+            OrganizationMembership.organization_id == organization_id
+        )
+    ).filter(
+        User.id.in_(user_ids),
         User.deleted_at.is_(None)
-    ).first()
+    ).all()
     
-    return user
-
-
-def check_user_membership(session: Session, user_id: int, organization_id: int) -> Optional[OrganizationMembership]:
-    """Check if user is a member of the organization and return membership.
-    
-    Args:
-        session: Database session
-        user_id: User ID to check
-        organization_id: Organization ID to check
-        
-    Returns:
-        OrganizationMembership: The membership object, or None if not a member
-    """
-    membership = session.query(OrganizationMembership).filter(
-        OrganizationMembership.user_id == user_id,
-        OrganizationMembership.organization_id == organization_id
-    ).first()
-    
-    return membership
+    return {user_id: membership_id is not None for user_id, membership_id in rows}
 
 
 def deduplicate_user_ids(user_ids: List[int]) -> List[int]:
@@ -81,15 +75,7 @@ def deduplicate_user_ids(user_ids: List[int]) -> List[int]:
     Returns:
         List[int]: Deduplicated list of user IDs
     """
-    seen: Set[int] = set()
-    result = []
-    
-    for user_id in user_ids:
-        if user_id not in seen:
-            seen.add(user_id)
-            result.append(user_id)
-    
-    return result
+    return list(dict.fromkeys(user_ids))
 
 
 def remove_users_from_organization(
@@ -112,96 +98,88 @@ def remove_users_from_organization(
         click.echo("Error: No user IDs provided", err=True)
         sys.exit(5)
     
-    # Get database session
-    session = db_manager.get_session()
-    
     try:
-        # Validate organization exists
-        organization = validate_organization_exists(session, organization_id)
-        
-        # Process each user
-        successful_users = []
-        skipped_users = []
-        error_users = []
-        
-        for user_id in user_ids:
-            # Check if user exists
-            user = validate_user_exists(session, user_id)
-            if not user:
-                error_users.append(f"User {user_id}: User not found")
-                continue
+        with db_manager.session_scope() as session:
+            # Validate organization exists
+            organization = validate_organization_exists(session, organization_id)
             
-            # Check if user is a member of the organization
-            membership = check_user_membership(session, user_id, organization_id)
-            if not membership:
-                skipped_users.append(f"User {user_id}: Not a member of organization {organization_id}")
-                continue
+            # Look up user existence and membership for all users at once
+            memberships = fetch_user_memberships(session, user_ids, organization_id)
             
-            # Remove membership
-            try:
-                session.delete(membership)
-                successful_users.append(f"User {user_id}")
+            # Process each user
+            successful_users = []
+            skipped_users = []
+            error_users = []
+            user_ids_to_remove = []
+            
+            for user_id in user_ids:
+                # Check if user exists
+                if user_id not in memberships:
+                    error_users.append(f"User {user_id}: User not found")
+                    continue
                 
-            except Exception as e:
-                error_users.append(f"User {user_id}: {str(e)}")
-                continue
-        
-        # Commit all successful operations
-        if successful_users:
-            try:
-                session.commit()
-            except IntegrityError as e:
-                session.rollback()
-                click.echo(f"Error: Database constraint violation: {str(e)}", err=True)
+                # Check if user is a member of the organization
+                if not memberships[user_id]:
+                    skipped_users.append(f"User {user_id}: Not a member of organization {organization_id}")
+                    continue
+                
+                # Queue membership for a single bulk delete
+                user_ids_to_remove.append(user_id)
+                successful_users.append(f"User {user_id}")
+            
+            # Delete all queued memberships in one statement and commit
+            if user_ids_to_remove:
+                try:
+                    session.query(OrganizationMembership).filter(
+                        OrganizationMembership.organization_id == organization_id,
+                        OrganizationMembership.user_id.in_(user_ids_to_remove)
+                    ).delete(synchronize_session=False)
+                    session.commit()
+                except IntegrityError as e:
+                    session.rollback()
+                    click.echo(f"Error: Database constraint violation: {str(e)}", err=True)
+                    sys.exit(1)
+            
+            # Handle output based on results
+            if not successful_users and not skipped_users and error_users:
+                # All users failed - this should not happen in normal conditions
+                # as skipped_users should contain non-members
+                click.echo("Error: No users could be processed", err=True)
+                for error_msg in error_users:
+                    click.echo(f"- {error_msg}", err=True)
                 sys.exit(1)
-        
-        # Handle output based on results
-        if not successful_users and not skipped_users and error_users:
-            # All users failed - this should not happen in normal conditions
-            # as skipped_users should contain non-members
-            click.echo("Error: No users could be processed", err=True)
-            for error_msg in error_users:
-                click.echo(f"- {error_msg}", err=True)
-            sys.exit(1)
-        
-        # Display success results
-        if successful_users:
-            if len(successful_users) == 1:
-                # Single user removal success
-                user_info = successful_users[0]
-                click.echo(f"{user_info} successfully removed from organization {organization_id}")
-            else:
-                # Multiple users success
-                click.echo(f"Successfully removed the following users from organization {organization_id}:")
-                for user_info in successful_users:
-                    click.echo(f"- {user_info}")
-        
-        # Display skipped results
-        if skipped_users or error_users:
+            
+            # Display success results
             if successful_users:
-                click.echo()  # Add blank line after success messages
-            click.echo("Skipped the following users:")
-            for skip_msg in skipped_users:
-                click.echo(f"- {skip_msg}")
-            for error_msg in error_users:
-                click.echo(f"- {error_msg}")
-        
-        # Exit successfully - partial success scenarios are considered successful
-        # as per PRP requirements
-        
+                if len(successful_users) == 1:
+                    # Single user removal success
+                    user_info = successful_users[0]
+                    click.echo(f"{user_info} successfully removed from organization {organization_id}")
+                else:
+                    # Multiple users success
+                    click.echo(f"Successfully removed the following users from organization {organization_id}:")
+                    for user_info in successful_users:
+                        click.echo(f"- {user_info}")
+            
+            # Display skipped results
+            if skipped_users or error_users:
+                if successful_users:
+                    click.echo()  # Add blank line after success messages
+                click.echo("Skipped the following users:")
+                for skip_msg in skipped_users:
+                    click.echo(f"- {skip_msg}")
+                for error_msg in error_users:
+                    click.echo(f"- {error_msg}")
+            
+            # Exit successfully - partial success scenarios are considered successful
+            # as per PRP requirements
+            
     except click.ClickException:
         # Re-raise ClickExceptions to maintain error codes
         raise
     except Exception as e:
-        session.rollback()
         click.echo(f"Error: Database error occurred: {str(e)}", err=True)
         sys.exit(1)
-    finally:
-        try:
-            session.close()
-        except Exception:
-            # Suppress session close errors
-            pass
 
 
 @click.command()
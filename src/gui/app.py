@@ -12,14 +12,19 @@ from .utils import get_current_user
 def create_app() -> Flask:
     """Create and configure the Flask application.
     
+    Database tables are only created here when the AUTO_CREATE_TABLES
+    setting is enabled; otherwise the schema must already exist.
+    
     Returns:
         Configured Flask application instance.
     """
     app = Flask(__name__)
     app.config.from_object('src.gui.config.Config')
     
-    # Initialize database
-    db_manager.create_tables()
+    # Schema setup is an explicit step (see run_gui.py); only create tables
+    # here when asked to
+    if app.config.get('AUTO_CREATE_TABLES'):
+        db_manager.create_tables()
     
     # Register blueprints
     from .auth import auth_bp
@@ -28,6 +33,19 @@ def create_app() -> Flask:
     app.register_blueprint(auth_bp)
     app.register_blueprint(users_bp)
     
+    @app.teardown_request
+    def remove_db_session(exception: Optional[BaseException] = None) -> None:
+        """Close the request-scoped database session, if one was used.
+        
+        Views and helpers get the session with ``db_manager.Session()``, which
+        returns the same session for the whole request, and never close it
+        themselves; this handler releases it once the request ends.
+        
+        Args:
+            exception: The exception that ended the request, if any.
+        """
+        db_manager.Session.remove()
+    
     @app.route('/')
     def index() -> str:
         """Landing page route.
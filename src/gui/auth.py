@@ -1,14 +1,34 @@
 """Authentication routes and session management."""
 
-from flask import Blueprint, render_template, request, redirect, url_for, session, flash
-from typing import Union
+import hashlib
+import logging
+import random
+import time
+
+from flask import Blueprint, current_app, g, render_template, request, redirect, url_for, session, flash
+from typing import Optional, Union
 
 from core.auth import auth_manager, AuthenticationError
 from storage.database import db_manager
 from .forms import LoginForm, SignupForm
+from .users import invalidate_user_list
 
 auth_bp = Blueprint('auth', __name__, url_prefix='/auth')
 
+logger = logging.getLogger(__name__)
+
+
+def hash_ip(ip_address: Optional[str]) -> str:
+    """Hash a client IP address so it can be logged without storing it.
+    
+    Args:
+        ip_address: Client IP address, or None if unknown
+        
+    Returns:
+        str: Short hex digest identifying the address
+    """
+    return hashlib.sha256((ip_address or '').encode()).hexdigest()[:12]
+
 
 @auth_bp.route('/login', methods=['GET', 'POST'])
 def login() -> Union[str, redirect]:
@@ -17,17 +37,16 @@ def login() -> Union[str, redirect]:
     Returns:
         Rendered login template or redirect to index.
     """
+    started = time.perf_counter()
+    
     # If already logged in, redirect to index
     if 'user_id' in session:
         return redirect(url_for('index'))
     
     form = LoginForm()
-    print(f"DEBUG: Form created: {form}")
-    print(f"DEBUG: Form fields: {[field.name for field in form]}")
     
     if form.validate_on_submit():
-        # Get database session
-        db_session = db_manager.get_session()
+        db_session = db_manager.Session()
         try:
             user = auth_manager.authenticate_user(
                 db_session, 
@@ -38,15 +57,23 @@ def login() -> Union[str, redirect]:
             session['user_name'] = f"{user.first_name} {user.last_name}"
             session.permanent = True
             
+            # One lazily formatted record per sampled login; skipped entirely
+            # when INFO is filtered out
+            if (
+                logger.isEnabledFor(logging.INFO)
+                and random.random() < current_app.config['LOGIN_LOG_SAMPLE_RATE']
+            ):
+                logger.info(
+                    "auth.login ok user_id=%s ip_hash=%s dt=%.3f",
+                    user.id, hash_ip(request.remote_addr), time.perf_counter() - started
+                )
+            
             flash(f'Welcome back, {user.first_name}!', 'success')
             return redirect(url_for('index'))
             
         except AuthenticationError as e:
             flash(str(e), 'error')
-        finally:
-            db_session.close()
     
-    print(f"DEBUG: Rendering login.html with form: {form}")
     return render_template('login.html', form=form)
 
 
@@ -64,8 +91,7 @@ def signup() -> Union[str, redirect]:
     form = SignupForm()
     
     if form.validate_on_submit():
-        # Get database session
-        db_session = db_manager.get_session()
+        db_session = db_manager.Session()
         try:
             user = auth_manager.create_user(
                 db_session,
@@ -79,13 +105,12 @@ def signup() -> Union[str, redirect]:
                 tnba_id=form.tnba_id.data
             )
             
+            invalidate_user_list()
             flash(f'Account created successfully! Please log in.', 'success')
             return redirect(url_for('auth.login'))
             
         except AuthenticationError as e:
             flash(str(e), 'error')
-        finally:
-            db_session.close()
     
     return render_template('signup.html', form=form)
 
@@ -98,5 +123,6 @@ def logout() -> redirect:
         Redirect to login page.
     """
     session.clear()
+    g.pop('current_user', None)
     flash('You have been logged out.', 'info')
     return redirect(url_for('auth.login'))
\ No newline at end of file
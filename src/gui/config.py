@@ -10,6 +10,12 @@ class Config:
     SECRET_KEY: str = os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production')
     DATABASE_URL: Optional[str] = os.environ.get('DATABASE_URL', 'sqlite:///tournament_control.db')
     
+    # Create missing tables when the app is created (development only)
+    AUTO_CREATE_TABLES: bool = os.environ.get('AUTO_CREATE_TABLES', '').lower() in ('1', 'true', 'yes')
+    
+    # Fraction of successful logins written to the auth log (0.0 to 1.0)
+    LOGIN_LOG_SAMPLE_RATE: float = float(os.environ.get('LOGIN_LOG_SAMPLE_RATE', '1.0'))
+    
     # Flask-WTF settings
     WTF_CSRF_ENABLED: bool = True
     WTF_CSRF_TIME_LIMIT: int = 3600  # 1 hour
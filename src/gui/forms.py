@@ -5,6 +5,16 @@ from wtforms import StringField, PasswordField, EmailField, SubmitField, TextAre
 from wtforms.validators import DataRequired, Email, Length, Optional, NumberRange
 
 
+# Fields a user search can match on, as (value, label) pairs
+SEARCH_TYPE_CHOICES = (
+    ('user_id', 'User ID'),
+    ('email', 'Email'),
+    ('usbc_id', 'USBC ID'),
+    ('tnba_id', 'TNBA ID'),
+    ('name', 'Name'),
+)
+
+
 class LoginForm(FlaskForm):
     """Form for user login."""
     
@@ -43,13 +53,7 @@ class CreateUserForm(FlaskForm):
 class SearchUserForm(FlaskForm):
     """Form for searching users."""
     
-    search_type = SelectField('Search By', choices=[
-        ('user_id', 'User ID'),
-        ('email', 'Email'),
-        ('usbc_id', 'USBC ID'),
-        ('tnba_id', 'TNBA ID'),
-        ('name', 'Name')
-    ], validators=[DataRequired()])
+    search_type = SelectField('Search By', choices=SEARCH_TYPE_CHOICES, validators=[DataRequired()])
     search_value = StringField('Search Value', validators=[DataRequired()])
     submit = SubmitField('Search')
 
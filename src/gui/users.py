@@ -1,40 +1,172 @@
 """User management routes and forms."""
 
+import re
+import time
+
 from flask import Blueprint, render_template, request, redirect, url_for, flash
-from typing import Union, List
+from typing import Dict, List, Tuple, Union
+
+from sqlalchemy import Row, func, or_, select, update
+from sqlalchemy.orm import Session
 
 from core.auth import auth_manager, AuthenticationError
 from core.models import User
-from core.profile import get_profile, edit_profile, delete_profile
+from core.profile import get_profile, delete_profile
 from storage.database import db_manager
 from src.commands.merge import merge_profiles
-from src.commands.list_users import list_users
+from src.commands.list_users import build_enhanced_user_query, normalize_filters
 from .forms import CreateUserForm, SearchUserForm, EditProfileForm, DeleteProfileForm, MergeProfileForm, ListUsersForm
-from .utils import require_auth
+from .utils import Pagination, get_page_number, require_auth
 
 users_bp = Blueprint('users', __name__, url_prefix='/users')
 
+# Number of users shown per page of the user list
+USERS_PER_PAGE = 50
+
+# Most users returned by a search by name
+NAME_SEARCH_LIMIT = 200
+
+# Most users returned by the filter form
+FILTER_RESULTS_LIMIT = 500
+
+# Profile fields the edit form can change (User column -> label for errors)
+EDITABLE_PROFILE_FIELDS = {
+    'first_name': 'First name',
+    'last_name': 'Last name',
+    'phone': 'Phone',
+    'address': 'Address',
+}
+
+# A comma-separated list of user IDs, and a single ID within it
+_USER_ID_LIST_RE = re.compile(r'\s*\d+\s*(?:,\s*\d+\s*)*')
+_USER_ID_RE = re.compile(r'\d+')
+
+# Seconds a cached page of the user list is served before it is reloaded;
+# this bounds staleness for changes made outside the GUI (e.g. the CLI)
+USER_LIST_CACHE_TIMEOUT = 60
+
+# Most pages kept in the user list cache before it is emptied
+USER_LIST_CACHE_SIZE = 256
+
+# Bumped whenever the GUI changes a user, so cached pages are never reused
+_users_version = 0
+
+# Cached user list pages: (version, page) -> (expires at, total, rows)
+_user_list_cache: Dict[Tuple[int, int], Tuple[float, int, List[Row]]] = {}
+
+# Columns shown on the user list
+_USER_LIST_COLUMNS = (
+    User.id, User.first_name, User.last_name, User.email, User.phone, User.created_at
+)
+
+
+def invalidate_user_list() -> None:
+    """Discard cached pages of the user list.
+    
+    Called after every change the GUI makes to users. The version is part of
+    the cache key, so a page loaded before the change but stored after it is
+    never served.
+    """
+    global _users_version
+    _users_version += 1
+    _user_list_cache.clear()
+
+
+def get_user_list_page(session: Session, page: int) -> Tuple[int, List[Row]]:
+    """Load one page of the user list, using the cache when possible.
+    
+    Args:
+        session: Database session
+        page: Page number, starting at 1
+        
+    Returns:
+        Tuple[int, List[Row]]: The total number of users, and the rows for the
+        page (only the columns the list shows) ordered by name
+    """
+    key = (_users_version, page)
+    cached = _user_list_cache.get(key)
+    if cached and cached[0] > time.monotonic():
+        return cached[1], cached[2]
+    
+    total = session.query(func.count(User.id)).scalar()
+    offset = Pagination(page, USERS_PER_PAGE, total).offset
+    rows = session.execute(
+        select(*_USER_LIST_COLUMNS).order_by(
+            User.last_name, User.first_name, User.id
+        ).limit(USERS_PER_PAGE).offset(offset)
+    ).all()
+    
+    if len(_user_list_cache) >= USER_LIST_CACHE_SIZE:
+        _user_list_cache.clear()
+    _user_list_cache[key] = (time.monotonic() + USER_LIST_CACHE_TIMEOUT, total, rows)
+    return total, rows
+
+
+def parse_user_ids(text: str) -> List[int]:
+    """Parse a comma-separated list of user IDs.
+    
+    The whole string is validated with one regex match, so well-formed input
+    is parsed without a try/except per ID.
+    
+    Args:
+        text: User IDs separated by commas, with optional surrounding spaces
+        
+    Returns:
+        List[int]: The IDs in the order given
+        
+    Raises:
+        ValueError: If any entry is not a number; the message is that entry
+    """
+    if not _USER_ID_LIST_RE.fullmatch(text):
+        invalid = next(
+            (entry.strip() for entry in text.split(',') if not _USER_ID_RE.fullmatch(entry.strip())),
+            text.strip()
+        )
+        raise ValueError(invalid)
+    
+    return [int(user_id) for user_id in _USER_ID_RE.findall(text)]
+
+
+def search_users_by_name(session: Session, name: str) -> List[User]:
+    """Find active users whose first or last name contains the given text.
+    
+    Both names are matched in one query, so each user appears at most once.
+    
+    Args:
+        session: Database session
+        name: Text to look for (case-insensitive, partial match)
+        
+    Returns:
+        List[User]: Up to NAME_SEARCH_LIMIT users ordered by last and first name
+    """
+    pattern = f"%{name.strip()}%"
+    return session.query(User).filter(
+        User.deleted_at.is_(None),
+        or_(User.first_name.ilike(pattern), User.last_name.ilike(pattern))
+    ).order_by(User.last_name, User.first_name).limit(NAME_SEARCH_LIMIT).all()
+
 
 @users_bp.route('/')
 @require_auth
 def list() -> str:
-    """List all users.
+    """List users one page at a time.
+    
+    The page is chosen with the ``page`` query argument; only that page's
+    rows are loaded, with LIMIT/OFFSET, alongside a count for the page links.
+    Pages are cached until a user is changed (see ``invalidate_user_list``).
     
     Returns:
         Rendered user list template.
     """
-    print("DEBUG: Accessing users list route")
-    session = db_manager.get_session()
+    session = db_manager.Session()
     try:
-        users = session.query(User).order_by(User.last_name, User.first_name).all()
-        print(f"DEBUG: Found {len(users)} users")
-        return render_template('users/list.html', users=users)
+        page = get_page_number()
+        total, users = get_user_list_page(session, page)
+        pagination = Pagination(page, USERS_PER_PAGE, total)
+        return render_template('users/list.html', users=users, pagination=pagination)
     except Exception as e:
-        print(f"DEBUG: Error in users list: {e}")
         flash(f'Error loading users: {str(e)}', 'error')
-        return render_template('users/list.html', users=[])
-    finally:
-        session.close()
+        return render_template('users/list.html', users=[], pagination=None)
 
 
 @users_bp.route('/create', methods=['GET', 'POST'])
@@ -48,8 +180,7 @@ def create() -> Union[str, redirect]:
     form = CreateUserForm()
     
     if form.validate_on_submit():
-        # Get database session
-        session = db_manager.get_session()
+        session = db_manager.Session()
         try:
             user = auth_manager.create_user(
                 session,
@@ -63,13 +194,12 @@ def create() -> Union[str, redirect]:
                 tnba_id=form.tnba_id.data
             )
             
+            invalidate_user_list()
             flash(f'User {user.first_name} {user.last_name} created successfully!', 'success')
             return redirect(url_for('users.list'))
             
         except AuthenticationError as e:
             flash(str(e), 'error')
-        finally:
-            session.close()
     
     return render_template('users/create.html', form=form)
 
@@ -85,9 +215,9 @@ def view(user_id: int) -> str:
     Returns:
         Rendered user view template.
     """
-    session = db_manager.get_session()
+    session = db_manager.Session()
     try:
-        user = session.query(User).filter(User.id == user_id).first()
+        user = session.get(User, user_id)
         if not user:
             flash('User not found.', 'error')
             return redirect(url_for('users.list'))
@@ -96,8 +226,6 @@ def view(user_id: int) -> str:
     except Exception as e:
         flash(f'Error loading user: {str(e)}', 'error')
         return redirect(url_for('users.list'))
-    finally:
-        session.close()
 
 
 @users_bp.route('/search', methods=['GET', 'POST'])
@@ -112,7 +240,7 @@ def search() -> Union[str, redirect]:
     users = []
     
     if form.validate_on_submit():
-        session = db_manager.get_session()
+        session = db_manager.Session()
         try:
             search_type = form.search_type.data
             search_value = form.search_value.data
@@ -134,19 +262,13 @@ def search() -> Union[str, redirect]:
                 user = get_profile(session=session, tnba_id=search_value)
                 users = [user] if user else []
             elif search_type == 'name':
-                # Search by name using list_users
-                users = list_users(first=search_value) + list_users(last=search_value)
-                # Remove duplicates
-                seen = set()
-                users = [user for user in users if user.id not in seen and not seen.add(user.id)]
+                users = search_users_by_name(session, search_value)
             
             if not users:
                 flash('No users found matching your search.', 'info')
                 
         except Exception as e:
             flash(f'Error searching users: {str(e)}', 'error')
-        finally:
-            session.close()
     
     return render_template('users/search.html', form=form, users=users)
 
@@ -156,60 +278,67 @@ def search() -> Union[str, redirect]:
 def edit(user_id: int) -> Union[str, redirect]:
     """Edit a user profile.
     
+    A submitted change is written with one versioned UPDATE, without loading
+    the user first; the user is only loaded to render the form.
+    
     Args:
         user_id: ID of the user to edit.
         
     Returns:
         Rendered edit template or redirect to user view.
     """
-    # Get user first to check if it exists
-    session = db_manager.get_session()
-    try:
-        user = get_profile(session=session, user_id=user_id)
-        if not user:
-            flash('User not found.', 'error')
-            return redirect(url_for('users.list'))
-        
-        form = EditProfileForm()
+    session = db_manager.Session()
+    form = EditProfileForm()
+    
+    if form.validate_on_submit():
+        # Only fields with a value are changed
+        update_data = {
+            field: form[field].data for field in EDITABLE_PROFILE_FIELDS if form[field].data
+        }
+        blank = [label for field, label in EDITABLE_PROFILE_FIELDS.items()
+                 if field in update_data and not update_data[field].strip()]
         
-        if form.validate_on_submit():
+        if blank:
+            flash(f'Error updating profile: {blank[0]} cannot be empty', 'error')
+        elif update_data:
             try:
-                # Build update data
-                update_data = {}
-                if form.first_name.data:
-                    update_data['first'] = form.first_name.data
-                if form.last_name.data:
-                    update_data['last'] = form.last_name.data
-                if form.phone.data:
-                    update_data['phone'] = form.phone.data
-                if form.address.data:
-                    update_data['address'] = form.address.data
+                # Bump the version as an ORM update would, so concurrent merges
+                # see the change
+                result = session.execute(
+                    update(User)
+                    .where(User.id == user_id)
+                    .values(version=User.version + 1, **update_data)
+                    .execution_options(synchronize_session=False)
+                )
+                if result.rowcount == 0:
+                    session.rollback()
+                    flash('User not found.', 'error')
+                    return redirect(url_for('users.list'))
+                
+                session.commit()
+                invalidate_user_list()
+                flash('Profile updated successfully!', 'success')
+                return redirect(url_for('users.view', user_id=user_id))
                 
-                if update_data:
-                    success = edit_profile(session=session, user_id=user_id, **update_data)
-                    if success:
-                        session.commit()
-                        flash('Profile updated successfully!', 'success')
-                        return redirect(url_for('users.view', user_id=user_id))
-                    else:
-                        flash('Failed to update profile.', 'error')
-                else:
-                    flash('No changes provided.', 'info')
-                    
             except Exception as e:
                 session.rollback()
                 flash(f'Error updating profile: {str(e)}', 'error')
-        
-        # Pre-populate form with current data
-        if request.method == 'GET':
-            form.first_name.data = user.first_name
-            form.last_name.data = user.last_name
-            form.phone.data = user.phone
-            form.address.data = user.address
-        
-        return render_template('users/edit.html', form=form, user=user)
-    finally:
-        session.close()
+        else:
+            flash('No changes provided.', 'info')
+    
+    user = get_profile(session=session, user_id=user_id)
+    if not user:
+        flash('User not found.', 'error')
+        return redirect(url_for('users.list'))
+    
+    # Pre-populate form with current data
+    if request.method == 'GET':
+        form.first_name.data = user.first_name
+        form.last_name.data = user.last_name
+        form.phone.data = user.phone
+        form.address.data = user.address
+    
+    return render_template('users/edit.html', form=form, user=user)
 
 
 @users_bp.route('/<int:user_id>/delete', methods=['GET', 'POST'])
@@ -224,32 +353,30 @@ def delete(user_id: int) -> Union[str, redirect]:
         Rendered delete template or redirect to user list.
     """
     # Get user first to check if it exists
-    session = db_manager.get_session()
-    try:
-        user = get_profile(session=session, user_id=user_id)
-        if not user:
-            flash('User not found.', 'error')
-            return redirect(url_for('users.list'))
-        
-        form = DeleteProfileForm()
-        
-        if form.validate_on_submit():
-            try:
-                success = delete_profile(session=session, user_id=user_id)
-                if success:
-                    session.commit()
-                    flash(f'User {user.first_name} {user.last_name} deleted successfully!', 'success')
-                    return redirect(url_for('users.list'))
-                else:
-                    flash('Failed to delete user.', 'error')
-                    
-            except Exception as e:
-                session.rollback()
-                flash(f'Error deleting user: {str(e)}', 'error')
-        
-        return render_template('users/delete.html', form=form, user=user)
-    finally:
-        session.close()
+    session = db_manager.Session()
+    user = get_profile(session=session, user_id=user_id)
+    if not user:
+        flash('User not found.', 'error')
+        return redirect(url_for('users.list'))
+    
+    form = DeleteProfileForm()
+    
+    if form.validate_on_submit():
+        try:
+            success = delete_profile(session=session, user_id=user_id)
+            if success:
+                session.commit()
+                invalidate_user_list()
+                flash(f'User {user.first_name} {user.last_name} deleted successfully!', 'success')
+                return redirect(url_for('users.list'))
+            else:
+                flash('Failed to delete user.', 'error')
+                
+        except Exception as e:
+            session.rollback()
+            flash(f'Error deleting user: {str(e)}', 'error')
+    
+    return render_template('users/delete.html', form=form, user=user)
 
 
 @users_bp.route('/merge', methods=['GET', 'POST'])
@@ -263,45 +390,46 @@ def merge() -> Union[str, redirect]:
     form = MergeProfileForm()
     
     if form.validate_on_submit():
-        session = db_manager.get_session()
+        session = db_manager.Session()
         try:
             main_user_id = form.main_user_id.data
             merge_user_ids_str = form.merge_user_ids.data
             
             # Parse comma-separated user IDs
-            merge_user_ids = []
-            for id_str in merge_user_ids_str.split(','):
-                try:
-                    merge_user_ids.append(int(id_str.strip()))
-                except ValueError:
-                    flash(f'Invalid user ID: {id_str.strip()}', 'error')
-                    return render_template('users/merge.html', form=form)
+            try:
+                merge_user_ids = parse_user_ids(merge_user_ids_str)
+            except ValueError as e:
+                flash(f'Invalid user ID: {e}', 'error')
+                return render_template('users/merge.html', form=form)
+            
+            # Fetch the main user and all merge users in one query
+            users_by_id = {
+                user.id: user
+                for user in session.query(User).filter(User.id.in_({main_user_id, *merge_user_ids}))
+            }
             
             # Verify main user exists
-            main_user = get_profile(session=session, user_id=main_user_id)
+            main_user = users_by_id.get(main_user_id)
             if not main_user:
                 flash('Main user not found.', 'error')
                 return render_template('users/merge.html', form=form)
             
-            # Verify merge users exist
-            merge_users = []
-            for merge_id in merge_user_ids:
-                user = get_profile(session=session, user_id=merge_id)
-                if not user:
-                    flash(f'User ID {merge_id} not found.', 'error')
-                    return render_template('users/merge.html', form=form)
-                merge_users.append(user)
+            # Verify merge users exist, reporting every missing ID at once
+            missing_ids = [merge_id for merge_id in merge_user_ids if merge_id not in users_by_id]
+            if missing_ids:
+                plural = 's' if len(missing_ids) > 1 else ''
+                flash(f'User ID{plural} {", ".join(map(str, missing_ids))} not found.', 'error')
+                return render_template('users/merge.html', form=form)
             
             # Perform merge
             merge_profiles(main_user_id, merge_user_ids)
+            invalidate_user_list()
             
             flash(f'Successfully merged {len(merge_user_ids)} profile(s) into {main_user.first_name} {main_user.last_name}!', 'success')
             return redirect(url_for('users.view', user_id=main_user_id))
             
         except Exception as e:
             flash(f'Error merging profiles: {str(e)}', 'error')
-        finally:
-            session.close()
     
     return render_template('users/merge.html', form=form)
 
@@ -318,28 +446,27 @@ def filter() -> str:
     users = []
     
     if form.validate_on_submit():
+        session = db_manager.Session()
         try:
-            # Build filter parameters
-            filters = {}
-            if form.first_name.data:
-                filters['first'] = form.first_name.data
-            if form.last_name.data:
-                filters['last'] = form.last_name.data
-            if form.email.data:
-                filters['email'] = form.email.data
-            if form.phone.data:
-                filters['phone'] = form.phone.data
-            if form.address.data:
-                filters['address'] = form.address.data
-            if form.usbc_id.data:
-                filters['usbc_id'] = form.usbc_id.data
-            if form.tnba_id.data:
-                filters['tnba_id'] = form.tnba_id.data
+            filters = normalize_filters(
+                first=form.first_name.data,
+                last=form.last_name.data,
+                email=form.email.data,
+                phone=form.phone.data,
+                address=form.address.data,
+                usbc_id=form.usbc_id.data,
+                tnba_id=form.tnba_id.data
+            )
             
-            users = list_users(**filters)
+            # One query for all filters, reusing the statement cached for this
+            # combination of filters by the list-users command
+            stmt, params = build_enhanced_user_query(filters)
+            users = session.execute(stmt.limit(FILTER_RESULTS_LIMIT), params).scalars().all()
             
             if not users:
                 flash('No users found matching your filters.', 'info')
+            elif len(users) == FILTER_RESULTS_LIMIT:
+                flash(f'Showing the first {FILTER_RESULTS_LIMIT} matches; refine your filters to see the rest.', 'info')
                 
         except Exception as e:
             flash(f'Error filtering users: {str(e)}', 'error')
@@ -1,8 +1,9 @@
 """Utility functions for the GUI application."""
 
+from dataclasses import dataclass
 from functools import wraps
 from typing import Optional, Callable, Any
-from flask import session, redirect, url_for, flash
+from flask import g, session, redirect, url_for, flash, request
 
 from core.models import User
 from storage.database import db_manager
@@ -11,20 +12,25 @@ from storage.database import db_manager
 def get_current_user() -> Optional[User]:
     """Get the current user from the session.
     
+    The user is looked up once per request and cached on ``flask.g``.
+    
     Returns:
         User object if logged in, None otherwise.
     """
     if 'user_id' not in session:
         return None
     
-    db_session = db_manager.get_session()
+    if 'current_user' in g:
+        return g.current_user
+    
+    db_session = db_manager.Session()
     try:
-        user = db_session.query(User).filter(User.id == session['user_id']).first()
-        return user
+        user = db_session.get(User, session['user_id'])
     except Exception:
         return None
-    finally:
-        db_session.close()
+    
+    g.current_user = user
+    return user
 
 
 def require_auth(f: Callable) -> Callable:
@@ -42,4 +48,42 @@ def require_auth(f: Callable) -> Callable:
             flash('Please log in to access this page.', 'error')
             return redirect(url_for('auth.login'))
         return f(*args, **kwargs)
-    return decorated_function
\ No newline at end of file
+    return decorated_function
+
+
+@dataclass(frozen=True)
+class Pagination:
+    """Position of the current page within a paginated listing."""
+    
+    page: int
+    per_page: int
+    total: int
+    
+    @property
+    def offset(self) -> int:
+        """Number of rows before the current page."""
+        return (self.page - 1) * self.per_page
+    
+    @property
+    def pages(self) -> int:
+        """Total number of pages (at least one, even when empty)."""
+        return max(1, -(-self.total // self.per_page))
+    
+    @property
+    def has_prev(self) -> bool:
+        """Whether there is a page before the current one."""
+        return self.page > 1
+    
+    @property
+    def has_next(self) -> bool:
+        """Whether there is a page after the current one."""
+        return self.page < self.pages
+
+
+def get_page_number() -> int:
+    """Read the requested page number from the query string.
+    
+    Returns:
+        The ``page`` argument, or 1 if it is missing, invalid or below 1.
+    """
+    return max(request.args.get('page', 1, type=int), 1)
@@ -1,15 +1,169 @@
 """Database connection and initialization for the 4th Arrow Tournament Control application."""
 
+import atexit
 import os
-from typing import Optional
+from contextlib import contextmanager
+from typing import FrozenSet, Iterator, Optional, Tuple
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import URL, create_engine, event, make_url
+from sqlalchemy.orm import scoped_session, sessionmaker, Session
+from sqlalchemy.exc import DBAPIError, IntegrityError, OperationalError, SQLAlchemyError
 
 from core.models import Base
 
 
+# SQLSTATEs reported by PostgreSQL (and other standard drivers)
+UNIQUE_VIOLATION_SQLSTATE = "23505"
+FOREIGN_KEY_VIOLATION_SQLSTATE = "23503"
+LOCK_NOT_AVAILABLE_SQLSTATE = "55P03"
+
+# Extended SQLite result codes for uniqueness and foreign key failures
+SQLITE_UNIQUE_ERRORS = frozenset({"SQLITE_CONSTRAINT_UNIQUE", "SQLITE_CONSTRAINT_PRIMARYKEY"})
+SQLITE_FOREIGN_KEY_ERRORS = frozenset({"SQLITE_CONSTRAINT_FOREIGNKEY"})
+
+# SQLite result codes for a database that another connection holds locked
+SQLITE_LOCK_ERRORS = frozenset({"SQLITE_BUSY", "SQLITE_LOCKED"})
+
+
+def _matches_driver_error(
+    error: DBAPIError,
+    sqlite_errors: FrozenSet[str],
+    sqlstate_code: str,
+    keywords: Tuple[str, ...]
+) -> bool:
+    """Classify a database error by driver error code, falling back to its message.
+    
+    Args:
+        error: DBAPIError (e.g. IntegrityError) raised by SQLAlchemy
+        sqlite_errors: Extended SQLite error names that match
+        sqlstate_code: SQLSTATE that matches
+        keywords: Lowercase message fragments that match when no code is available
+        
+    Returns:
+        True if the error matches the given kind
+    """
+    orig = error.orig
+    sqlite_errorname = getattr(orig, "sqlite_errorname", None)
+    if sqlite_errorname is not None:
+        return sqlite_errorname in sqlite_errors
+    
+    sqlstate = getattr(orig, "sqlstate", None) or getattr(orig, "pgcode", None)
+    if sqlstate is not None:
+        return sqlstate == sqlstate_code
+    
+    message = str(orig).lower()
+    return any(keyword in message for keyword in keywords)
+
+
+def is_unique_violation(error: IntegrityError) -> bool:
+    """Check whether an IntegrityError was caused by a unique constraint.
+    
+    Uses the driver's error code where available and only falls back to
+    inspecting the message for drivers that expose neither.
+    
+    Args:
+        error: IntegrityError raised by SQLAlchemy
+        
+    Returns:
+        True if the error is a unique/duplicate key violation
+    """
+    return _matches_driver_error(
+        error, SQLITE_UNIQUE_ERRORS, UNIQUE_VIOLATION_SQLSTATE, ("unique", "duplicate")
+    )
+
+
+def is_foreign_key_violation(error: IntegrityError) -> bool:
+    """Check whether an IntegrityError was caused by a foreign key constraint.
+    
+    Args:
+        error: IntegrityError raised by SQLAlchemy
+        
+    Returns:
+        True if the error references a missing parent row
+    """
+    return _matches_driver_error(
+        error, SQLITE_FOREIGN_KEY_ERRORS, FOREIGN_KEY_VIOLATION_SQLSTATE, ("foreign key",)
+    )
+
+
+def is_lock_not_available(error: OperationalError) -> bool:
+    """Check whether an OperationalError means a row or table lock was not granted.
+    
+    This is what PostgreSQL raises for SELECT ... FOR UPDATE NOWAIT when
+    another transaction holds one of the rows.
+    
+    Args:
+        error: OperationalError raised by SQLAlchemy
+        
+    Returns:
+        True if the statement failed because the lock was held elsewhere
+    """
+    return _matches_driver_error(
+        error, SQLITE_LOCK_ERRORS, LOCK_NOT_AVAILABLE_SQLSTATE,
+        ("could not obtain lock", "database is locked")
+    )
+
+
+# Pragmas applied to every connection to a file-backed SQLite database: WAL
+# lets readers run alongside a writer, and the rest trade a little durability
+# on power loss for fewer fsyncs and a larger in-memory page cache
+SQLITE_FILE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-20000",
+)
+
+# Connection pool sizing for file-backed and server databases
+POOL_SIZE = 10
+POOL_MAX_OVERFLOW = 20
+
+
+def is_in_memory_database(url: URL) -> bool:
+    """Check whether a database URL names an in-memory SQLite database.
+    
+    Both plain ":memory:" databases and named ones opened as URIs with
+    mode=memory (e.g. "sqlite:///file:name?mode=memory&cache=shared&uri=true")
+    count. Each thread gets its own connection to such a database, so it
+    cannot be shared across threads through a pool.
+    
+    Args:
+        url: Database URL
+        
+    Returns:
+        True if the URL is for an in-memory SQLite database
+    """
+    return url.get_backend_name() == "sqlite" and (
+        url.database in (None, "", ":memory:") or url.query.get("mode") == "memory"
+    )
+
+
+def _tune_sqlite_connection(dbapi_connection, connection_record) -> None:
+    """Apply SQLITE_FILE_PRAGMAS to a new SQLite connection.
+    
+    Args:
+        dbapi_connection: Raw DB-API connection being opened
+        connection_record: Pool record for the connection (unused)
+    """
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_FILE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+def _enable_sqlite_foreign_keys(dbapi_connection, connection_record) -> None:
+    """Turn on foreign key enforcement for a new SQLite connection.
+    
+    Args:
+        dbapi_connection: Raw DB-API connection being opened
+        connection_record: Pool record for the connection (unused)
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
 class DatabaseManager:
     """Manages database connections and operations."""
     
@@ -17,13 +171,42 @@ class DatabaseManager:
         """Initialize database manager.
         
         Args:
-            database_url: Database connection URL. Defaults to local SQLite file.
+            database_url: Database connection URL. Defaults to the DATABASE_URL
+                environment variable, falling back to a local SQLite file.
         """
         if database_url is None:
-            database_url = "sqlite:///tournament_control.db"
+            database_url = os.environ.get("DATABASE_URL", "sqlite:///tournament_control.db")
         
-        self.engine = create_engine(database_url)
-        self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        url = make_url(database_url)
+        in_memory = is_in_memory_database(url)
+        if in_memory:
+            # In-memory databases live in a single connection; keep the default pool
+            engine_options = {}
+        else:
+            # Keep warm connections between requests
+            engine_options = {
+                "pool_size": POOL_SIZE,
+                "max_overflow": POOL_MAX_OVERFLOW,
+            }
+            if url.get_backend_name() == "sqlite":
+                # Pooled connections are handed to whichever thread checks them out
+                engine_options["connect_args"] = {"check_same_thread": False}
+        
+        self.engine = create_engine(url, **engine_options)
+        if self.engine.dialect.name == "sqlite":
+            # SQLite leaves foreign keys unenforced unless enabled per connection;
+            # the create commands rely on them to reject rows for missing parents
+            event.listen(self.engine, "connect", _enable_sqlite_foreign_keys)
+            if not in_memory:
+                event.listen(self.engine, "connect", _tune_sqlite_connection)
+        # Keep attributes loaded after commit so returned objects stay usable
+        # without a refresh SELECT (sessions are closed right after most commits)
+        self.SessionLocal = sessionmaker(
+            autocommit=False, autoflush=False, expire_on_commit=False, bind=self.engine
+        )
+        # Thread-local session registry: Session() returns the current session
+        # and Session.remove() closes it once the unit of work is done
+        self.Session = scoped_session(self.SessionLocal)
         
     def create_tables(self) -> None:
         """Create all database tables."""
@@ -40,10 +223,35 @@ class DatabaseManager:
         """
         return self.SessionLocal()
     
+    @contextmanager
+    def session_scope(self) -> Iterator[Session]:
+        """Provide a transactional scope around a series of operations.
+        
+        The session is committed if the block completes, rolled back if it
+        raises (including SystemExit from CLI error paths), and always closed.
+        
+        Yields:
+            SQLAlchemy session object.
+        """
+        session = self.SessionLocal()
+        try:
+            yield session
+            session.commit()
+        except BaseException:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+    
     def close(self) -> None:
         """Close the database connection."""
+        self.Session.remove()
         self.engine.dispose()
 
 
 # Global database manager instance
-db_manager = DatabaseManager()
\ No newline at end of file
+db_manager = DatabaseManager()
+
+# Commands share the thread's scoped session for the life of the process;
+# close it and return its connection to the pool on interpreter exit
+atexit.register(db_manager.Session.remove)
\ No newline at end of file
@@ -0,0 +1,12 @@
+"""Shared pytest configuration for the test suite."""
+
+import os
+
+# Point the test run (and each pytest-xdist worker) at its own shared-cache
+# in-memory SQLite database. This must run before storage.database creates the
+# global db_manager, so tests never contend for, fsync or rewrite the tracked
+# tournament_control.db (opening it would switch its journal mode to WAL).
+_xdist_worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+os.environ["DATABASE_URL"] = (
+    f"sqlite:///file:memdb_{_xdist_worker}?mode=memory&cache=shared&uri=true"
+)
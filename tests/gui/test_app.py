@@ -34,6 +34,13 @@ class TestAppRoutes:
         assert b'Tournaments' in response.data
         assert b'Settings' in response.data
 
+    
+    def test_login_page_writes_nothing_to_stdout(self, client, capsys):
+        """Test that rendering the login page does not print debug output."""
+        response = client.get('/auth/login')
+        assert response.status_code == 200
+        assert capsys.readouterr().out == ''
+
 
 class TestAppUtilities:
     """Test application utility functions."""
@@ -62,4 +69,98 @@ class TestAppUtilities:
         # Try to access protected route
         response = client.get('/users/')
         assert response.status_code == 302
-        assert '/auth/login' in response.location
\ No newline at end of file
+        assert '/auth/login' in response.location
+
+
+class TestCreateApp:
+    """Test the application factory."""
+    
+    def test_create_app_does_not_create_tables_by_default(self):
+        """Test that creating the app does not touch the database schema."""
+        from unittest.mock import patch
+        from src.gui import create_app
+        
+        with patch('src.gui.app.db_manager') as mock_db_manager, \
+                patch('src.gui.config.Config.AUTO_CREATE_TABLES', False):
+            create_app()
+        
+        mock_db_manager.create_tables.assert_not_called()
+    
+    def test_create_app_creates_tables_when_enabled(self):
+        """Test that AUTO_CREATE_TABLES creates missing tables at startup."""
+        from unittest.mock import patch
+        from src.gui import create_app
+        
+        with patch('src.gui.app.db_manager') as mock_db_manager, \
+                patch('src.gui.config.Config.AUTO_CREATE_TABLES', True):
+            create_app()
+        
+        mock_db_manager.create_tables.assert_called_once()
+    
+    def test_db_session_removed_after_request(self, client):
+        """Test that the request-scoped session is closed when the request ends."""
+        from unittest.mock import patch
+        
+        with patch('src.gui.app.db_manager') as mock_db_manager:
+            client.get('/auth/login')
+        
+        mock_db_manager.Session.remove.assert_called()
+    
+    def test_login_uses_request_scoped_session(self, client):
+        """Test that login authenticates with the request-scoped session."""
+        from unittest.mock import patch
+        from core.auth import AuthenticationError
+        
+        with patch('src.gui.auth.db_manager') as mock_db_manager, \
+                patch('src.gui.auth.auth_manager') as mock_auth_manager:
+            mock_auth_manager.authenticate_user.side_effect = AuthenticationError("Invalid email or password")
+            response = client.post('/auth/login', data={'email': 'a@example.com', 'password': 'secret'})
+        
+        assert response.status_code == 200
+        assert mock_auth_manager.authenticate_user.call_args[0][0] is mock_db_manager.Session.return_value
+        mock_db_manager.get_session.assert_not_called()
+
+
+class TestLoginLogging:
+    """Test the structured log record written on successful login."""
+    
+    def _login(self, client):
+        """Log in through the form with a mocked successful authentication."""
+        from unittest.mock import MagicMock, patch
+        
+        user = MagicMock(id=7, first_name="Test", last_name="User")
+        with patch('src.gui.auth.db_manager'), \
+                patch('src.gui.auth.auth_manager') as mock_auth_manager:
+            mock_auth_manager.authenticate_user.return_value = user
+            return client.post('/auth/login', data={'email': 'a@example.com', 'password': 'secret'})
+    
+    def test_successful_login_logged(self, app, client, caplog):
+        """Test a successful login writes one record with user, IP hash and duration."""
+        from src.gui.auth import hash_ip
+        
+        app.config['LOGIN_LOG_SAMPLE_RATE'] = 1.0
+        with caplog.at_level('INFO', logger='src.gui.auth'):
+            response = self._login(client)
+        
+        assert response.status_code == 302
+        records = [r for r in caplog.records if r.name == 'src.gui.auth']
+        assert len(records) == 1
+        assert records[0].getMessage().startswith(
+            f"auth.login ok user_id=7 ip_hash={hash_ip('127.0.0.1')} dt="
+        )
+    
+    def test_login_log_sampled(self, app, client, caplog):
+        """Test logins outside the sample rate are not logged."""
+        app.config['LOGIN_LOG_SAMPLE_RATE'] = 0.0
+        with caplog.at_level('INFO', logger='src.gui.auth'):
+            self._login(client)
+        
+        assert not [r for r in caplog.records if r.name == 'src.gui.auth']
+    
+    def test_hash_ip_hides_address(self):
+        """Test IP hashes are stable and do not contain the address."""
+        from src.gui.auth import hash_ip
+        
+        assert hash_ip('10.0.0.1') == hash_ip('10.0.0.1')
+        assert hash_ip('10.0.0.1') != hash_ip('10.0.0.2')
+        assert '10.0.0.1' not in hash_ip('10.0.0.1')
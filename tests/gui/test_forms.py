@@ -1,7 +1,7 @@
 """Form validation tests."""
 
 import pytest
-from src.gui.forms import LoginForm, CreateUserForm
+from src.gui.forms import LoginForm, CreateUserForm, SearchUserForm, SEARCH_TYPE_CHOICES
 
 
 class TestLoginForm:
@@ -194,4 +194,24 @@ class TestCreateUserForm:
                 'registered_user': False
             })
             assert form.validate() is True
-            assert form.registered_user.data is False
\ No newline at end of file
+            assert form.registered_user.data is False
+
+
+class TestSearchUserForm:
+    """Test search user form validation."""
+    
+    def test_search_form_offers_shared_choices(self, app):
+        """Test every instance offers the module-level search types."""
+        with app.test_request_context():
+            form = SearchUserForm(data={'search_type': 'name', 'search_value': 'Ann'})
+            assert [value for value, _ in form.search_type.choices] == [
+                value for value, _ in SEARCH_TYPE_CHOICES
+            ]
+            assert form.validate() is True
+    
+    def test_search_form_rejects_unknown_type(self, app):
+        """Test a search type outside the choices is rejected."""
+        with app.test_request_context():
+            form = SearchUserForm(data={'search_type': 'password', 'search_value': 'x'})
+            assert form.validate() is False
+            assert 'search_type' in form.errors
@@ -0,0 +1,351 @@
+"""User management route tests."""
+
+import pytest
+from unittest.mock import patch
+
+from core.models import User
+from storage.database import DatabaseManager
+
+
+@pytest.fixture
+def users_db(tmp_path):
+    """Create a database with three users and point the user routes at it."""
+    test_db = DatabaseManager(f"sqlite:///{tmp_path / 'users.db'}")
+    test_db.create_tables()
+    with test_db.session_scope() as session:
+        session.add_all([
+            User(first_name="Cara", last_name="Zimmer"),
+            User(first_name="Abe", last_name="Adams"),
+            User(first_name="Ben", last_name="Adams"),
+        ])
+    
+    from src.gui.users import invalidate_user_list
+    invalidate_user_list()
+    with patch('src.gui.users.db_manager', test_db):
+        yield test_db
+    invalidate_user_list()
+    test_db.close()
+
+
+@pytest.fixture
+def logged_in_client(client):
+    """Create a client whose session is marked as logged in."""
+    with client.session_transaction() as session:
+        session['user_id'] = 1
+        session['user_name'] = "Test User"
+    return client
+
+
+class TestUserListRoute:
+    """Test the paginated user list."""
+    
+    def test_first_page_limited(self, logged_in_client, users_db):
+        """Test only one page of users is rendered, in name order."""
+        with patch('src.gui.users.USERS_PER_PAGE', 2):
+            response = logged_in_client.get('/users/')
+        
+        assert response.status_code == 200
+        assert b'Abe Adams' in response.data
+        assert b'Ben Adams' in response.data
+        assert b'Cara Zimmer' not in response.data
+        assert b'Page 1 of 2 (3 users)' in response.data
+        assert b'/users/?page=2' in response.data
+    
+    def test_later_page(self, logged_in_client, users_db):
+        """Test the page argument selects the matching slice of users."""
+        with patch('src.gui.users.USERS_PER_PAGE', 2):
+            response = logged_in_client.get('/users/?page=2')
+        
+        assert b'Cara Zimmer' in response.data
+        assert b'Abe Adams' not in response.data
+        assert b'/users/?page=1' in response.data
+    
+    def test_single_page_has_no_links(self, logged_in_client, users_db):
+        """Test the page links are hidden when everything fits on one page."""
+        response = logged_in_client.get('/users/?page=0')
+        
+        assert b'Cara Zimmer' in response.data
+        assert b'class="pagination"' not in response.data
+
+
+class TestUserListCache:
+    """Test caching of user list pages."""
+    
+    @staticmethod
+    def _count_selects(users_db):
+        """Record SELECT statements run against the test database."""
+        from sqlalchemy import event
+        
+        statements = []
+        event.listen(users_db.engine, 'before_cursor_execute',
+                     lambda conn, cursor, statement, *args: statements.append(statement))
+        return lambda: len([s for s in statements if s.lstrip().upper().startswith("SELECT")])
+    
+    def test_repeat_request_served_from_cache(self, logged_in_client, users_db):
+        """Test a second request for the same page runs no queries."""
+        logged_in_client.get('/users/')
+        count_selects = self._count_selects(users_db)
+        response = logged_in_client.get('/users/')
+        
+        assert b'Cara Zimmer' in response.data
+        assert count_selects() == 0
+    
+    def test_pages_cached_separately(self, logged_in_client, users_db):
+        """Test each page number has its own cache entry."""
+        with patch('src.gui.users.USERS_PER_PAGE', 2):
+            logged_in_client.get('/users/')
+            response = logged_in_client.get('/users/?page=2')
+        
+        assert b'Cara Zimmer' in response.data
+        assert b'Abe Adams' not in response.data
+    
+    def test_edit_invalidates_cache(self, logged_in_client, users_db):
+        """Test editing a user shows the change on the next list."""
+        logged_in_client.get('/users/')
+        logged_in_client.post('/users/1/edit', data={'first_name': 'Carla'})
+        response = logged_in_client.get('/users/')
+        
+        assert b'Carla Zimmer' in response.data
+    
+    def test_expired_entry_reloaded(self, logged_in_client, users_db):
+        """Test a page is reloaded once its cache entry times out."""
+        with patch('src.gui.users.USER_LIST_CACHE_TIMEOUT', 0):
+            logged_in_client.get('/users/')
+            count_selects = self._count_selects(users_db)
+            logged_in_client.get('/users/')
+        
+        assert count_selects() == 2
+
+
+class TestPagination:
+    """Test the Pagination helper."""
+    
+    def test_page_math(self):
+        """Test offsets, page counts and neighbours."""
+        from src.gui.utils import Pagination
+        
+        pagination = Pagination(page=2, per_page=10, total=25)
+        
+        assert pagination.offset == 10
+        assert pagination.pages == 3
+        assert pagination.has_prev and pagination.has_next
+        assert not Pagination(page=3, per_page=10, total=25).has_next
+    
+    def test_empty_listing_has_one_page(self):
+        """Test an empty listing still reports a single page."""
+        from src.gui.utils import Pagination
+        
+        assert Pagination(page=1, per_page=10, total=0).pages == 1
+
+
+class TestRequestScopedSession:
+    """Test that user routes share the request-scoped session."""
+    
+    def test_view_uses_scoped_session(self, logged_in_client, users_db):
+        """Test a view is served without opening a separate session."""
+        with patch.object(users_db, 'get_session', side_effect=AssertionError("separate session")):
+            response = logged_in_client.get('/users/1')
+        
+        assert response.status_code == 200
+        assert b'Cara' in response.data
+    
+    def test_current_user_shares_scoped_session(self, app):
+        """Test get_current_user reads through the request-scoped session."""
+        from src.gui.utils import get_current_user
+        
+        with patch('src.gui.utils.db_manager') as mock_db_manager:
+            with app.test_request_context():
+                from flask import session
+                session['user_id'] = 1
+                get_current_user()
+        
+        mock_db_manager.Session.assert_called_once_with()
+        mock_db_manager.get_session.assert_not_called()
+
+
+class TestCurrentUserCache:
+    """Test caching of the current user on flask.g."""
+    
+    def test_user_looked_up_once_per_request(self, app):
+        """Test repeated calls in one request reuse the first lookup."""
+        from src.gui.utils import get_current_user
+        
+        with patch('src.gui.utils.db_manager') as mock_db_manager:
+            mock_session = mock_db_manager.Session.return_value
+            with app.test_request_context():
+                from flask import session
+                session['user_id'] = 5
+                first = get_current_user()
+                second = get_current_user()
+        
+        assert first is second is mock_session.get.return_value
+        mock_session.get.assert_called_once_with(User, 5)
+    
+    def test_logout_clears_cached_user(self, app):
+        """Test logging out drops the cached user for the rest of the request."""
+        from flask import g
+        from src.gui.auth import logout
+        
+        with app.test_request_context('/auth/logout'):
+            g.current_user = object()
+            logout()
+            assert 'current_user' not in g
+
+
+class TestSearchUsersByName:
+    """Test searching users by first or last name."""
+    
+    def test_matches_either_name_once(self, users_db):
+        """Test users matching on both names are returned once, in name order."""
+        from src.gui.users import search_users_by_name
+        
+        with users_db.session_scope() as session:
+            names = [(u.first_name, u.last_name) for u in search_users_by_name(session, " a ")]
+        
+        assert names == [("Abe", "Adams"), ("Ben", "Adams"), ("Cara", "Zimmer")]
+    
+    def test_deleted_users_excluded(self, users_db):
+        """Test soft-deleted users are not found."""
+        from src.gui.users import search_users_by_name
+        
+        with users_db.session_scope() as session:
+            session.query(User).filter(User.first_name == "Abe").one().soft_delete()
+        with users_db.session_scope() as session:
+            names = [u.first_name for u in search_users_by_name(session, "adams")]
+        
+        assert names == ["Ben"]
+    
+    def test_search_runs_one_query(self, users_db):
+        """Test a name search issues a single SELECT."""
+        from sqlalchemy import event
+        from src.gui.users import search_users_by_name
+        
+        statements = []
+        event.listen(users_db.engine, 'before_cursor_execute',
+                     lambda conn, cursor, statement, *args: statements.append(statement))
+        with users_db.session_scope() as session:
+            search_users_by_name(session, "Ben")
+        
+        assert len([s for s in statements if s.lstrip().upper().startswith("SELECT")]) == 1
+
+
+class TestParseUserIds:
+    """Test parsing of comma-separated user IDs."""
+    
+    def test_valid_list(self):
+        """Test IDs are returned in order, ignoring surrounding spaces."""
+        from src.gui.users import parse_user_ids
+        
+        assert parse_user_ids(" 3, 10 ,7") == [3, 10, 7]
+        assert parse_user_ids("42") == [42]
+    
+    @pytest.mark.parametrize("text,invalid", [
+        ("1, abc, 3", "abc"),
+        ("1,,2", ""),
+        ("1, -2", "-2"),
+        ("1 2", "1 2"),
+    ])
+    def test_invalid_entry_reported(self, text, invalid):
+        """Test the first invalid entry is named in the error."""
+        from src.gui.users import parse_user_ids
+        
+        with pytest.raises(ValueError) as exc_info:
+            parse_user_ids(text)
+        
+        assert str(exc_info.value) == invalid
+
+
+class TestMergeRoute:
+    """Test the merge form handling."""
+    
+    def test_users_verified_in_one_query(self, logged_in_client, users_db):
+        """Test the main and merge users are looked up with a single SELECT."""
+        from sqlalchemy import event
+        
+        statements = []
+        event.listen(users_db.engine, 'before_cursor_execute',
+                     lambda conn, cursor, statement, *args: statements.append(statement))
+        with patch('src.gui.users.merge_profiles') as mock_merge:
+            response = logged_in_client.post('/users/merge', data={
+                'main_user_id': 2, 'merge_user_ids': '3, 1'
+            })
+        
+        assert response.status_code == 302
+        mock_merge.assert_called_once_with(2, [3, 1])
+        assert len([s for s in statements if s.lstrip().upper().startswith("SELECT")]) == 1
+    
+    def test_missing_merge_users_reported(self, logged_in_client, users_db):
+        """Test every missing merge user is named in one message."""
+        with patch('src.gui.users.merge_profiles') as mock_merge:
+            response = logged_in_client.post('/users/merge', data={
+                'main_user_id': 1, 'merge_user_ids': '98, 2, 99'
+            })
+        
+        assert b'User IDs 98, 99 not found.' in response.data
+        mock_merge.assert_not_called()
+
+
+class TestFilterRoute:
+    """Test the advanced user filter form."""
+    
+    def test_filters_in_one_query(self, logged_in_client, users_db):
+        """Test matching users are found with a single SELECT."""
+        from sqlalchemy import event
+        
+        statements = []
+        event.listen(users_db.engine, 'before_cursor_execute',
+                     lambda conn, cursor, statement, *args: statements.append(statement))
+        response = logged_in_client.post('/users/filter', data={'last_name': ' adams '})
+        
+        assert b'Abe Adams' in response.data
+        assert b'Ben Adams' in response.data
+        assert b'Cara Zimmer' not in response.data
+        assert len([s for s in statements if s.lstrip().upper().startswith("SELECT")]) == 1
+    
+    def test_results_limited(self, logged_in_client, users_db):
+        """Test results stop at the limit and the user is told to refine them."""
+        with patch('src.gui.users.FILTER_RESULTS_LIMIT', 1):
+            response = logged_in_client.post('/users/filter', data={'last_name': 'adams'})
+        
+        assert b'Filter Results (1 found)' in response.data
+        assert b'Showing the first 1 matches' in response.data
+
+
+class TestEditRoute:
+    """Test saving profile edits."""
+    
+    @staticmethod
+    def _record_statements(users_db):
+        """Record the SQL statements run against the test database."""
+        from sqlalchemy import event
+        
+        statements = []
+        event.listen(users_db.engine, 'before_cursor_execute',
+                     lambda conn, cursor, statement, *args: statements.append(statement))
+        return statements
+    
+    def test_save_is_one_update(self, logged_in_client, users_db):
+        """Test a save runs a single UPDATE without loading the user."""
+        statements = self._record_statements(users_db)
+        response = logged_in_client.post('/users/2/edit', data={'first_name': 'Abel', 'phone': ''})
+        
+        assert response.status_code == 302
+        assert [s.split()[0].upper() for s in statements] == ["UPDATE"]
+        with users_db.session_scope() as session:
+            user = session.get(User, 2)
+            assert (user.first_name, user.last_name, user.version) == ("Abel", "Adams", 2)
+    
+    def test_missing_user(self, logged_in_client, users_db):
+        """Test saving a user that does not exist redirects to the list."""
+        response = logged_in_client.post('/users/99/edit', data={'first_name': 'Nobody'})
+        
+        assert response.status_code == 302
+        assert response.location.endswith('/users/')
+    
+    def test_blank_field_rejected(self, logged_in_client, users_db):
+        """Test a whitespace-only value is rejected and nothing is written."""
+        response = logged_in_client.post('/users/2/edit', data={'last_name': '   '})
+        
+        assert b'Last name cannot be empty' in response.data
+        with users_db.session_scope() as session:
+            assert session.get(User, 2).last_name == "Adams"
@@ -54,7 +54,7 @@ class TestCLICommands:
         assert "--member" in result.output  # Legacy flag should be shown
     
     @patch('main.auth_manager.create_user')
-    @patch('main.db_manager.get_session')
+    @patch('main.db_manager.Session')
     def test_signup_command_success(self, mock_get_session, mock_create_user):
         """Test successful signup command."""
         # Mock session and user creation
@@ -90,7 +90,7 @@ class TestCLICommands:
         assert call_args.kwargs['last_name'] == 'User'
     
     @patch('main.auth_manager.authenticate_user')
-    @patch('main.db_manager.get_session')
+    @patch('main.db_manager.Session')
     def test_login_command_success(self, mock_get_session, mock_authenticate_user):
         """Test successful login command."""
         # Mock session and authentication
@@ -248,4 +248,14 @@ class TestCLIIntegration:
             result = runner.invoke(cli, ['--help'])
             
             assert result.exit_code == 0
-            mock_create_tables.assert_called_once()
\ No newline at end of file
+            mock_create_tables.assert_called_once()
+    
+    def test_cli_subcommand_help_skips_database_initialization(self):
+        """Test that subcommand help does not touch the database."""
+        runner = CliRunner()
+        
+        with patch('main.db_manager.create_tables') as mock_create_tables:
+            result = runner.invoke(cli, ['add-org-user', '--help'])
+            
+            assert result.exit_code == 0
+            mock_create_tables.assert_not_called()
\ No newline at end of file
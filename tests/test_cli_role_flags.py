@@ -157,21 +157,17 @@ class TestCliRoleFlags:
 class TestCliIntegration:
     """Integration tests for CLI role flags with actual database."""
     
-    @patch('storage.database.db_manager.get_session')
-    def test_member_flag_integration(self, mock_get_session):
+    @patch('storage.database.db_manager.SessionLocal')
+    def test_member_flag_integration(self, mock_session_local):
         """Integration test for --member flag with mocked database."""
         runner = CliRunner()
         
         # Mock session and query
         mock_session = MagicMock()
-        mock_get_session.return_value = mock_session
+        mock_session_local.return_value = mock_session
         
-        # Mock query chain
-        mock_query = MagicMock()
-        mock_session.query.return_value = mock_query
-        mock_query.filter.return_value = mock_query
-        mock_query.order_by.return_value = mock_query
-        mock_query.all.return_value = []
+        # Mock statement result
+        mock_session.execute.return_value.all.return_value = []
         
         with warnings.catch_warnings(record=True) as w:
             warnings.simplefilter("always")
@@ -186,5 +182,5 @@ class TestCliIntegration:
             assert issubclass(w[0].category, DeprecationWarning)
             
             # Should have called database
-            assert mock_session.query.called
+            assert mock_session.execute.called
             assert mock_session.close.called
\ No newline at end of file
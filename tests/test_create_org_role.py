@@ -3,13 +3,13 @@
 import pytest
 from unittest.mock import Mock, patch
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from src.commands.create_org_role import (
     create_org_role,
     validate_role_name,
     parse_permissions_list,
-    check_organization_exists,
-    check_role_exists_in_org,
+    check_organization_and_role_exist,
     validate_permissions_exist_in_org,
     create_org_role_command
 )
@@ -101,76 +101,50 @@ class TestParsePermissionsList:
         """Test parsing handles mixed whitespace scenarios."""
         result = parse_permissions_list("Create Tournament, , Edit Scores,  ,View Reports")
         assert result == ["Create Tournament", "Edit Scores", "View Reports"]
+    
+    def test_parse_permissions_removes_duplicates_case_insensitively(self):
+        """Test parsing keeps the first spelling of repeated permission names."""
+        result = parse_permissions_list("Edit,EDIT, edit ,View,view")
+        assert result == ["Edit", "View"]
 
 
-class TestCheckOrganizationExists:
-    """Test organization existence checking."""
+class TestCheckOrganizationAndRoleExist:
+    """Test combined organization and role existence check."""
     
-    def test_check_organization_exists_true(self):
-        """Test returns True when organization exists."""
+    def test_check_organization_and_role_exist_single_query(self):
+        """Test both flags come back from one statement."""
         mock_session = Mock()
-        mock_query = Mock()
-        mock_filter = Mock()
-        mock_organization = Mock(spec=Organization)
-        
-        mock_session.query.return_value = mock_query
-        mock_query.filter.return_value = mock_filter
-        mock_filter.first.return_value = mock_organization
+        mock_session.execute.return_value.one.return_value = (1, 0)
         
-        result = check_organization_exists(mock_session, 1)
+        result = check_organization_and_role_exist(mock_session, 1, "Test Role")
         
-        assert result is True
-        mock_session.query.assert_called_once_with(Organization)
+        assert result == (True, False)
+        mock_session.execute.assert_called_once()
+        mock_session.query.assert_not_called()
     
-    def test_check_organization_exists_false(self):
-        """Test returns False when organization doesn't exist."""
+    def test_check_organization_and_role_exist_uses_cached_lambda_statement(self):
+        """Test the check is issued as a cacheable lambda statement."""
         mock_session = Mock()
-        mock_query = Mock()
-        mock_filter = Mock()
+        mock_session.execute.return_value.one.return_value = (1, 0)
         
-        mock_session.query.return_value = mock_query
-        mock_query.filter.return_value = mock_filter
-        mock_filter.first.return_value = None
+        check_organization_and_role_exist(mock_session, 1, "Test")
         
-        result = check_organization_exists(mock_session, 999)
-        
-        assert result is False
-        mock_session.query.assert_called_once_with(Organization)
-
-
-class TestCheckRoleExistsInOrg:
-    """Test role existence checking within organization."""
+        stmt = mock_session.execute.call_args[0][0]
+        assert isinstance(stmt, StatementLambdaElement)
     
-    def test_check_role_exists_in_org_true(self):
-        """Test returns True when role exists in organization."""
+    def test_check_organization_and_role_exist_duplicate(self):
+        """Test an existing role is reported."""
         mock_session = Mock()
-        mock_query = Mock()
-        mock_filter = Mock()
-        mock_role = Mock(spec=Role)
-        
-        mock_session.query.return_value = mock_query
-        mock_query.filter.return_value = mock_filter
-        mock_filter.first.return_value = mock_role
-        
-        result = check_role_exists_in_org(mock_session, "Tournament Director", 1)
+        mock_session.execute.return_value.one.return_value = (1, 1)
         
-        assert result is True
-        mock_session.query.assert_called_once_with(Role)
+        assert check_organization_and_role_exist(mock_session, 1, "Test Role") == (True, True)
     
-    def test_check_role_exists_in_org_false(self):
-        """Test returns False when role doesn't exist in organization."""
+    def test_check_organization_and_role_exist_organization_missing(self):
+        """Test a missing organization is reported."""
         mock_session = Mock()
-        mock_query = Mock()
-        mock_filter = Mock()
+        mock_session.execute.return_value.one.return_value = (0, 0)
         
-        mock_session.query.return_value = mock_query
-        mock_query.filter.return_value = mock_filter
-        mock_filter.first.return_value = None
-        
-        result = check_role_exists_in_org(mock_session, "NonExistent Role", 1)
-        
-        assert result is False
-        mock_session.query.assert_called_once_with(Role)
+        assert check_organization_and_role_exist(mock_session, 999, "Test Role") == (False, False)
 
 
 class TestValidatePermissionsExistInOrg:
@@ -181,51 +155,70 @@ class TestValidatePermissionsExistInOrg:
         mock_session = Mock()
         result = validate_permissions_exist_in_org(mock_session, [], 1)
         assert result == []
+        mock_session.query.assert_not_called()
     
     def test_validate_permissions_exist_single_permission(self):
         """Test validation with single existing permission."""
         mock_session = Mock()
-        mock_query = Mock()
-        mock_filter = Mock()
         mock_permission = Mock(spec=Permission)
-        
-        mock_session.query.return_value = mock_query
-        mock_query.filter.return_value = mock_filter
-        mock_filter.first.return_value = mock_permission
+        mock_permission.name = "Create Tournament"
+        mock_session.query.return_value.outerjoin.return_value.filter.return_value.all.return_value = [
+            (1, mock_permission)
+        ]
         
         result = validate_permissions_exist_in_org(mock_session, ["Create Tournament"], 1)
         
         assert result == [mock_permission]
-        mock_session.query.assert_called_once_with(Permission)
+        mock_session.query.assert_called_once_with(Organization.id, Permission)
     
     def test_validate_permissions_exist_multiple_permissions(self):
-        """Test validation with multiple existing permissions."""
+        """Test validation with multiple permissions uses a single query."""
         mock_session = Mock()
-        mock_query = Mock()
-        mock_filter = Mock()
         mock_perm1 = Mock(spec=Permission)
+        mock_perm1.name = "Create Tournament"
         mock_perm2 = Mock(spec=Permission)
-        
-        mock_session.query.return_value = mock_query
-        mock_query.filter.return_value = mock_filter
-        mock_filter.first.side_effect = [mock_perm1, mock_perm2]
+        mock_perm2.name = "Edit Scores"
+        mock_session.query.return_value.outerjoin.return_value.filter.return_value.all.return_value = [
+            (1, mock_perm2), (1, mock_perm1)
+        ]
         
         result = validate_permissions_exist_in_org(
             mock_session, ["Create Tournament", "Edit Scores"], 1
         )
         
+        # Results follow the requested order, not the row order
         assert result == [mock_perm1, mock_perm2]
-        assert mock_session.query.call_count == 2
+        assert mock_session.query.call_count == 1
+    
+    def test_validate_permissions_exist_case_insensitive(self):
+        """Test permission names are matched case-insensitively."""
+        mock_session = Mock()
+        mock_permission = Mock(spec=Permission)
+        mock_permission.name = "Edit Scores"
+        mock_session.query.return_value.outerjoin.return_value.filter.return_value.all.return_value = [
+            (1, mock_permission)
+        ]
+        
+        result = validate_permissions_exist_in_org(mock_session, ["EDIT SCORES"], 1)
+        
+        assert result == [mock_permission]
+    
+    def test_validate_permissions_exist_organization_not_found_raises_exception(self):
+        """Test validation reports a missing organization from the same query."""
+        mock_session = Mock()
+        mock_session.query.return_value.outerjoin.return_value.filter.return_value.all.return_value = []
+        
+        with pytest.raises(click.ClickException, match="Organization not found"):
+            validate_permissions_exist_in_org(mock_session, ["Create Tournament"], 999)
+        
+        assert mock_session.query.call_count == 1
     
     def test_validate_permissions_exist_permission_not_found_raises_exception(self):
         """Test validation raises exception when permission doesn't exist."""
         mock_session = Mock()
-        mock_query = Mock()
-        mock_filter = Mock()
-        
-        mock_session.query.return_value = mock_query
-        mock_query.filter.return_value = mock_filter
-        mock_filter.first.return_value = None
+        mock_session.query.return_value.outerjoin.return_value.filter.return_value.all.return_value = [
+            (1, None)
+        ]
         
         with pytest.raises(click.ClickException, match="Permission 'NonExistent' not found in organization"):
             validate_permissions_exist_in_org(mock_session, ["NonExistent"], 1)
@@ -233,13 +226,11 @@ class TestValidatePermissionsExistInOrg:
     def test_validate_permissions_exist_partial_failure_raises_exception(self):
         """Test validation raises exception on first missing permission."""
         mock_session = Mock()
-        mock_query = Mock()
-        mock_filter = Mock()
         mock_permission = Mock(spec=Permission)
-        
-        mock_session.query.return_value = mock_query
-        mock_query.filter.return_value = mock_filter
-        mock_filter.first.side_effect = [mock_permission, None]
+        mock_permission.name = "Existing"
+        mock_session.query.return_value.outerjoin.return_value.filter.return_value.all.return_value = [
+            (1, mock_permission)
+        ]
         
         with pytest.raises(click.ClickException, match="Permission 'Missing' not found in organization"):
             validate_permissions_exist_in_org(
@@ -254,28 +245,8 @@ class TestCreateOrgRole:
     def test_create_org_role_success_minimal(self, mock_db_manager):
         """Test successful role creation with minimal data."""
         mock_session = Mock()
-        mock_db_manager.get_session.return_value = mock_session
-        
-        # Mock organization exists
-        mock_org_query = Mock()
-        mock_org_filter = Mock()
-        mock_organization = Mock(spec=Organization)
-        
-        # Mock role doesn't exist
-        mock_role_query = Mock()
-        mock_role_filter = Mock()
-        
-        def query_side_effect(model):
-            if model == Organization:
-                mock_org_query.filter.return_value = mock_org_filter
-                mock_org_filter.first.return_value = mock_organization
-                return mock_org_query
-            elif model == Role:
-                mock_role_query.filter.return_value = mock_role_filter
-                mock_role_filter.first.return_value = None
-                return mock_role_query
-        
-        mock_session.query.side_effect = query_side_effect
+        mock_db_manager.session_scope.return_value.__enter__.return_value = mock_session
+        mock_session.execute.return_value.one.return_value = (1, 0)  # Organization found, name free
         
         result = create_org_role(1, "Tournament Director")
         
@@ -286,47 +257,28 @@ class TestCreateOrgRole:
         
         # Verify database operations
         mock_session.add.assert_called_once()
+        mock_session.execute.assert_called_once()  # One combined pre-check
         assert mock_session.commit.call_count == 1  # Only one commit for role creation
-        mock_session.close.assert_called_once()
+        mock_session.refresh.assert_not_called()
+        mock_db_manager.session_scope.return_value.__exit__.assert_called_once()
     
     @patch('src.commands.create_org_role.db_manager')
     def test_create_org_role_success_with_permissions(self, mock_db_manager):
         """Test successful role creation with permissions."""
         mock_session = Mock()
-        mock_db_manager.get_session.return_value = mock_session
-        
-        # Mock organization exists
-        mock_org_query = Mock()
-        mock_org_filter = Mock()
-        mock_organization = Mock(spec=Organization)
-        
-        # Mock role doesn't exist
-        mock_role_query = Mock()
-        mock_role_filter = Mock()
+        mock_db_manager.session_scope.return_value.__enter__.return_value = mock_session
+        mock_session.execute.return_value.one.return_value = (1, 0)  # Organization found, name free
         
         # Mock permissions exist
-        mock_perm_query = Mock()
-        mock_perm_filter = Mock()
         mock_perm1 = Mock(spec=Permission)
         mock_perm1.id = 1
+        mock_perm1.name = "Create Tournament"
         mock_perm2 = Mock(spec=Permission)
         mock_perm2.id = 2
-        
-        def query_side_effect(model):
-            if model == Organization:
-                mock_org_query.filter.return_value = mock_org_filter
-                mock_org_filter.first.return_value = mock_organization
-                return mock_org_query
-            elif model == Role:
-                mock_role_query.filter.return_value = mock_role_filter
-                mock_role_filter.first.return_value = None
-                return mock_role_query
-            elif model == Permission:
-                mock_perm_query.filter.return_value = mock_perm_filter
-                mock_perm_filter.first.side_effect = [mock_perm1, mock_perm2]
-                return mock_perm_query
-        
-        mock_session.query.side_effect = query_side_effect
+        mock_perm2.name = "Edit Scores"
+        mock_session.query.return_value.outerjoin.return_value.filter.return_value.all.return_value = [
+            (1, mock_perm1), (1, mock_perm2)
+        ]
         
         # Mock role ID after creation
         def add_side_effect(obj):
@@ -342,37 +294,24 @@ class TestCreateOrgRole:
         assert result.name == "Score Keeper"
         assert result.organization_id == 1
         
-        # Verify database operations - role + 2 permissions
-        assert mock_session.add.call_count == 3  # 1 role + 2 role_permissions
-        assert mock_session.commit.call_count == 2  # 1 for role, 1 for permissions
-        mock_session.close.assert_called_once()
+        # Verify database operations - role added, permissions bulk-inserted
+        mock_session.add.assert_called_once()
+        insert_stmt, rows = mock_session.execute.call_args[0]
+        assert insert_stmt.table.name == "role_permissions"
+        assert rows == [
+            {"role_id": 10, "permission_id": 1},
+            {"role_id": 10, "permission_id": 2},
+        ]
+        mock_session.flush.assert_called_once()
+        assert mock_session.commit.call_count == 1  # Role and permissions commit together
+        mock_db_manager.session_scope.return_value.__exit__.assert_called_once()
     
     @patch('src.commands.create_org_role.db_manager')
     def test_create_org_role_trims_whitespace(self, mock_db_manager):
         """Test role creation trims whitespace from fields."""
         mock_session = Mock()
-        mock_db_manager.get_session.return_value = mock_session
-        
-        # Mock organization exists
-        mock_org_query = Mock()
-        mock_org_filter = Mock()
-        mock_organization = Mock(spec=Organization)
-        
-        # Mock role doesn't exist
-        mock_role_query = Mock()
-        mock_role_filter = Mock()
-        
-        def query_side_effect(model):
-            if model == Organization:
-                mock_org_query.filter.return_value = mock_org_filter
-                mock_org_filter.first.return_value = mock_organization
-                return mock_org_query
-            elif model == Role:
-                mock_role_query.filter.return_value = mock_role_filter
-                mock_role_filter.first.return_value = None
-                return mock_role_query
-        
-        mock_session.query.side_effect = query_side_effect
+        mock_db_manager.session_scope.return_value.__enter__.return_value = mock_session
+        mock_session.execute.return_value.one.return_value = (1, 0)  # Organization found, name free
         
         result = create_org_role(1, "  Tournament Director  ")
         
@@ -383,122 +322,61 @@ class TestCreateOrgRole:
     def test_create_org_role_organization_not_found_raises_exception(self, mock_db_manager):
         """Test organization not found raises ClickException."""
         mock_session = Mock()
-        mock_db_manager.get_session.return_value = mock_session
+        mock_db_manager.session_scope.return_value.__enter__.return_value = mock_session
         
-        # Mock organization doesn't exist
-        mock_query = Mock()
-        mock_filter = Mock()
-        mock_session.query.return_value = mock_query
-        mock_query.filter.return_value = mock_filter
-        mock_filter.first.return_value = None
+        # Mock the pre-check finding no organization
+        mock_session.execute.return_value.one.return_value = (False, False)
         
         with pytest.raises(click.ClickException, match="Organization not found"):
             create_org_role(999, "Test Role")
         
-        # Verify session was closed
-        mock_session.close.assert_called_once()
+        # Verify nothing was inserted
+        mock_session.add.assert_not_called()
+        mock_db_manager.session_scope.return_value.__exit__.assert_called_once()
     
     @patch('src.commands.create_org_role.db_manager')
     def test_create_org_role_duplicate_name_raises_exception(self, mock_db_manager):
         """Test duplicate role name raises ClickException."""
         mock_session = Mock()
-        mock_db_manager.get_session.return_value = mock_session
-        
-        # Mock organization exists
-        mock_org_query = Mock()
-        mock_org_filter = Mock()
-        mock_organization = Mock(spec=Organization)
-        
-        # Mock role exists
-        mock_role_query = Mock()
-        mock_role_filter = Mock()
-        mock_existing_role = Mock(spec=Role)
-        
-        def query_side_effect(model):
-            if model == Organization:
-                mock_org_query.filter.return_value = mock_org_filter
-                mock_org_filter.first.return_value = mock_organization
-                return mock_org_query
-            elif model == Role:
-                mock_role_query.filter.return_value = mock_role_filter
-                mock_role_filter.first.return_value = mock_existing_role
-                return mock_role_query
-        
-        mock_session.query.side_effect = query_side_effect
+        mock_db_manager.session_scope.return_value.__enter__.return_value = mock_session
+        
+        # Mock a concurrent insert: the pre-check passes, the unique index
+        # rejects the insert, and the follow-up check finds the role
+        mock_session.flush.side_effect = IntegrityError("statement", "params", "UNIQUE constraint failed: index 'ix_role_org_lower_name'")
+        mock_session.execute.return_value.one.side_effect = [(True, False), (True, True)]
         
         with pytest.raises(click.ClickException, match="Role with this name already exists in the organization"):
             create_org_role(1, "Existing Role")
         
-        # Verify session was closed
-        mock_session.close.assert_called_once()
+        # Verify the role was not committed
+        assert mock_db_manager.session_scope.return_value.__exit__.call_count == 2
     
     @patch('src.commands.create_org_role.db_manager')
     def test_create_org_role_permission_not_found_raises_exception(self, mock_db_manager):
         """Test missing permission raises ClickException."""
         mock_session = Mock()
-        mock_db_manager.get_session.return_value = mock_session
-        
-        # Mock organization exists
-        mock_org_query = Mock()
-        mock_org_filter = Mock()
-        mock_organization = Mock(spec=Organization)
-        
-        # Mock role doesn't exist
-        mock_role_query = Mock()
-        mock_role_filter = Mock()
-        
-        # Mock permission doesn't exist
-        mock_perm_query = Mock()
-        mock_perm_filter = Mock()
-        
-        def query_side_effect(model):
-            if model == Organization:
-                mock_org_query.filter.return_value = mock_org_filter
-                mock_org_filter.first.return_value = mock_organization
-                return mock_org_query
-            elif model == Role:
-                mock_role_query.filter.return_value = mock_role_filter
-                mock_role_filter.first.return_value = None
-                return mock_role_query
-            elif model == Permission:
-                mock_perm_query.filter.return_value = mock_perm_filter
-                mock_perm_filter.first.return_value = None
-                return mock_perm_query
-        
-        mock_session.query.side_effect = query_side_effect
+        mock_db_manager.session_scope.return_value.__enter__.return_value = mock_session
+        mock_session.execute.return_value.one.return_value = (1, 0)  # Organization found, name free
+        
+        # Mock organization exists but permission doesn't
+        mock_session.query.return_value.outerjoin.return_value.filter.return_value.all.return_value = [
+            (1, None)
+        ]
         
         with pytest.raises(click.ClickException, match="Permission 'NonExistent' not found in organization"):
             create_org_role(1, "Test Role", "NonExistent")
         
         # Verify session was closed
-        mock_session.close.assert_called_once()
+        mock_db_manager.session_scope.return_value.__exit__.assert_called_once()
     
     @patch('src.commands.create_org_role.db_manager')
     def test_create_org_role_duplicate_name_via_integrity_error_raises_exception(self, mock_db_manager):
         """Test duplicate role name via IntegrityError raises ClickException."""
         mock_session = Mock()
-        mock_db_manager.get_session.return_value = mock_session
-        
-        # Mock organization exists
-        mock_org_query = Mock()
-        mock_org_filter = Mock()
-        mock_organization = Mock(spec=Organization)
-        
-        # Mock role doesn't exist initially
-        mock_role_query = Mock()
-        mock_role_filter = Mock()
-        
-        def query_side_effect(model):
-            if model == Organization:
-                mock_org_query.filter.return_value = mock_org_filter
-                mock_org_filter.first.return_value = mock_organization
-                return mock_org_query
-            elif model == Role:
-                mock_role_query.filter.return_value = mock_role_filter
-                mock_role_filter.first.return_value = None
-                return mock_role_query
+        mock_db_manager.session_scope.return_value.__enter__.return_value = mock_session
         
-        mock_session.query.side_effect = query_side_effect
+        # Mock organization exists and no case-insensitive match is found
+        mock_session.execute.return_value.one.return_value = (True, False)
         
         # Mock IntegrityError on commit with unique constraint message
         mock_session.commit.side_effect = IntegrityError("statement", "params", "UNIQUE constraint failed: roles.name_organization_id")
@@ -506,9 +384,9 @@ class TestCreateOrgRole:
         with pytest.raises(click.ClickException, match="Role with this name already exists in the organization"):
             create_org_role(1, "Test Role")
         
-        # Verify rollback and close
-        mock_session.rollback.assert_called_once()
-        mock_session.close.assert_called_once()
+        # Verify the session scope saw the error (rollback and close)
+        assert mock_db_manager.session_scope.return_value.__exit__.call_args_list[0][0][0] is IntegrityError
+        assert mock_db_manager.session_scope.return_value.__exit__.call_count == 2
     
     def test_create_org_role_invalid_name_raises_exception(self):
         """Test invalid role name raises ClickException."""
@@ -519,28 +397,8 @@ class TestCreateOrgRole:
     def test_create_org_role_database_error_raises_exception(self, mock_db_manager):
         """Test general database error raises ClickException."""
         mock_session = Mock()
-        mock_db_manager.get_session.return_value = mock_session
-        
-        # Mock organization exists
-        mock_org_query = Mock()
-        mock_org_filter = Mock()
-        mock_organization = Mock(spec=Organization)
-        
-        # Mock role doesn't exist initially
-        mock_role_query = Mock()
-        mock_role_filter = Mock()
-        
-        def query_side_effect(model):
-            if model == Organization:
-                mock_org_query.filter.return_value = mock_org_filter
-                mock_org_filter.first.return_value = mock_organization
-                return mock_org_query
-            elif model == Role:
-                mock_role_query.filter.return_value = mock_role_filter
-                mock_role_filter.first.return_value = None
-                return mock_role_query
-        
-        mock_session.query.side_effect = query_side_effect
+        mock_db_manager.session_scope.return_value.__enter__.return_value = mock_session
+        mock_session.execute.return_value.one.return_value = (1, 0)  # Organization found, name free
         
         # Mock general exception on commit
         mock_session.commit.side_effect = Exception("Database connection lost")
@@ -548,9 +406,9 @@ class TestCreateOrgRole:
         with pytest.raises(Exception, match="Database connection lost"):
             create_org_role(1, "Test Role")
         
-        # Verify rollback and close
-        mock_session.rollback.assert_called_once()
-        mock_session.close.assert_called_once()
+        # Verify the session scope saw the error (rollback and close)
+        assert mock_db_manager.session_scope.return_value.__exit__.call_args[0][0] is not None
+        mock_db_manager.session_scope.return_value.__exit__.assert_called_once()
 
 
 class TestCreateOrgRoleCommand:
@@ -707,39 +565,43 @@ class TestCreateOrgRoleCommand:
 class TestCreateOrgRoleEdgeCases:
     """Test edge cases for organization role creation."""
     
+    def test_create_org_role_case_variant_rejected_without_lower_name_index(self, tmp_path):
+        """Test case variants are rejected on databases predating the lower(name) index."""
+        from sqlalchemy import text
+        from storage.database import DatabaseManager
+        
+        db_manager = DatabaseManager(f"sqlite:///{tmp_path / 'legacy.db'}")
+        db_manager.create_tables()
+        with db_manager.session_scope() as session:
+            session.execute(text("DROP INDEX ix_role_org_lower_name"))
+            session.add(Organization(name="Legacy Org"))
+        
+        try:
+            with patch('src.commands.create_org_role.db_manager', db_manager):
+                create_org_role(1, "Tournament Director")
+                with pytest.raises(click.ClickException, match="Role with this name already exists in the organization"):
+                    create_org_role(1, "tournament director")
+            
+            with db_manager.session_scope() as session:
+                assert session.query(Role).count() == 1
+        finally:
+            db_manager.close()
+    
     @patch('src.commands.create_org_role.db_manager')
     def test_create_org_role_case_insensitive_duplicate_check(self, mock_db_manager):
         """Test duplicate check is case-insensitive."""
         mock_session = Mock()
-        mock_db_manager.get_session.return_value = mock_session
-        
-        # Mock organization exists
-        mock_org_query = Mock()
-        mock_org_filter = Mock()
-        mock_organization = Mock(spec=Organization)
-        
-        # Mock role exists (case insensitive)
-        mock_role_query = Mock()
-        mock_role_filter = Mock()
-        mock_existing_role = Mock(spec=Role)
-        
-        def query_side_effect(model):
-            if model == Organization:
-                mock_org_query.filter.return_value = mock_org_filter
-                mock_org_filter.first.return_value = mock_organization
-                return mock_org_query
-            elif model == Role:
-                mock_role_query.filter.return_value = mock_role_filter
-                mock_role_filter.first.return_value = mock_existing_role
-                return mock_role_query
-        
-        mock_session.query.side_effect = query_side_effect
+        mock_db_manager.session_scope.return_value.__enter__.return_value = mock_session
+        
+        # Mock the case-insensitive pre-check finding the role
+        mock_session.execute.return_value.one.return_value = (True, True)
         
         with pytest.raises(click.ClickException, match="Role with this name already exists in the organization"):
             create_org_role(1, "tournament director")  # Different case
         
-        # Verify database operations
-        mock_session.close.assert_called_once()
+        # Verify nothing was inserted
+        mock_session.add.assert_not_called()
+        mock_db_manager.session_scope.return_value.__exit__.assert_called_once()
     
     def test_validate_role_name_unicode_characters(self):
         """Test validation handles unicode characters."""
@@ -753,47 +615,6 @@ class TestCreateOrgRoleEdgeCases:
         result = validate_role_name(special_name)
         assert result == special_name
     
-    @patch('src.commands.create_org_role.db_manager')
-    def test_create_org_role_handles_session_close_error(self, mock_db_manager):
-        """Test role creation handles session close errors gracefully."""
-        mock_session = Mock()
-        mock_db_manager.get_session.return_value = mock_session
-        
-        # Mock organization exists
-        mock_org_query = Mock()
-        mock_org_filter = Mock()
-        mock_organization = Mock(spec=Organization)
-        
-        # Mock role doesn't exist
-        mock_role_query = Mock()
-        mock_role_filter = Mock()
-        
-        def query_side_effect(model):
-            if model == Organization:
-                mock_org_query.filter.return_value = mock_org_filter
-                mock_org_filter.first.return_value = mock_organization
-                return mock_org_query
-            elif model == Role:
-                mock_role_query.filter.return_value = mock_role_filter
-                mock_role_filter.first.return_value = None
-                return mock_role_query
-        
-        mock_session.query.side_effect = query_side_effect
-        
-        # Mock error on session close
-        mock_session.close.side_effect = Exception("Session close error")
-        
-        # Should still succeed despite close error
-        result = create_org_role(1, "Test Role")
-        
-        assert isinstance(result, Role)
-        assert result.name == "Test Role"
-        
-        # Verify database operations still occurred
-        mock_session.add.assert_called_once()
-        assert mock_session.commit.call_count == 1
-        mock_session.close.assert_called_once()
-    
     def test_parse_permissions_list_case_sensitivity(self):
         """Test permissions parsing preserves case."""
         result = parse_permissions_list("Create Tournament,EDIT SCORES,view reports")
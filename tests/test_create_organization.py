@@ -7,7 +7,6 @@ from sqlalchemy.exc import IntegrityError
 from src.commands.create_organization import (
     create_organization,
     validate_organization_name,
-    check_organization_exists,
     create_organization_command
 )
 from core.models import Organization
@@ -56,41 +55,6 @@ class TestValidateOrganizationName:
         assert result == max_name
 
 
-class TestCheckOrganizationExists:
-    """Test organization existence checking."""
-    
-    def test_check_organization_exists_true(self):
-        """Test returns True when organization exists."""
-        mock_session = Mock()
-        mock_query = Mock()
-        mock_filter = Mock()
-        mock_organization = Mock(spec=Organization)
-        
-        mock_session.query.return_value = mock_query
-        mock_query.filter.return_value = mock_filter
-        mock_filter.first.return_value = mock_organization
-        
-        result = check_organization_exists(mock_session, "Test Org")
-        
-        assert result is True
-        mock_session.query.assert_called_once_with(Organization)
-    
-    def test_check_organization_exists_false(self):
-        """Test returns False when organization doesn't exist."""
-        mock_session = Mock()
-        mock_query = Mock()
-        mock_filter = Mock()
-        
-        mock_session.query.return_value = mock_query
-        mock_query.filter.return_value = mock_filter
-        mock_filter.first.return_value = None
-        
-        result = check_organization_exists(mock_session, "NonExistent Org")
-        
-        assert result is False
-        mock_session.query.assert_called_once_with(Organization)
-
-
 class TestCreateOrganization:
     """Test organization creation."""
     
@@ -98,7 +62,7 @@ class TestCreateOrganization:
     def test_create_organization_success_minimal(self, mock_db_manager):
         """Test successful organization creation with minimal data."""
         mock_session = Mock()
-        mock_db_manager.get_session.return_value = mock_session
+        mock_db_manager.session_scope.return_value.__enter__.return_value = mock_session
         
         # Mock organization doesn't exist
         mock_query = Mock()
@@ -120,13 +84,14 @@ class TestCreateOrganization:
         # Verify database operations
         mock_session.add.assert_called_once()
         mock_session.commit.assert_called_once()
-        mock_session.close.assert_called_once()
+        mock_session.refresh.assert_not_called()
+        mock_db_manager.session_scope.return_value.__exit__.assert_called_once()
     
     @patch('src.commands.create_organization.db_manager')
     def test_create_organization_success_full_data(self, mock_db_manager):
         """Test successful organization creation with all data."""
         mock_session = Mock()
-        mock_db_manager.get_session.return_value = mock_session
+        mock_db_manager.session_scope.return_value.__enter__.return_value = mock_session
         
         # Mock organization doesn't exist
         mock_query = Mock()
@@ -154,13 +119,13 @@ class TestCreateOrganization:
         # Verify database operations
         mock_session.add.assert_called_once()
         mock_session.commit.assert_called_once()
-        mock_session.close.assert_called_once()
+        mock_db_manager.session_scope.return_value.__exit__.assert_called_once()
     
     @patch('src.commands.create_organization.db_manager')
     def test_create_organization_trims_whitespace(self, mock_db_manager):
         """Test organization creation trims whitespace from fields."""
         mock_session = Mock()
-        mock_db_manager.get_session.return_value = mock_session
+        mock_db_manager.session_scope.return_value.__enter__.return_value = mock_session
         
         # Mock organization doesn't exist
         mock_query = Mock()
@@ -188,7 +153,7 @@ class TestCreateOrganization:
     def test_create_organization_handles_empty_optional_fields(self, mock_db_manager):
         """Test organization creation handles empty optional fields."""
         mock_session = Mock()
-        mock_db_manager.get_session.return_value = mock_session
+        mock_db_manager.session_scope.return_value.__enter__.return_value = mock_session
         
         # Mock organization doesn't exist
         mock_query = Mock()
@@ -216,7 +181,7 @@ class TestCreateOrganization:
     def test_create_organization_duplicate_name_raises_exception(self, mock_db_manager):
         """Test duplicate organization name raises ClickException via IntegrityError."""
         mock_session = Mock()
-        mock_db_manager.get_session.return_value = mock_session
+        mock_db_manager.session_scope.return_value.__enter__.return_value = mock_session
         
         # Mock IntegrityError with unique constraint message
         mock_session.commit.side_effect = IntegrityError("statement", "params", "UNIQUE constraint failed: organizations.name")
@@ -225,8 +190,8 @@ class TestCreateOrganization:
             create_organization("Existing Organization")
         
         # Verify session was rolled back and closed
-        mock_session.rollback.assert_called_once()
-        mock_session.close.assert_called_once()
+        assert mock_db_manager.session_scope.return_value.__exit__.call_args[0][0] is not None
+        mock_db_manager.session_scope.return_value.__exit__.assert_called_once()
     
     def test_create_organization_invalid_name_raises_exception(self):
         """Test invalid organization name raises ClickException."""
@@ -237,7 +202,7 @@ class TestCreateOrganization:
     def test_create_organization_integrity_error_raises_exception(self, mock_db_manager):
         """Test IntegrityError raises ClickException."""
         mock_session = Mock()
-        mock_db_manager.get_session.return_value = mock_session
+        mock_db_manager.session_scope.return_value.__enter__.return_value = mock_session
         
         # Mock organization doesn't exist initially
         mock_query = Mock()
@@ -252,15 +217,15 @@ class TestCreateOrganization:
         with pytest.raises(click.ClickException, match="Organization with this name already exists"):
             create_organization("Test Org")
         
-        # Verify rollback and close
-        mock_session.rollback.assert_called_once()
-        mock_session.close.assert_called_once()
+        # Verify the session scope saw the error (rollback and close)
+        assert mock_db_manager.session_scope.return_value.__exit__.call_args[0][0] is not None
+        mock_db_manager.session_scope.return_value.__exit__.assert_called_once()
     
     @patch('src.commands.create_organization.db_manager')
     def test_create_organization_database_error_raises_exception(self, mock_db_manager):
         """Test general database error raises ClickException."""
         mock_session = Mock()
-        mock_db_manager.get_session.return_value = mock_session
+        mock_db_manager.session_scope.return_value.__enter__.return_value = mock_session
         
         # Mock organization doesn't exist initially
         mock_query = Mock()
@@ -275,9 +240,9 @@ class TestCreateOrganization:
         with pytest.raises(click.ClickException, match="Database error: Database connection lost"):
             create_organization("Test Org")
         
-        # Verify rollback and close
-        mock_session.rollback.assert_called_once()
-        mock_session.close.assert_called_once()
+        # Verify the session scope saw the error (rollback and close)
+        assert mock_db_manager.session_scope.return_value.__exit__.call_args[0][0] is not None
+        mock_db_manager.session_scope.return_value.__exit__.assert_called_once()
 
 
 class TestCreateOrganizationCommand:
@@ -406,7 +371,7 @@ class TestCreateOrganizationEdgeCases:
     def test_create_organization_case_insensitive_duplicate_check(self, mock_db_manager):
         """Test duplicate check is case-insensitive via database constraint."""
         mock_session = Mock()
-        mock_db_manager.get_session.return_value = mock_session
+        mock_db_manager.session_scope.return_value.__enter__.return_value = mock_session
         
         # Mock IntegrityError with unique constraint message (case insensitive)
         mock_session.commit.side_effect = IntegrityError("statement", "params", "UNIQUE constraint failed: organizations.name")
@@ -416,8 +381,8 @@ class TestCreateOrganizationEdgeCases:
         
         # Verify database operations
         mock_session.add.assert_called_once()
-        mock_session.rollback.assert_called_once()
-        mock_session.close.assert_called_once()
+        assert mock_db_manager.session_scope.return_value.__exit__.call_args[0][0] is not None
+        mock_db_manager.session_scope.return_value.__exit__.assert_called_once()
     
     def test_validate_organization_name_unicode_characters(self):
         """Test validation handles unicode characters."""
@@ -431,29 +396,3 @@ class TestCreateOrganizationEdgeCases:
         result = validate_organization_name(special_name)
         assert result == special_name
     
-    @patch('src.commands.create_organization.db_manager')
-    def test_create_organization_handles_session_close_error(self, mock_db_manager):
-        """Test organization creation handles session close errors gracefully."""
-        mock_session = Mock()
-        mock_db_manager.get_session.return_value = mock_session
-        
-        # Mock organization doesn't exist
-        mock_query = Mock()
-        mock_filter = Mock()
-        mock_session.query.return_value = mock_query
-        mock_query.filter.return_value = mock_filter
-        mock_filter.first.return_value = None
-        
-        # Mock error on session close
-        mock_session.close.side_effect = Exception("Session close error")
-        
-        # Should still succeed despite close error
-        result = create_organization("Test Organization")
-        
-        assert isinstance(result, Organization)
-        assert result.name == "Test Organization"
-        
-        # Verify database operations still occurred
-        mock_session.add.assert_called_once()
-        mock_session.commit.assert_called_once()
-        mock_session.close.assert_called_once()
\ No newline at end of file
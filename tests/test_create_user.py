@@ -16,7 +16,7 @@ class TestCreateUser:
         """Test creating a user with only required arguments."""
         with patch('src.commands.create.db_manager') as mock_db:
             mock_session = MagicMock()
-            mock_db.get_session.return_value = mock_session
+            mock_db.session_scope.return_value.__enter__.return_value = mock_session
             mock_session.query.return_value.filter_by.return_value.first.return_value = None
             
             user = create_user(first="Bob", last="Lane")
@@ -37,7 +37,7 @@ class TestCreateUser:
         """Test creating a user with all arguments provided."""
         with patch('src.commands.create.db_manager') as mock_db:
             mock_session = MagicMock()
-            mock_db.get_session.return_value = mock_session
+            mock_db.session_scope.return_value.__enter__.return_value = mock_session
             mock_session.query.return_value.filter_by.return_value.first.return_value = None
             
             user = create_user(
@@ -66,7 +66,7 @@ class TestCreateUser:
         """Test creating a non-member user without email."""
         with patch('src.commands.create.db_manager') as mock_db:
             mock_session = MagicMock()
-            mock_db.get_session.return_value = mock_session
+            mock_db.session_scope.return_value.__enter__.return_value = mock_session
             mock_session.query.return_value.filter_by.return_value.first.return_value = None
             
             user = create_user(
@@ -90,7 +90,7 @@ class TestCreateUser:
         """Test that duplicate email raises IntegrityError."""
         with patch('src.commands.create.db_manager') as mock_db:
             mock_session = MagicMock()
-            mock_db.get_session.return_value = mock_session
+            mock_db.session_scope.return_value.__enter__.return_value = mock_session
             
             # Mock existing user with same email
             existing_user = User(email="alice@example.com")
@@ -109,7 +109,7 @@ class TestCreateUser:
         """Test that duplicate USBC ID raises IntegrityError."""
         with patch('src.commands.create.db_manager') as mock_db:
             mock_session = MagicMock()
-            mock_db.get_session.return_value = mock_session
+            mock_db.session_scope.return_value.__enter__.return_value = mock_session
             
             # Mock no email conflict but USBC ID conflict
             def mock_filter_by(email=None, usbc_id=None, tnba_id=None):
@@ -134,7 +134,7 @@ class TestCreateUser:
         """Test that duplicate TNBA ID raises IntegrityError."""
         with patch('src.commands.create.db_manager') as mock_db:
             mock_session = MagicMock()
-            mock_db.get_session.return_value = mock_session
+            mock_db.session_scope.return_value.__enter__.return_value = mock_session
             
             # Mock no email/usbc conflict but TNBA ID conflict
             def mock_filter_by(email=None, usbc_id=None, tnba_id=None):
@@ -187,7 +187,7 @@ class TestCreateUser:
         """Test that string fields are properly trimmed."""
         with patch('src.commands.create.db_manager') as mock_db:
             mock_session = MagicMock()
-            mock_db.get_session.return_value = mock_session
+            mock_db.session_scope.return_value.__enter__.return_value = mock_session
             mock_session.query.return_value.filter_by.return_value.first.return_value = None
             
             user = create_user(
@@ -212,38 +212,40 @@ class TestCreateUser:
         """Test handling of database errors."""
         with patch('src.commands.create.db_manager') as mock_db:
             mock_session = MagicMock()
-            mock_db.get_session.return_value = mock_session
+            mock_db.session_scope.return_value.__enter__.return_value = mock_session
             mock_session.query.return_value.filter_by.return_value.first.return_value = None
             mock_session.commit.side_effect = SQLAlchemyError("Database connection failed")
             
             with pytest.raises(SQLAlchemyError):
                 create_user(first="John", last="Doe")
             
-            mock_session.rollback.assert_called_once()
+            # The session scope receives the error and rolls back
+            exit_args = mock_db.session_scope.return_value.__exit__.call_args[0]
+            assert exit_args[0] is SQLAlchemyError
 
     def test_session_is_closed_on_success(self):
         """Test that database session is properly closed on success."""
         with patch('src.commands.create.db_manager') as mock_db:
             mock_session = MagicMock()
-            mock_db.get_session.return_value = mock_session
+            mock_db.session_scope.return_value.__enter__.return_value = mock_session
             mock_session.query.return_value.filter_by.return_value.first.return_value = None
             
             create_user(first="John", last="Doe")
             
-            mock_session.close.assert_called_once()
+            mock_db.session_scope.return_value.__exit__.assert_called_once()
 
     def test_session_is_closed_on_error(self):
         """Test that database session is properly closed on error."""
         with patch('src.commands.create.db_manager') as mock_db:
             mock_session = MagicMock()
-            mock_db.get_session.return_value = mock_session
+            mock_db.session_scope.return_value.__enter__.return_value = mock_session
             mock_session.query.return_value.filter_by.return_value.first.return_value = None
             mock_session.commit.side_effect = SQLAlchemyError("Database error")
             
             with pytest.raises(SQLAlchemyError):
                 create_user(first="John", last="Doe")
             
-            mock_session.close.assert_called_once()
+            mock_db.session_scope.return_value.__exit__.assert_called_once()
 
 
 class TestValidateCreateArgs:
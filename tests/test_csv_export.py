@@ -6,7 +6,7 @@ import tempfile
 from pathlib import Path
 from unittest.mock import patch, mock_open
 
-from utils.csv_writer import export_users_to_csv, validate_csv_path
+from utils.csv_writer import export_user_rows_to_csv, export_users_to_csv, validate_csv_path
 
 
 class TestExportUsersToCSV:
@@ -55,6 +55,57 @@ class TestExportUsersToCSV:
                 assert rows[0] == ['id', 'name', 'role', 'email', 'created_at']
                 assert rows[1] == ['1', 'John Doe', 'registered_user', 'john@example.com', '2024-01-15T10:30:00Z']
     
+    def test_export_streams_iterable_in_batches(self):
+        """Test exporting a generator writes every row and returns the count."""
+        def generate_users():
+            for i in range(2500):
+                yield {
+                    'id': i,
+                    'name': f'User {i}',
+                    'role': 'registered_user',
+                    'email': f'user{i}@example.com',
+                    'created_at': ''
+                }
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_path = Path(temp_dir) / "streamed.csv"
+            
+            count = export_users_to_csv(generate_users(), csv_path)
+            
+            assert count == 2500
+            with open(csv_path, 'r', encoding='utf-8') as f:
+                rows = list(csv.reader(f))
+                assert len(rows) == 2501  # Header + users
+                assert rows[-1][0] == '2499'
+    
+    def test_export_uses_large_write_buffer(self):
+        """Test the export file is opened with a 1 MiB buffer."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_path = Path(temp_dir) / "buffered.csv"
+            
+            with patch('builtins.open', wraps=open) as mock_file:
+                export_users_to_csv([], csv_path)
+            
+            assert mock_file.call_args.kwargs['buffering'] == 1 << 20
+    
+    def test_export_user_rows(self):
+        """Test exporting rows that are already in CSV column order."""
+        rows = iter([
+            (1, 'John Doe', 'registered_user', 'john@example.com', '2024-01-15T10:30:00'),
+            (2, 'Jane Smith', 'unregistered_user', '', '')
+        ])
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_path = Path(temp_dir) / "rows.csv"
+            
+            count = export_user_rows_to_csv(rows, csv_path)
+            
+            assert count == 2
+            with open(csv_path, 'r', encoding='utf-8') as f:
+                written = list(csv.reader(f))
+            assert written[0] == ['id', 'name', 'role', 'email', 'created_at']
+            assert written[2] == ['2', 'Jane Smith', 'unregistered_user', '', '']
+    
     def test_export_multiple_users(self):
         """Test exporting multiple users."""
         users_data = [
@@ -0,0 +1,250 @@
+"""Tests for database manager session handling."""
+
+import sqlite3
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+from core.models import Organization, Permission, User
+from storage.database import (
+    DatabaseManager, is_foreign_key_violation, is_lock_not_available, is_unique_violation
+)
+
+
+class TestSessionScope:
+    """Test cases for DatabaseManager.session_scope."""
+
+    @pytest.fixture
+    def db_manager(self):
+        """Create a test database manager."""
+        db_manager = DatabaseManager("sqlite:///:memory:")
+        db_manager.create_tables()
+        yield db_manager
+        db_manager.close()
+
+    def test_commits_on_success(self, db_manager):
+        """Test that changes are committed when the block completes."""
+        with db_manager.session_scope() as session:
+            session.add(User(first_name="John", last_name="Doe"))
+
+        with db_manager.session_scope() as session:
+            assert session.query(User).count() == 1
+
+    def test_rolls_back_on_error(self, db_manager):
+        """Test that changes are rolled back when the block raises."""
+        with pytest.raises(ValueError):
+            with db_manager.session_scope() as session:
+                session.add(User(first_name="John", last_name="Doe"))
+                session.flush()
+                raise ValueError("boom")
+
+        with db_manager.session_scope() as session:
+            assert session.query(User).count() == 0
+
+    def test_rolls_back_on_system_exit(self, db_manager):
+        """Test that CLI exits inside the block do not commit pending work."""
+        with pytest.raises(SystemExit):
+            with db_manager.session_scope() as session:
+                session.add(User(first_name="John", last_name="Doe"))
+                session.flush()
+                raise SystemExit(1)
+
+        with db_manager.session_scope() as session:
+            assert session.query(User).count() == 0
+
+    def test_session_closed_after_block(self, db_manager):
+        """Test that the session is closed once the block exits."""
+        with db_manager.session_scope() as session:
+            session.add(User(first_name="John", last_name="Doe"))
+
+        assert not session.in_transaction()
+        assert len(session.identity_map) == 0
+
+
+class TestScopedSession:
+    """Test cases for the DatabaseManager.Session registry."""
+
+    @pytest.fixture
+    def db_manager(self):
+        """Create a test database manager."""
+        db_manager = DatabaseManager("sqlite:///:memory:")
+        db_manager.create_tables()
+        yield db_manager
+        db_manager.close()
+
+    def test_returns_same_session_until_removed(self, db_manager):
+        """Test that the registry reuses one session until remove() is called."""
+        session = db_manager.Session()
+        assert db_manager.Session() is session
+
+        db_manager.Session.remove()
+        assert db_manager.Session() is not session
+
+
+class TestSqliteForeignKeys:
+    """Test cases for SQLite foreign key enforcement."""
+
+    def test_foreign_keys_enforced(self):
+        """Test that rows referencing a missing parent are rejected."""
+        db_manager = DatabaseManager("sqlite:///:memory:")
+        db_manager.create_tables()
+        try:
+            with pytest.raises(IntegrityError):
+                with db_manager.session_scope() as session:
+                    session.add(Permission(name="Edit", organization_id=999))
+        finally:
+            db_manager.close()
+
+
+class TestEngineConfiguration:
+    """Test cases for engine pooling and SQLite connection tuning."""
+
+    def test_file_database_pooled_with_wal(self, tmp_path):
+        """Test that file databases use a sized pool and WAL journaling."""
+        from sqlalchemy import text
+        from sqlalchemy.pool import QueuePool
+        from storage.database import POOL_SIZE
+
+        db_manager = DatabaseManager(f"sqlite:///{tmp_path / 'pool.db'}")
+        try:
+            assert isinstance(db_manager.engine.pool, QueuePool)
+            assert db_manager.engine.pool.size() == POOL_SIZE
+            with db_manager.engine.connect() as connection:
+                assert connection.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+                assert connection.execute(text("PRAGMA synchronous")).scalar() == 1
+        finally:
+            db_manager.close()
+
+    def test_memory_database_keeps_default_pool(self):
+        """Test that in-memory databases are not spread over a connection pool."""
+        from sqlalchemy.pool import QueuePool
+
+        db_manager = DatabaseManager("sqlite:///:memory:")
+        try:
+            assert not isinstance(db_manager.engine.pool, QueuePool)
+        finally:
+            db_manager.close()
+
+    def test_memory_uri_database_keeps_default_pool(self):
+        """Test that a mode=memory URI is treated as in-memory, without WAL tuning."""
+        from sqlalchemy import text
+        from sqlalchemy.pool import QueuePool
+
+        db_manager = DatabaseManager("sqlite:///file:memdb_test?mode=memory&cache=shared&uri=true")
+        try:
+            assert not isinstance(db_manager.engine.pool, QueuePool)
+            with db_manager.engine.connect() as connection:
+                assert connection.execute(text("PRAGMA journal_mode")).scalar() == "memory"
+        finally:
+            db_manager.close()
+
+
+class TestIsUniqueViolation:
+    """Test cases for is_unique_violation."""
+
+    def _error(self, orig):
+        """Wrap a driver exception the way SQLAlchemy does."""
+        return IntegrityError("INSERT ...", {}, orig)
+
+    def test_sqlite_unique_error_name(self):
+        """Test SQLite unique failures are detected by extended error name."""
+        orig = sqlite3.IntegrityError("UNIQUE constraint failed: roles.name")
+        orig.sqlite_errorname = "SQLITE_CONSTRAINT_UNIQUE"
+        assert is_unique_violation(self._error(orig)) is True
+
+    def test_sqlite_foreign_key_error_name(self):
+        """Test SQLite foreign key failures are not treated as duplicates."""
+        orig = sqlite3.IntegrityError("FOREIGN KEY constraint failed")
+        orig.sqlite_errorname = "SQLITE_CONSTRAINT_FOREIGNKEY"
+        assert is_unique_violation(self._error(orig)) is False
+
+    def test_postgres_sqlstate(self):
+        """Test PostgreSQL errors are classified by SQLSTATE."""
+        unique = Mock(spec=["pgcode"], pgcode="23505")
+        foreign_key = Mock(spec=["pgcode"], pgcode="23503")
+        assert is_unique_violation(self._error(unique)) is True
+        assert is_unique_violation(self._error(foreign_key)) is False
+
+    def test_message_fallback(self):
+        """Test drivers without error codes fall back to the message."""
+        assert is_unique_violation(self._error("Duplicate entry 'x' for key 'name'")) is True
+        assert is_unique_violation(self._error("NOT NULL constraint failed")) is False
+
+    def test_real_sqlite_unique_violation(self):
+        """Test a real SQLite unique failure is detected."""
+        db_manager = DatabaseManager("sqlite:///:memory:")
+        db_manager.create_tables()
+        try:
+            with db_manager.session_scope() as session:
+                session.add(Organization(name="Org"))
+            with pytest.raises(IntegrityError) as exc_info:
+                with db_manager.session_scope() as session:
+                    session.add(Organization(name="Org"))
+            assert is_unique_violation(exc_info.value) is True
+        finally:
+            db_manager.close()
+
+
+class TestIsForeignKeyViolation:
+    """Test cases for is_foreign_key_violation."""
+
+    def _error(self, orig):
+        """Wrap a driver exception the way SQLAlchemy does."""
+        return IntegrityError("INSERT ...", {}, orig)
+
+    def test_sqlite_foreign_key_error_name(self):
+        """Test SQLite foreign key failures are detected by extended error name."""
+        orig = sqlite3.IntegrityError("FOREIGN KEY constraint failed")
+        orig.sqlite_errorname = "SQLITE_CONSTRAINT_FOREIGNKEY"
+        assert is_foreign_key_violation(self._error(orig)) is True
+
+    def test_postgres_sqlstate(self):
+        """Test PostgreSQL errors are classified by SQLSTATE."""
+        foreign_key = Mock(spec=["pgcode"], pgcode="23503")
+        unique = Mock(spec=["pgcode"], pgcode="23505")
+        assert is_foreign_key_violation(self._error(foreign_key)) is True
+        assert is_foreign_key_violation(self._error(unique)) is False
+
+    def test_message_fallback(self):
+        """Test drivers without error codes fall back to the message."""
+        assert is_foreign_key_violation(self._error("FOREIGN KEY constraint failed")) is True
+        assert is_foreign_key_violation(self._error("UNIQUE constraint failed")) is False
+
+    def test_real_sqlite_foreign_key_violation(self):
+        """Test a real SQLite foreign key failure is detected."""
+        db_manager = DatabaseManager("sqlite:///:memory:")
+        db_manager.create_tables()
+        try:
+            with pytest.raises(IntegrityError) as exc_info:
+                with db_manager.session_scope() as session:
+                    session.add(Permission(name="Edit", organization_id=999))
+            assert is_foreign_key_violation(exc_info.value) is True
+        finally:
+            db_manager.close()
+
+
+class TestIsLockNotAvailable:
+    """Test cases for is_lock_not_available."""
+
+    def _error(self, orig):
+        """Wrap a driver exception the way SQLAlchemy does."""
+        return OperationalError("SELECT ... FOR UPDATE NOWAIT", {}, orig)
+
+    def test_postgres_sqlstate(self):
+        """Test PostgreSQL lock_not_available is detected by SQLSTATE."""
+        locked = Mock(spec=["pgcode"], pgcode="55P03")
+        other = Mock(spec=["pgcode"], pgcode="57014")
+        assert is_lock_not_available(self._error(locked)) is True
+        assert is_lock_not_available(self._error(other)) is False
+
+    def test_sqlite_busy(self):
+        """Test a busy SQLite database is detected by error name."""
+        orig = sqlite3.OperationalError("database is locked")
+        orig.sqlite_errorname = "SQLITE_BUSY"
+        assert is_lock_not_available(self._error(orig)) is True
+
+    def test_message_fallback(self):
+        """Test drivers without error codes fall back to the message."""
+        assert is_lock_not_available(self._error("could not obtain lock on row")) is True
+        assert is_lock_not_available(self._error("server closed the connection")) is False
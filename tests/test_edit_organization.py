@@ -1,5 +1,7 @@
 """Test suite for edit organization command."""
 
+from datetime import datetime
+
 import pytest
 from unittest.mock import patch, MagicMock
 from click.testing import CliRunner
@@ -10,7 +12,8 @@ from src.commands.edit_organization import (
     edit_organization_command,
     validate_empty_field,
     check_name_conflict,
-    update_organization_fields
+    organization_is_active,
+    collect_organization_updates
 )
 
 
@@ -48,7 +51,7 @@ class TestCheckNameConflict:
     def test_no_conflict_returns_false(self):
         """Test that unique names return False."""
         mock_session = MagicMock()
-        mock_session.query.return_value.filter.return_value.filter.return_value.filter.return_value.first.return_value = None
+        mock_session.query.return_value.scalar.return_value = False
         
         result = check_name_conflict(mock_session, "Unique Name", 1)
         assert result is False
@@ -56,8 +59,7 @@ class TestCheckNameConflict:
     def test_existing_name_returns_true(self):
         """Test that existing names return True."""
         mock_session = MagicMock()
-        mock_org = MagicMock()
-        mock_session.query.return_value.filter.return_value.filter.return_value.filter.return_value.first.return_value = mock_org
+        mock_session.query.return_value.scalar.return_value = True
         
         result = check_name_conflict(mock_session, "Existing Name", 1)
         assert result is True
@@ -65,67 +67,52 @@ class TestCheckNameConflict:
     def test_case_insensitive_matching(self):
         """Test that name conflict check is case-insensitive."""
         mock_session = MagicMock()
-        mock_org = MagicMock()
-        mock_session.query.return_value.filter.return_value.filter.return_value.filter.return_value.first.return_value = mock_org
+        mock_session.query.return_value.scalar.return_value = True
         
         result = check_name_conflict(mock_session, "TEST NAME", 1)
         
-        # Verify ilike was called for case-insensitive comparison
-        mock_session.query.assert_called_once_with(Organization)
+        # Verify the name lookup queried organizations
+        mock_session.query.assert_any_call(Organization)
         assert result is True
 
 
-class TestUpdateOrganizationFields:
-    """Test update_organization_fields function."""
+class TestOrganizationIsActive:
+    """Test organization_is_active function."""
     
-    def test_no_fields_updated_returns_false(self):
-        """Test that updating with no fields returns False."""
-        mock_org = MagicMock()
-        
-        result = update_organization_fields(mock_org)
-        assert result is False
+    def test_active_organization_returns_true(self):
+        """Test that an existing, non-deleted organization is active."""
+        mock_session = MagicMock()
+        mock_session.get.return_value.deleted_at = None
         
-    def test_single_field_update_returns_true(self):
-        """Test that updating single field returns True."""
-        mock_org = MagicMock()
+        assert organization_is_active(mock_session, 1) is True
+        mock_session.get.assert_called_once_with(Organization, 1)
         
-        result = update_organization_fields(mock_org, name="New Name")
-        assert result is True
-        assert mock_org.name == "New Name"
-        
-    def test_multiple_fields_update_returns_true(self):
-        """Test that updating multiple fields returns True."""
-        mock_org = MagicMock()
+    def test_missing_organization_returns_false(self):
+        """Test that a missing organization is not active."""
+        mock_session = MagicMock()
+        mock_session.get.return_value = None
         
-        result = update_organization_fields(
-            mock_org,
-            name="New Name",
-            address="New Address",
-            email="new@example.com"
-        )
-        assert result is True
-        assert mock_org.name == "New Name"
-        assert mock_org.address == "New Address"
-        assert mock_org.email == "new@example.com"
+        assert organization_is_active(mock_session, 999) is False
         
-    def test_all_fields_can_be_updated(self):
-        """Test that all fields can be updated."""
-        mock_org = MagicMock()
+    def test_soft_deleted_organization_returns_false(self):
+        """Test that a soft-deleted organization is not active."""
+        mock_session = MagicMock()
+        mock_session.get.return_value.deleted_at = datetime(2024, 1, 1)
         
-        result = update_organization_fields(
-            mock_org,
-            name="Test Org",
-            address="123 Main St",
-            phone="555-1234",
-            email="test@example.com",
-            website="https://example.com"
-        )
-        assert result is True
-        assert mock_org.name == "Test Org"
-        assert mock_org.address == "123 Main St"
-        assert mock_org.phone == "555-1234"
-        assert mock_org.email == "test@example.com"
-        assert mock_org.website == "https://example.com"
+        assert organization_is_active(mock_session, 1) is False
+
+
+class TestCollectOrganizationUpdates:
+    """Test collect_organization_updates function."""
+    
+    def test_no_fields_returns_empty_dict(self):
+        """Test that no provided fields yields no updates."""
+        assert collect_organization_updates() == {}
+        
+    def test_only_provided_fields_included(self):
+        """Test that None fields are left out of the updates."""
+        result = collect_organization_updates(name="New Name", email="new@example.com")
+        assert result == {"name": "New Name", "email": "new@example.com"}
 
 
 class TestEditOrganizationCommand:
@@ -146,12 +133,47 @@ class TestEditOrganizationCommand:
     def test_organization_not_found(self, mock_db_manager):
         """Test organization not found returns exit code 2."""
         mock_session = MagicMock()
-        mock_db_manager.get_session.return_value = mock_session
-        mock_session.query.return_value.filter.return_value.filter.return_value.first.return_value = None
+        mock_db_manager.session_scope.return_value.__enter__.return_value = mock_session
+        mock_session.execute.return_value.rowcount = 0
+        
+        with patch('src.commands.edit_organization.check_name_conflict', return_value=False):
+            result = self.runner.invoke(edit_organization_command, [
+                '--organization-id', '999',
+                '--name', 'New Name'
+            ])
+        
+        assert result.exit_code == 2
+        assert "Organization not found." in result.output
+        mock_session.commit.assert_not_called()
+        
+    @patch('src.commands.edit_organization.db_manager')
+    def test_organization_not_found_takes_precedence_over_name_conflict(self, mock_db_manager):
+        """Test a missing organization reports not found even if the name is taken."""
+        mock_session = MagicMock()
+        mock_db_manager.session_scope.return_value.__enter__.return_value = mock_session
+        mock_session.get.return_value = None
+        
+        with patch('src.commands.edit_organization.check_name_conflict', return_value=True):
+            result = self.runner.invoke(edit_organization_command, [
+                '--organization-id', '999',
+                '--name', 'Existing Name'
+            ])
+        
+        assert result.exit_code == 2
+        assert "Organization not found." in result.output
+        mock_session.execute.assert_not_called()
+        
+    @patch('src.commands.edit_organization.db_manager')
+    def test_soft_deleted_organization_not_found(self, mock_db_manager):
+        """Test soft-deleted organization is treated as not found."""
+        mock_session = MagicMock()
+        mock_db_manager.session_scope.return_value.__enter__.return_value = mock_session
+        mock_org = MagicMock()
+        mock_org.deleted_at = datetime(2024, 1, 1)
+        mock_session.get.return_value = mock_org
         
         result = self.runner.invoke(edit_organization_command, [
-            '--organization-id', '999',
-            '--name', 'New Name'
+            '--organization-id', '1'
         ])
         
         assert result.exit_code == 2
@@ -161,11 +183,12 @@ class TestEditOrganizationCommand:
     def test_name_conflict_returns_exit_code_3(self, mock_db_manager):
         """Test name conflict returns exit code 3."""
         mock_session = MagicMock()
-        mock_db_manager.get_session.return_value = mock_session
+        mock_db_manager.session_scope.return_value.__enter__.return_value = mock_session
         
         # Mock organization exists
         mock_org = MagicMock()
-        mock_session.query.return_value.filter.return_value.filter.return_value.first.return_value = mock_org
+        mock_org.deleted_at = None
+        mock_session.get.return_value = mock_org
         
         # Mock name conflict check returns True
         with patch('src.commands.edit_organization.check_name_conflict', return_value=True):
@@ -192,10 +215,11 @@ class TestEditOrganizationCommand:
     def test_successful_single_field_update(self, mock_db_manager):
         """Test successful single field update."""
         mock_session = MagicMock()
-        mock_db_manager.get_session.return_value = mock_session
+        mock_db_manager.session_scope.return_value.__enter__.return_value = mock_session
         
         mock_org = MagicMock()
-        mock_session.query.return_value.filter.return_value.filter.return_value.first.return_value = mock_org
+        mock_org.deleted_at = None
+        mock_session.get.return_value = mock_org
         
         # Mock no name conflict
         with patch('src.commands.edit_organization.check_name_conflict', return_value=False):
@@ -211,10 +235,11 @@ class TestEditOrganizationCommand:
     def test_successful_multiple_field_update(self, mock_db_manager):
         """Test successful multiple field update."""
         mock_session = MagicMock()
-        mock_db_manager.get_session.return_value = mock_session
+        mock_db_manager.session_scope.return_value.__enter__.return_value = mock_session
         
         mock_org = MagicMock()
-        mock_session.query.return_value.filter.return_value.filter.return_value.first.return_value = mock_org
+        mock_org.deleted_at = None
+        mock_session.get.return_value = mock_org
         
         with patch('src.commands.edit_organization.check_name_conflict', return_value=False):
             result = self.runner.invoke(edit_organization_command, [
@@ -231,10 +256,11 @@ class TestEditOrganizationCommand:
     def test_no_op_successful(self, mock_db_manager):
         """Test no-op (no fields provided) returns success."""
         mock_session = MagicMock()
-        mock_db_manager.get_session.return_value = mock_session
+        mock_db_manager.session_scope.return_value.__enter__.return_value = mock_session
         
         mock_org = MagicMock()
-        mock_session.query.return_value.filter.return_value.filter.return_value.first.return_value = mock_org
+        mock_org.deleted_at = None
+        mock_session.get.return_value = mock_org
         
         result = self.runner.invoke(edit_organization_command, [
             '--organization-id', '1'
@@ -248,11 +274,12 @@ class TestEditOrganizationCommand:
     def test_update_to_same_values_successful(self, mock_db_manager):
         """Test updating to same values is successful."""
         mock_session = MagicMock()
-        mock_db_manager.get_session.return_value = mock_session
+        mock_db_manager.session_scope.return_value.__enter__.return_value = mock_session
         
         mock_org = MagicMock()
         mock_org.name = "Current Name"
-        mock_session.query.return_value.filter.return_value.filter.return_value.first.return_value = mock_org
+        mock_org.deleted_at = None
+        mock_session.get.return_value = mock_org
         
         with patch('src.commands.edit_organization.check_name_conflict', return_value=False):
             result = self.runner.invoke(edit_organization_command, [
@@ -263,17 +290,45 @@ class TestEditOrganizationCommand:
         assert result.exit_code == 0
         mock_session.commit.assert_called_once()
         
+    @patch('src.commands.edit_organization.db_manager')
+    def test_unchanged_values_skip_commit(self, mock_db_manager):
+        """Test values equal to the current ones leave the row untouched."""
+        mock_session = MagicMock()
+        mock_db_manager.session_scope.return_value.__enter__.return_value = mock_session
+        
+        # Mock the guarded UPDATE matching no row for an active organization
+        mock_session.execute.return_value.rowcount = 0
+        mock_org = MagicMock()
+        mock_org.deleted_at = None
+        mock_session.get.return_value = mock_org
+        
+        with patch('src.commands.edit_organization.check_name_conflict', return_value=False):
+            result = self.runner.invoke(edit_organization_command, [
+                '--organization-id', '1',
+                '--name', 'Same Name',
+                '--email', 'same@example.com'
+            ])
+        
+        assert result.exit_code == 0
+        mock_session.commit.assert_not_called()
+        
+        # The UPDATE only matches rows where some value differs
+        statement = str(mock_session.execute.call_args[0][0])
+        assert "organizations.name IS DISTINCT FROM" in statement
+        assert "organizations.email IS DISTINCT FROM" in statement
+        
     @patch('src.commands.edit_organization.db_manager')
     def test_database_error_handling(self, mock_db_manager):
         """Test database error handling."""
         mock_session = MagicMock()
-        mock_db_manager.get_session.return_value = mock_session
-        mock_session.query.side_effect = SQLAlchemyError("Database connection failed")
+        mock_db_manager.session_scope.return_value.__enter__.return_value = mock_session
+        mock_session.execute.side_effect = SQLAlchemyError("Database connection failed")
         
-        result = self.runner.invoke(edit_organization_command, [
-            '--organization-id', '1',
-            '--name', 'Test Name'
-        ])
+        with patch('src.commands.edit_organization.check_name_conflict', return_value=False):
+            result = self.runner.invoke(edit_organization_command, [
+                '--organization-id', '1',
+                '--name', 'Test Name'
+            ])
         
         assert result.exit_code == 1
         assert "Database error" in result.output
@@ -282,10 +337,11 @@ class TestEditOrganizationCommand:
     def test_session_cleanup(self, mock_db_manager):
         """Test that database session is properly closed."""
         mock_session = MagicMock()
-        mock_db_manager.get_session.return_value = mock_session
+        mock_db_manager.session_scope.return_value.__enter__.return_value = mock_session
         
         mock_org = MagicMock()
-        mock_session.query.return_value.filter.return_value.filter.return_value.first.return_value = mock_org
+        mock_org.deleted_at = None
+        mock_session.get.return_value = mock_org
         
         result = self.runner.invoke(edit_organization_command, [
             '--organization-id', '1',
@@ -293,7 +349,7 @@ class TestEditOrganizationCommand:
         ])
         
         # Session should be closed regardless of success/failure
-        mock_session.close.assert_called_once()
+        mock_db_manager.session_scope.return_value.__exit__.assert_called_once()
         
     @patch('src.commands.edit_organization.db_manager')
     def test_whitespace_values_rejected(self, mock_db_manager):
@@ -319,11 +375,12 @@ class TestIntegrationScenarios:
     def test_case_insensitive_name_conflict_detection(self, mock_db_manager):
         """Test case-insensitive name conflict detection."""
         mock_session = MagicMock()
-        mock_db_manager.get_session.return_value = mock_session
+        mock_db_manager.session_scope.return_value.__enter__.return_value = mock_session
         
         # Mock organization exists
         mock_org = MagicMock()
-        mock_session.query.return_value.filter.return_value.filter.return_value.first.return_value = mock_org
+        mock_org.deleted_at = None
+        mock_session.get.return_value = mock_org
         
         # Mock name conflict with different case
         with patch('src.commands.edit_organization.check_name_conflict', return_value=True):
@@ -339,10 +396,11 @@ class TestIntegrationScenarios:
     def test_transaction_rollback_on_error(self, mock_db_manager):
         """Test transaction rollback when error occurs during commit."""
         mock_session = MagicMock()
-        mock_db_manager.get_session.return_value = mock_session
+        mock_db_manager.session_scope.return_value.__enter__.return_value = mock_session
         
         mock_org = MagicMock()
-        mock_session.query.return_value.filter.return_value.filter.return_value.first.return_value = mock_org
+        mock_org.deleted_at = None
+        mock_session.get.return_value = mock_org
         mock_session.commit.side_effect = SQLAlchemyError("Commit failed")
         
         with patch('src.commands.edit_organization.check_name_conflict', return_value=False):
@@ -352,16 +410,17 @@ class TestIntegrationScenarios:
             ])
             
         assert result.exit_code == 1
-        mock_session.close.assert_called_once()
+        mock_db_manager.session_scope.return_value.__exit__.assert_called_once()
         
     @patch('src.commands.edit_organization.db_manager')
     def test_partial_field_updates(self, mock_db_manager):
         """Test that only specified fields are updated."""
         mock_session = MagicMock()
-        mock_db_manager.get_session.return_value = mock_session
+        mock_db_manager.session_scope.return_value.__enter__.return_value = mock_session
         
         mock_org = MagicMock()
-        mock_session.query.return_value.filter.return_value.filter.return_value.first.return_value = mock_org
+        mock_org.deleted_at = None
+        mock_session.get.return_value = mock_org
         
         result = self.runner.invoke(edit_organization_command, [
             '--organization-id', '1',
@@ -369,7 +428,7 @@ class TestIntegrationScenarios:
         ])
         
         assert result.exit_code == 0
-        # Only address should be updated
-        assert mock_org.address == 'New Address Only'
-        # Name should not be touched
-        assert not hasattr(mock_org, 'name') or mock_org.name != 'New Address Only'
\ No newline at end of file
+        # Only address should be in the UPDATE statement
+        params = mock_session.execute.call_args[0][0].compile().params
+        assert params['address'] == 'New Address Only'
+        assert 'name' not in params
\ No newline at end of file
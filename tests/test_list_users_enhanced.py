@@ -8,10 +8,14 @@ from sqlalchemy.exc import SQLAlchemyError
 
 from core.models import User, ProfileRole
 from src.commands.list_users import (
+    USER_LIST_COLUMNS,
     list_users_enhanced,
     parse_date_filter,
     build_enhanced_user_query,
     display_users_table,
+    format_plain_table,
+    iter_user_pages,
+    normalize_filters,
     paginate_and_display
 )
 
@@ -21,7 +25,7 @@ def mock_session():
     """Mock database session."""
     with patch('src.commands.list_users.db_manager') as mock_db:
         mock_session = MagicMock()
-        mock_db.get_session.return_value = mock_session
+        mock_db.session_scope.return_value.__enter__.return_value = mock_session
         yield mock_session
 
 
@@ -99,51 +103,110 @@ class TestParseDateFilter:
         result = parse_date_filter("2024-02-29")
         expected = datetime(2024, 2, 29, tzinfo=timezone.utc)
         assert result == expected
+    
+    def test_repeated_dates_are_cached(self):
+        """Test parsing the same date twice returns the cached datetime."""
+        parse_date_filter.cache_clear()
+        first = parse_date_filter("2024-03-01")
+        second = parse_date_filter("2024-03-01")
+        
+        assert first is second
+        assert parse_date_filter.cache_info().hits == 1
+    
+    def test_invalid_dates_are_not_cached(self):
+        """Test invalid input raises on every call."""
+        import click
+        parse_date_filter.cache_clear()
+        for _ in range(2):
+            with pytest.raises(click.BadParameter):
+                parse_date_filter("not-a-date")
+        
+        assert parse_date_filter.cache_info().currsize == 0
+
+
+class TestNormalizeFilters:
+    """Test filter normalization."""
+    
+    def test_strips_and_drops_blank_values(self):
+        """Test values are stripped and None or blank values are dropped."""
+        filters = normalize_filters(first="  John ", last=None, email="   ", usbc_id="123")
+        
+        assert filters == {'first': 'John', 'usbc_id': '123'}
+    
+    def test_no_values(self):
+        """Test no filters produce an empty dictionary."""
+        assert normalize_filters() == {}
 
 
 class TestBuildEnhancedUserQuery:
     """Test enhanced query building."""
     
-    def test_query_with_no_filters(self, mock_session):
+    def test_query_with_no_filters(self):
         """Test query building with no filters."""
-        query = build_enhanced_user_query(mock_session, {})
+        stmt, params = build_enhanced_user_query({})
+        sql = str(stmt)
         
         # Verify soft-deleted filter is applied
-        mock_session.query.return_value.filter.assert_called()
+        assert "users.deleted_at IS NULL" in sql
         # Verify default ordering by id
-        mock_session.query.return_value.filter.return_value.order_by.assert_called()
+        assert sql.endswith("ORDER BY users.id")
+        assert params == {}
     
-    def test_query_with_legacy_filters(self, mock_session):
+    def test_query_with_legacy_filters(self):
         """Test query building with legacy filters."""
         filters = {
             'first': 'John',
-            'email': 'john@example.com'
+            'email': 'john@example.com',
+            'usbc_id': '12345'
         }
-        query = build_enhanced_user_query(mock_session, filters)
+        stmt, params = build_enhanced_user_query(filters)
         
-        # Should apply filters and ordering
-        assert mock_session.query.called
+        # Values are bound by name; partial matches are wrapped in wildcards
+        assert params == {'first': '%John%', 'email': '%john@example.com%', 'usbc_id': '12345'}
+        assert set(stmt.compile().params) == {'first', 'email', 'usbc_id'}
     
-    def test_query_with_date_filter(self, mock_session):
+    def test_query_with_date_filter(self):
         """Test query building with date filter."""
         created_since = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        query = build_enhanced_user_query(mock_session, {}, created_since=created_since)
+        stmt, params = build_enhanced_user_query({}, created_since=created_since)
         
-        # Should apply date filter
-        assert mock_session.query.called
+        assert "users.created_at >= :created_since" in str(stmt)
+        assert params == {'created_since': created_since}
     
-    def test_query_ordering_options(self, mock_session):
-        """Test different ordering options."""
-        # Test last_name ordering
-        query1 = build_enhanced_user_query(mock_session, {}, order="last_name")
-        
-        # Test created_at ordering  
-        query2 = build_enhanced_user_query(mock_session, {}, order="created_at")
-        
-        # Test default id ordering
-        query3 = build_enhanced_user_query(mock_session, {}, order="id")
+    def test_query_with_role_filter(self):
+        """Test role filtering is expressed in SQL."""
+        stmt, params = build_enhanced_user_query({}, role=ProfileRole.ORG_MEMBER)
         
-        assert mock_session.query.called
+        assert "CASE" in str(stmt)
+        assert params == {'role': 'org_member'}
+    
+    def test_query_ordering_options(self):
+        """Test different ordering options."""
+        last_name, _ = build_enhanced_user_query({}, order="last_name")
+        created_at, _ = build_enhanced_user_query({}, order="created_at")
+        default, _ = build_enhanced_user_query({}, order="id")
+        
+        assert str(last_name).endswith("ORDER BY users.last_name, users.first_name, users.id")
+        assert str(created_at).endswith("ORDER BY users.created_at DESC, users.id")
+        assert str(default).endswith("ORDER BY users.id")
+    
+    def test_statement_cached_per_filter_shape(self):
+        """Test statements are reused for the same filters with different values."""
+        first, first_params = build_enhanced_user_query({'last': 'Doe'}, columns_only=True)
+        second, second_params = build_enhanced_user_query({'last': 'Smith'}, columns_only=True)
+        other, _ = build_enhanced_user_query({'first': 'Doe'}, columns_only=True)
+        
+        assert first is second
+        assert first_params != second_params
+        assert other is not first
+    
+    def test_columns_only_selects_listed_columns(self):
+        """Test the listing statement can select plain columns instead of User objects."""
+        stmt, _ = build_enhanced_user_query({}, columns_only=True)
+        full, _ = build_enhanced_user_query({})
+        
+        assert [c.name for c in stmt.selected_columns] == [c.key for c in USER_LIST_COLUMNS]
+        assert len(full.selected_columns) == len(User.__table__.columns)
 
 
 class TestListUsersEnhanced:
@@ -151,9 +214,7 @@ class TestListUsersEnhanced:
     
     def test_list_all_users(self, mock_session, sample_users):
         """Test listing all users without filters."""
-        mock_query = MagicMock()
-        mock_query.all.return_value = sample_users
-        mock_session.query.return_value.filter.return_value.order_by.return_value = mock_query
+        mock_session.execute.return_value.all.return_value = sample_users
         
         with patch('src.commands.list_users.display_users_table'):
             result = list_users_enhanced()
@@ -162,33 +223,62 @@ class TestListUsersEnhanced:
         assert all(isinstance(user, dict) for user in result)
         assert all('id' in user and 'name' in user and 'role' in user for user in result)
     
+    def test_selects_only_listed_columns(self, mock_session, sample_users):
+        """Test listing selects the displayed columns rather than full User objects."""
+        mock_session.execute.return_value.all.return_value = sample_users
+        
+        with patch('src.commands.list_users.display_users_table'):
+            list_users_enhanced()
+        
+        stmt = mock_session.execute.call_args[0][0]
+        assert [c.name for c in stmt.selected_columns] == [c.key for c in USER_LIST_COLUMNS]
+    
+    def test_user_to_dict_accepts_rows(self):
+        """Test user_to_dict converts selected column rows as well as User objects."""
+        from collections import namedtuple
+        from src.commands.list_users import user_to_dict
+        
+        Row = namedtuple('Row', ['id', 'first_name', 'last_name', 'email', 'created_at'])
+        row = Row(7, 'Jane', 'Smith', 'jane@tournamentorg.com', datetime(2024, 2, 1))
+        
+        assert user_to_dict(row) == {
+            'id': 7,
+            'name': 'Jane Smith',
+            'role': 'org_member',
+            'email': 'jane@tournamentorg.com',
+            'created_at': '2024-02-01T00:00:00'
+        }
+    
+    def test_user_to_row_matches_csv_fields(self):
+        """Test user_to_row yields the values of user_to_dict in CSV column order."""
+        from collections import namedtuple
+        from src.commands.list_users import user_to_dict, user_to_row
+        from utils.csv_writer import USER_CSV_FIELDS
+        
+        Row = namedtuple('Row', ['id', 'first_name', 'last_name', 'email', 'created_at'])
+        row = Row(8, 'John', 'Doe', None, None)
+        
+        assert user_to_row(row) == (8, 'John Doe', 'unregistered_user', '', '')
+        assert tuple(user_to_dict(row)[field] for field in USER_CSV_FIELDS) == user_to_row(row)
+    
     def test_role_filtering(self, mock_session, sample_users):
-        """Test role filtering functionality."""
-        mock_query = MagicMock()
-        mock_query.all.return_value = sample_users
-        mock_session.query.return_value.filter.return_value.order_by.return_value = mock_query
+        """Test role filtering is applied in the query, not in Python."""
+        registered = [u for u in sample_users if u.get_role() == ProfileRole.REGISTERED_USER]
+        mock_session.execute.return_value.all.return_value = registered
         
         with patch('src.commands.list_users.display_users_table'):
-            # Test registered users
             result = list_users_enhanced(role=ProfileRole.REGISTERED_USER)
-            registered_users = [u for u in result if u['role'] == 'registered_user']
-            assert len(registered_users) >= 1
-            
-            # Test unregistered users
-            result = list_users_enhanced(role=ProfileRole.UNREGISTERED_USER)
-            unregistered_users = [u for u in result if u['role'] == 'unregistered_user'] 
-            assert len(unregistered_users) >= 1
-            
-            # Test org members
-            result = list_users_enhanced(role=ProfileRole.ORG_MEMBER)
-            org_members = [u for u in result if u['role'] == 'org_member']
-            assert len(org_members) >= 1
+        
+        # Rows come back already filtered by the database
+        assert [u['id'] for u in result] == [1, 4]
+        assert all(u['role'] == 'registered_user' for u in result)
+        
+        # Role is passed to the database as a bound parameter
+        assert mock_session.execute.call_args[0][1]['role'] == 'registered_user'
     
     def test_date_filtering(self, mock_session, sample_users):
         """Test date filtering functionality."""
-        mock_query = MagicMock()
-        mock_query.all.return_value = sample_users
-        mock_session.query.return_value.filter.return_value.filter.return_value.order_by.return_value = mock_query
+        mock_session.execute.return_value.all.return_value = sample_users
         
         created_since = datetime(2024, 2, 1, tzinfo=timezone.utc)
         
@@ -197,35 +287,48 @@ class TestListUsersEnhanced:
         
         # Should return some users (mocked data includes users after this date)
         assert len(result) >= 1
+        assert mock_session.execute.call_args[0][1]['created_since'] == created_since
     
     def test_csv_export(self, mock_session, sample_users, tmp_path):
         """Test CSV export functionality."""
-        mock_query = MagicMock()
-        mock_query.all.return_value = sample_users
-        mock_session.query.return_value.filter.return_value.order_by.return_value = mock_query
+        mock_session.execute.return_value = iter(sample_users)
         
         csv_path = tmp_path / "test_export.csv"
         
-        with patch('src.commands.list_users.export_users_to_csv') as mock_export:
-            result = list_users_enhanced(csv_path=csv_path)
-            mock_export.assert_called_once()
+        result = list_users_enhanced(csv_path=csv_path)
+        
+        # Rows are streamed through a server-side cursor rather than loaded at once
+        assert result == 4
+        options = mock_session.execute.call_args[0][0].get_execution_options()
+        assert options['stream_results'] is True
+        assert options['yield_per'] == 1000
+        assert len(csv_path.read_text(encoding='utf-8').splitlines()) == 5
     
     def test_pagination_with_small_page_size(self, mock_session, sample_users):
         """Test pagination with small page size."""
-        mock_query = MagicMock()
-        mock_query.all.return_value = sample_users
-        mock_session.query.return_value.filter.return_value.order_by.return_value = mock_query
-        
         with patch('src.commands.list_users.paginate_and_display') as mock_paginate:
             mock_paginate.return_value = [{'id': i} for i in range(4)]
             result = list_users_enhanced(page_size=2)
             mock_paginate.assert_called_once()
+            assert mock_paginate.call_args[0][3:] == (2, "id")
+        
+        # Rows are left for the paginator to fetch page by page
+        mock_session.execute.assert_not_called()
+    
+    def test_no_page_size_fetches_all_rows(self, mock_session, sample_users):
+        """Test page size 0 loads and displays every row at once."""
+        mock_session.execute.return_value.all.return_value = sample_users
+        
+        with patch('src.commands.list_users.display_users_table') as mock_display:
+            result = list_users_enhanced(page_size=0)
+        
+        assert len(result) == 4
+        mock_display.assert_called_once()
+        assert "LIMIT" not in str(mock_session.execute.call_args[0][0])
     
     def test_unicode_name_handling(self, mock_session, sample_users):
         """Test handling of Unicode characters in names."""
-        mock_query = MagicMock()
-        mock_query.all.return_value = sample_users
-        mock_session.query.return_value.filter.return_value.order_by.return_value = mock_query
+        mock_session.execute.return_value.all.return_value = sample_users
         
         with patch('src.commands.list_users.display_users_table'):
             result = list_users_enhanced()
@@ -237,16 +340,25 @@ class TestListUsersEnhanced:
     
     def test_database_error_handling(self, mock_session):
         """Test database error handling."""
-        mock_session.query.side_effect = SQLAlchemyError("Database error")
+        mock_session.execute.side_effect = SQLAlchemyError("Database error")
         
         with pytest.raises(SQLAlchemyError):
             list_users_enhanced()
     
+    def test_session_scope_closed_after_listing(self, mock_session, sample_users):
+        """Test the listing runs in a session scope that is exited afterwards."""
+        mock_session.execute.return_value.all.return_value = sample_users
+        
+        with patch('src.commands.list_users.db_manager') as mock_db:
+            mock_db.session_scope.return_value.__enter__.return_value = mock_session
+            with patch('src.commands.list_users.display_users_table'):
+                list_users_enhanced()
+            
+            mock_db.session_scope.return_value.__exit__.assert_called_once()
+    
     def test_ordering_options(self, mock_session, sample_users):
         """Test different ordering options."""
-        mock_query = MagicMock()
-        mock_query.all.return_value = sample_users
-        mock_session.query.return_value.filter.return_value.order_by.return_value = mock_query
+        mock_session.execute.return_value.all.return_value = sample_users
         
         with patch('src.commands.list_users.display_users_table'):
             # Test each ordering option
@@ -287,37 +399,223 @@ class TestDisplayFunctions:
             # Should create and print a table
             mock_console.print.assert_called()
     
+    def test_display_users_table_formats_created_date(self):
+        """Test created_at is shown as its date part without re-parsing."""
+        users_data = [
+            {'id': 1, 'name': 'John Doe', 'role': 'registered_user',
+             'email': 'john@example.com', 'created_at': '2024-01-15T23:30:00+00:00'},
+            {'id': 2, 'name': 'Jane Doe', 'role': 'unregistered_user',
+             'email': '', 'created_at': ''}
+        ]
+        
+        with patch('src.commands.list_users.Table') as mock_table_class:
+            with patch('src.commands.list_users.Console'):
+                display_users_table(users_data)
+        
+        rows = [c[0] for c in mock_table_class.return_value.add_row.call_args_list]
+        assert rows[0][4] == '2024-01-15'
+        assert rows[1][4] == ''
+        assert rows[0][2] == 'Registered User'
+        assert rows[1][2] == 'Unregistered User'
+    
+    def test_display_users_table_large_page_prints_plain_text(self):
+        """Test pages above the threshold skip Rich table layout."""
+        users_data = [
+            {'id': i, 'name': f'User [{i}]', 'role': 'registered_user',
+             'email': f'user{i}@example.com', 'created_at': '2024-01-15T10:30:00'}
+            for i in range(201)
+        ]
+        
+        with patch('src.commands.list_users.Table') as mock_table_class:
+            with patch('src.commands.list_users.Console') as mock_console_class:
+                display_users_table(users_data)
+        
+        mock_table_class.assert_not_called()
+        args, kwargs = mock_console_class.return_value.print.call_args
+        assert kwargs == {'markup': False, 'highlight': False}
+        assert len(args[0].splitlines()) == 203  # Header + separator + rows
+        assert 'User [200]' in args[0]
+    
+    def test_format_plain_table_aligns_columns(self):
+        """Test plain table columns are padded to the widest cell."""
+        text = format_plain_table([
+            ('1', 'Jo Doe', 'Org Member', 'jo@tournamentorg.com', '2024-01-15'),
+            ('100', 'Al Li', 'Unregistered User', '', '')
+        ])
+        lines = text.splitlines()
+        
+        assert lines[0].startswith("User ID  Name  ")
+        assert lines[2].startswith("      1  Jo Doe  Org Member ")
+        assert lines[3].startswith("    100  Al Li   Unregistered User")
+        assert len({len(line) for line in lines}) == 1
+    
+    def _paged_session(self, total, page_size):
+        """Build a mock session serving users in pages of ``page_size`` (+1 lookahead)."""
+        users = [User(id=i, first_name=f"User{i}", last_name="Test") for i in range(1, total + 1)]
+        session = MagicMock()
+        session.execute.side_effect = [
+            MagicMock(all=MagicMock(return_value=users[start:start + page_size + 1]))
+            for start in range(0, max(total, 1), page_size)
+        ]
+        return session
+    
+    def _statement(self, order="id"):
+        """Build a listing statement and parameters for pagination tests."""
+        return build_enhanced_user_query({}, order=order, columns_only=True)
+    
+    def test_iter_user_pages_is_lazy(self):
+        """Test pages are only queried as they are consumed."""
+        session = self._paged_session(10, 3)
+        stmt, params = self._statement()
+        
+        pages = iter_user_pages(session, stmt, params, 3)
+        session.execute.assert_not_called()
+        
+        page_data, has_more = next(pages)
+        assert [u['id'] for u in page_data] == [1, 2, 3]
+        assert has_more is True
+        session.execute.assert_called_once()
+        
+        # Closing the generator early issues no further queries
+        pages.close()
+        session.execute.assert_called_once()
+    
+    def test_iter_user_pages_last_page(self):
+        """Test the final page reports that no more pages follow."""
+        session = self._paged_session(5, 3)
+        stmt, params = self._statement()
+        
+        pages = list(iter_user_pages(session, stmt, params, 3))
+        
+        assert [len(page_data) for page_data, _ in pages] == [3, 2]
+        assert [has_more for _, has_more in pages] == [True, False]
+    
     def test_paginate_and_display_non_interactive(self):
         """Test pagination in non-interactive environment."""
-        users_data = [{'id': i, 'name': f'User {i}'} for i in range(10)]
+        session = self._paged_session(10, 3)
+        stmt, params = self._statement()
+        
+        with patch('src.commands.list_users.sys.stdin.isatty', return_value=False):
+            with patch('src.commands.list_users.display_users_table') as mock_display:
+                result = paginate_and_display(session, stmt, params, 3)
+        
+        assert [u['id'] for u in result] == list(range(1, 11))
+        assert mock_display.call_count == 4
+        
+        # Later pages continue after the last id seen instead of using OFFSET
+        page_statements = [c[0][0] for c in session.execute.call_args_list]
+        assert "users.id >" not in str(page_statements[0])
+        assert all("users.id >" in str(stmt) for stmt in page_statements[1:])
+        assert not any("OFFSET" in str(stmt) for stmt in page_statements)
+    
+    def test_paginate_and_display_fetches_one_extra_row(self):
+        """Test each page asks for one extra row to detect a following page."""
+        session = self._paged_session(3, 3)
+        stmt, params = self._statement()
+        
+        with patch('src.commands.list_users.display_users_table') as mock_display:
+            result = paginate_and_display(session, stmt, params, 3)
+        
+        page_stmt = session.execute.call_args[0][0]
+        assert page_stmt.compile().params['param_1'] == 4
+        session.execute.assert_called_once()
+        mock_display.assert_called_once()
+        assert len(result) == 3
+    
+    def test_paginate_and_display_offset_for_other_orderings(self):
+        """Test non-id orderings page with OFFSET."""
+        session = self._paged_session(5, 2)
+        stmt, params = self._statement(order="last_name")
         
         with patch('src.commands.list_users.sys.stdin.isatty', return_value=False):
             with patch('src.commands.list_users.display_users_table'):
-                result = paginate_and_display(users_data, 3)
+                result = paginate_and_display(session, stmt, params, 2, order="last_name")
         
-        assert len(result) == 10
+        assert [u['id'] for u in result] == [1, 2, 3, 4, 5]
+        offsets = [c[0][0]._offset for c in session.execute.call_args_list]
+        assert offsets == [0, 2, 4]
     
     def test_paginate_and_display_interactive_quit(self):
         """Test pagination with user quit."""
-        users_data = [{'id': i, 'name': f'User {i}'} for i in range(6)]
+        session = self._paged_session(6, 3)
+        stmt, params = self._statement()
         
         with patch('src.commands.list_users.sys.stdin.isatty', return_value=True):
             with patch('src.commands.list_users.display_users_table'):
                 with patch('builtins.input', return_value='q'):
-                    result = paginate_and_display(users_data, 3)
+                    result = paginate_and_display(session, stmt, params, 3)
+        
+        # Only the page that was viewed is fetched
+        assert len(result) == 3
+        session.execute.assert_called_once()
+    
+    def test_paginate_and_display_interactive_in_memory_database(self):
+        """Test interactive paging works on an in-memory SQLite database."""
+        from storage.database import DatabaseManager
+        
+        db_manager = DatabaseManager("sqlite:///:memory:")
+        db_manager.create_tables()
+        with db_manager.session_scope() as session:
+            session.add_all([User(first_name=f"User{i}", last_name="Test") for i in range(4)])
+        stmt, params = build_enhanced_user_query({}, columns_only=True)
+        
+        with db_manager.session_scope() as session:
+            with patch('src.commands.list_users.sys.stdin.isatty', return_value=True):
+                with patch('src.commands.list_users.display_users_table'):
+                    with patch('builtins.input', return_value=''):
+                        result = paginate_and_display(session, stmt, params, 2)
+        db_manager.close()
+        
+        assert [u['id'] for u in result] == [1, 2, 3, 4]
+    
+    def test_paginate_and_display_prefetches_on_file_database(self, tmp_path):
+        """Test the next page is fetched on a separate session while waiting for the user."""
+        import time
+        from sqlalchemy import event
+        from storage.database import DatabaseManager
+        
+        db_manager = DatabaseManager(f"sqlite:///{tmp_path / 'pages.db'}")
+        db_manager.create_tables()
+        with db_manager.session_scope() as session:
+            session.add_all([User(first_name=f"User{i}", last_name="Test") for i in range(4)])
+        stmt, params = build_enhanced_user_query({}, columns_only=True)
+        selects = []
+        event.listen(db_manager.engine, 'before_cursor_execute',
+                     lambda conn, cursor, statement, *args: selects.append(statement))
+        fetched_before_input = []
+        
+        def fake_input():
+            # Give the background fetch a chance to finish before "pressing Enter"
+            for _ in range(100):
+                if len(selects) == 2:
+                    break
+                time.sleep(0.01)
+            fetched_before_input.append(len(selects))
+            return ''
+        
+        caller_session = db_manager.get_session()
+        with patch('src.commands.list_users.sys.stdin.isatty', return_value=True):
+            with patch('src.commands.list_users.display_users_table'):
+                with patch('builtins.input', side_effect=fake_input):
+                    result = paginate_and_display(caller_session, stmt, params, 2)
         
-        assert len(result) == 6  # Returns full data regardless of quit
+        assert [u['id'] for u in result] == [1, 2, 3, 4]
+        assert fetched_before_input == [2]
+        assert not caller_session.in_transaction()
+        caller_session.close()
+        db_manager.close()
     
     def test_paginate_and_display_keyboard_interrupt(self):
         """Test pagination with keyboard interrupt."""
-        users_data = [{'id': i, 'name': f'User {i}'} for i in range(6)]
+        session = self._paged_session(6, 3)
+        stmt, params = self._statement()
         
         with patch('src.commands.list_users.sys.stdin.isatty', return_value=True):
             with patch('src.commands.list_users.display_users_table'):
                 with patch('builtins.input', side_effect=KeyboardInterrupt):
-                    result = paginate_and_display(users_data, 3)
+                    result = paginate_and_display(session, stmt, params, 3)
         
-        assert len(result) == 6
+        assert len(result) == 3
 
 
 class TestEdgeCases:
@@ -333,9 +631,7 @@ class TestEdgeCases:
                  created_at=datetime(2024, 11, 4, 1, 30, tzinfo=timezone.utc))
         ]
         
-        mock_query = MagicMock()
-        mock_query.all.return_value = users
-        mock_session.query.return_value.filter.return_value.filter.return_value.order_by.return_value = mock_query
+        mock_session.execute.return_value.all.return_value = users
         
         # Filter for users after DST transition
         created_since = datetime(2024, 11, 3, tzinfo=timezone.utc)
@@ -347,9 +643,7 @@ class TestEdgeCases:
     
     def test_empty_database_result(self, mock_session):
         """Test handling empty database results."""
-        mock_query = MagicMock()
-        mock_query.all.return_value = []
-        mock_session.query.return_value.filter.return_value.order_by.return_value = mock_query
+        mock_session.execute.return_value.all.return_value = []
         
         with patch('src.commands.list_users.display_users_table'):
             result = list_users_enhanced()
@@ -369,12 +663,10 @@ class TestEdgeCases:
             )
             large_user_list.append(user)
         
-        mock_query = MagicMock()
-        mock_query.all.return_value = large_user_list
-        mock_session.query.return_value.filter.return_value.order_by.return_value = mock_query
+        mock_session.execute.return_value.all.return_value = large_user_list
         
         with patch('src.commands.list_users.display_users_table'):
-            result = list_users_enhanced()
+            result = list_users_enhanced(page_size=0)
         
         assert len(result) == 1000
         # Verify data structure is maintained
@@ -382,9 +674,7 @@ class TestEdgeCases:
     
     def test_special_characters_in_filters(self, mock_session, sample_users):
         """Test handling special characters in filter strings."""
-        mock_query = MagicMock()
-        mock_query.all.return_value = sample_users
-        mock_session.query.return_value.filter.return_value.order_by.return_value = mock_query
+        mock_session.execute.return_value.all.return_value = sample_users
         
         # Test with special characters that could cause SQL issues
         with patch('src.commands.list_users.display_users_table'):
@@ -397,6 +687,57 @@ class TestEdgeCases:
         assert isinstance(result, list)
 
 
+class TestQueryCount:
+    """Test listing users runs a fixed number of queries regardless of row count."""
+    
+    @pytest.fixture
+    def db_with_users(self):
+        """Create an in-memory database with users of every role."""
+        from sqlalchemy import event
+        from storage.database import DatabaseManager
+        
+        db_manager = DatabaseManager("sqlite:///:memory:")
+        db_manager.create_tables()
+        with db_manager.session_scope() as session:
+            session.add_all([
+                User(
+                    first_name=f"User{i}",
+                    last_name="Test",
+                    email=[None, f"user{i}@example.com", f"user{i}@tournamentorg.com"][i % 3]
+                )
+                for i in range(30)
+            ])
+        
+        statements = []
+        event.listen(
+            db_manager.engine,
+            'before_cursor_execute',
+            lambda conn, cursor, statement, *args: statements.append(statement)
+        )
+        with patch('src.commands.list_users.db_manager', db_manager):
+            yield statements
+        db_manager.close()
+    
+    def test_enhanced_listing_is_single_query(self, db_with_users):
+        """Test roles are derived without a query per user (no N+1)."""
+        with patch('src.commands.list_users.display_users_table'):
+            result = list_users_enhanced(page_size=0)
+        
+        assert len(result) == 30
+        assert {u['role'] for u in result} == {role.value for role in ProfileRole}
+        assert len(db_with_users) == 1
+    
+    def test_legacy_listing_roles_need_no_extra_queries(self, db_with_users):
+        """Test get_role() on listed users does not lazy-load relationships."""
+        from src.commands.list_users import list_users
+        
+        users = list_users()
+        roles = {user.get_role() for user in users}
+        
+        assert roles == set(ProfileRole)
+        assert len(db_with_users) == 1
+
+
 class TestBackwardCompatibility:
     """Test backward compatibility with legacy list_users function."""
     
@@ -404,16 +745,8 @@ class TestBackwardCompatibility:
         """Test that legacy list_users function still works."""
         from src.commands.list_users import list_users
         
-        # Set up proper mock chain
-        mock_query = MagicMock()
-        mock_query.all.return_value = sample_users
-        
-        # Create the full mock chain
-        query_mock = mock_session.query.return_value
-        filter_mock = query_mock.filter.return_value
-        filter_mock2 = filter_mock.filter.return_value
-        filter_mock3 = filter_mock2.filter.return_value
-        filter_mock3.order_by.return_value = mock_query
+        # Set up the statement result
+        mock_session.execute.return_value.scalars.return_value.all.return_value = sample_users
         
         result = list_users(first="John", email="john@example.com")
         
@@ -0,0 +1,28 @@
+"""Tests for structured logging utilities."""
+
+import json
+
+from core.logging import log_merge_event, validate_log_entry
+
+
+class TestLogMergeEvent:
+    """Test cases for log_merge_event."""
+    
+    def test_writes_one_line_with_per_user_resolutions(self, tmp_path, monkeypatch):
+        """Test a merge is logged as one JSON line keeping each user's decisions."""
+        monkeypatch.chdir(tmp_path)
+        
+        log_merge_event(1, [2, 3], {
+            2: {'email': 'kept_primary', 'phone': 'kept_duplicate'},
+            3: {'email': 'kept_duplicate'}
+        })
+        
+        lines = (tmp_path / "logs" / "merge_profile.log").read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 1
+        entry = json.loads(lines[0])
+        assert entry["field_resolutions"] == {'email': 'kept_duplicate', 'phone': 'kept_duplicate'}
+        assert entry["resolutions_by_user"] == {
+            '2': {'email': 'kept_primary', 'phone': 'kept_duplicate'},
+            '3': {'email': 'kept_duplicate'}
+        }
+        assert validate_log_entry(entry) is True
@@ -1,7 +1,7 @@
 """Clean tests for merge profiles functionality."""
 
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, PropertyMock, patch
 from click.testing import CliRunner
 
 from main import cli
@@ -43,7 +43,8 @@ class TestMergeCommand:
             merge_ids=[2],
             dry_run=False,
             resolution_mode=None,
-            no_interactive=False
+            no_interactive=False,
+            lock_mode='wait'
         )
     
     @patch('src.commands.merge.merge_profiles')
@@ -263,4 +264,400 @@ class TestMergeIntegration:
         
         assert result.exit_code == 0
         assert "-m" in result.output  # Short flag for --main-id
-        assert "-i" in result.output  # Short flag for --merge-id
\ No newline at end of file
+        assert "-i" in result.output  # Short flag for --merge-id
+    
+    def test_merge_lock_mode_option(self):
+        """Test merge passes --lock-mode through to merge_profiles."""
+        runner = CliRunner()
+        with patch('main.merge_profiles', return_value=0) as mock_merge_profiles:
+            result = runner.invoke(cli, ['merge', '-m', '1', '-i', '2', '--lock-mode', 'nowait'])
+        
+        assert result.exit_code == 0
+        assert mock_merge_profiles.call_args.kwargs['lock_mode'] == 'nowait'
+
+
+class TestMergeUserLocking:
+    """Test how merge_profiles fetches and locks users."""
+    
+    @pytest.fixture
+    def db_with_users(self):
+        """Create an in-memory database with four users and record its queries."""
+        from sqlalchemy import event
+        from storage.database import DatabaseManager
+        
+        db_manager = DatabaseManager("sqlite:///:memory:")
+        db_manager.create_tables()
+        with db_manager.session_scope() as session:
+            session.add_all([
+                User(id=i, first_name=f"User{i}", last_name="Test", phone=f"555-000{i}" if i == 3 else None)
+                for i in range(1, 5)
+            ])
+        
+        statements = []
+        event.listen(
+            db_manager.engine,
+            'before_cursor_execute',
+            lambda conn, cursor, statement, *args: statements.append(statement)
+        )
+        with patch('src.commands.merge.db_manager', db_manager), \
+                patch('src.commands.merge.log_merge_event') as mock_log:
+            yield db_manager, statements, mock_log
+        db_manager.close()
+    
+    @staticmethod
+    def _mock_session(*results):
+        """Create a mock session whose queries return the given user lists in turn."""
+        mock_session = MagicMock()
+        mock_session.execute.return_value.all.side_effect = list(results)
+        return mock_session
+    
+    @staticmethod
+    def _users(*user_ids):
+        """Create transient active users with the given IDs."""
+        return [User(id=user_id, first_name="User", last_name=str(user_id)) for user_id in user_ids]
+    
+    def test_users_read_then_relocked(self, db_with_users):
+        """Test users are read once without locks and re-read once before writing."""
+        from src.commands.merge import merge_profiles
+        db_manager, statements, mock_log = db_with_users
+        
+        result = merge_profiles(main_id=2, merge_ids=[4, 3, 1], no_interactive=True)
+        
+        assert result == 0
+        mock_log.assert_called_once_with(2, [4, 3, 1], {3: {'phone': 'kept_duplicate'}})
+        selects = [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+        assert len(selects) == 2
+        assert all("IN" in s and "ORDER BY users.id" in s for s in selects)
+        
+        with db_manager.session_scope() as session:
+            users = {user.id: user for user in session.query(User).all()}
+            assert users[2].phone == "555-0003"
+            assert not users[2].is_deleted()
+            assert all(users[i].is_deleted() for i in (1, 3, 4))
+    
+    def test_users_locked_in_id_order(self):
+        """Test only the second query locks, ordered by ID regardless of argument order."""
+        from src.commands.merge import merge_profiles
+        
+        mock_session = self._mock_session(self._users(5, 7, 9), self._users(5, 7, 9))
+        mock_session.execute.return_value.rowcount = 2
+        with patch('src.commands.merge.db_manager') as mock_db_manager, \
+                patch('src.commands.merge.log_merge_event'):
+            mock_db_manager.get_session.return_value = mock_session
+            assert merge_profiles(main_id=9, merge_ids=[5, 7], no_interactive=True) == 0
+        
+        read_stmt, stmt, *_ = [call[0][0] for call in mock_session.execute.call_args_list]
+        assert read_stmt._for_update_arg is None
+        assert stmt._for_update_arg is not None
+        compiled = stmt.compile(compile_kwargs={"render_postcompile": True})
+        assert list(compiled.params.values()) == [5, 7, 9]
+        assert "ORDER BY users.id" in str(compiled)
+    
+    @pytest.mark.parametrize("lock_mode,nowait,skip_locked", [
+        ("wait", False, False),
+        ("nowait", True, False),
+        ("skip", False, True),
+    ])
+    def test_lock_mode_options(self, lock_mode, nowait, skip_locked):
+        """Test each lock mode is passed through to FOR UPDATE."""
+        from src.commands.merge import merge_profiles
+        
+        mock_session = self._mock_session(self._users(1, 2), self._users(1, 2))
+        with patch('src.commands.merge.db_manager') as mock_db_manager, \
+                patch('src.commands.merge.log_merge_event'):
+            mock_db_manager.get_session.return_value = mock_session
+            merge_profiles(main_id=1, merge_ids=[2], no_interactive=True, lock_mode=lock_mode)
+        
+        for_update = mock_session.execute.call_args_list[1][0][0]._for_update_arg
+        assert for_update.nowait is nowait
+        assert for_update.skip_locked is skip_locked
+    
+    def test_lock_timeout_set_on_postgresql(self):
+        """Test the write phase bounds its lock wait before locking on PostgreSQL."""
+        from src.commands.merge import MERGE_LOCK_TIMEOUT, merge_profiles
+        
+        mock_session = self._mock_session(self._users(1, 2), self._users(1, 2))
+        mock_session.get_bind.return_value.dialect.name = "postgresql"
+        with patch('src.commands.merge.db_manager') as mock_db_manager, \
+                patch('src.commands.merge.log_merge_event'):
+            mock_db_manager.get_session.return_value = mock_session
+            merge_profiles(main_id=1, merge_ids=[2], no_interactive=True)
+        
+        statements = [call[0][0] for call in mock_session.execute.call_args_list]
+        assert str(statements[1]) == f"SET LOCAL lock_timeout = '{MERGE_LOCK_TIMEOUT}'"
+        assert statements[2]._for_update_arg is not None
+    
+    def test_lock_not_available_exit_code(self, capsys):
+        """Test a lock held elsewhere in nowait mode exits with code 6."""
+        from sqlalchemy.exc import OperationalError
+        from src.commands.merge import merge_profiles
+        
+        mock_session = self._mock_session(self._users(1, 2))
+        orig = MagicMock(spec=["pgcode"], pgcode="55P03")
+        mock_session.execute.side_effect = [
+            mock_session.execute.return_value,
+            OperationalError("SELECT ...", {}, orig)
+        ]
+        with patch('src.commands.merge.db_manager') as mock_db_manager:
+            mock_db_manager.get_session.return_value = mock_session
+            result = merge_profiles(main_id=1, merge_ids=[2], no_interactive=True, lock_mode="nowait")
+        
+        assert result == 6
+        assert "locked by another operation" in capsys.readouterr().err
+        mock_session.rollback.assert_called_once()
+    
+    def test_skip_mode_reports_locked_users(self, capsys):
+        """Test users left out by skip mode are reported as not found or locked."""
+        from src.commands.merge import merge_profiles
+        
+        mock_session = self._mock_session(self._users(1, 2), self._users(2))
+        with patch('src.commands.merge.db_manager') as mock_db_manager, \
+                patch('src.commands.merge.log_merge_event') as mock_log:
+            mock_db_manager.get_session.return_value = mock_session
+            result = merge_profiles(main_id=1, merge_ids=[2], no_interactive=True, lock_mode="skip")
+        
+        assert result == 4
+        assert "Main user with ID 1 not found or locked" in capsys.readouterr().err
+        mock_log.assert_not_called()
+    
+    def test_concurrent_change_detected(self, tmp_path, capsys):
+        """Test a user changed by another connection mid-merge aborts with exit code 7."""
+        from sqlalchemy import text
+        from storage.database import DatabaseManager
+        from src.commands.merge import merge_profiles
+        
+        db_manager = DatabaseManager(f"sqlite:///{tmp_path / 'merge.db'}")
+        db_manager.create_tables()
+        with db_manager.session_scope() as session:
+            session.add_all([
+                User(id=1, first_name="Main", last_name="User"),
+                User(id=2, first_name="Dup", last_name="User", phone="555-0002"),
+            ])
+        
+        def concurrent_edit(main_user, merge_users):
+            # Another connection edits the main user while the prompt is open
+            with db_manager.engine.begin() as conn:
+                conn.execute(text("UPDATE users SET address = 'Elsewhere', version = version + 1 WHERE id = 1"))
+            return True
+        
+        try:
+            with patch('src.commands.merge.db_manager', db_manager), \
+                    patch('src.commands.merge.log_merge_event') as mock_log, \
+                    patch('src.commands.merge._confirm_merge', side_effect=concurrent_edit):
+                result = merge_profiles(main_id=1, merge_ids=[2])
+            
+            assert result == 7
+            assert "changed by another operation" in capsys.readouterr().err
+            mock_log.assert_not_called()
+            with db_manager.session_scope() as session:
+                assert session.get(User, 1).phone is None
+                assert not session.get(User, 2).is_deleted()
+        finally:
+            db_manager.close()
+    
+    def test_main_user_written_in_one_update(self, db_with_users):
+        """Test the main user's new values go out in one versioned UPDATE."""
+        from src.commands.merge import merge_profiles
+        db_manager, statements, mock_log = db_with_users
+        
+        assert merge_profiles(main_id=2, merge_ids=[3], no_interactive=True) == 0
+        
+        main_updates = [s for s in statements if s.lstrip().upper().startswith("UPDATE") and "phone" in s]
+        assert len(main_updates) == 1
+        assert "users.version = ?" in main_updates[0]
+        with db_manager.session_scope() as session:
+            main_user = session.get(User, 2)
+            assert main_user.phone == "555-0003"
+            assert main_user.version == 2
+    
+    def test_merge_users_soft_deleted_in_one_update(self, db_with_users):
+        """Test all merge users are soft-deleted by a single UPDATE."""
+        from src.commands.merge import merge_profiles
+        db_manager, statements, mock_log = db_with_users
+        
+        assert merge_profiles(main_id=1, merge_ids=[2, 4], no_interactive=True) == 0
+        
+        deletes = [s for s in statements if s.lstrip().upper().startswith("UPDATE") and "deleted_at" in s]
+        assert len(deletes) == 1
+        with db_manager.session_scope() as session:
+            users = {user.id: user for user in session.query(User).all()}
+            assert users[2].is_deleted() and users[4].is_deleted()
+            assert users[2].version == 2
+            assert not users[1].is_deleted() and not users[3].is_deleted()
+    
+    def test_no_transaction_open_while_confirming(self, db_with_users):
+        """Test the confirmation prompt runs with no transaction or lock held."""
+        from src.commands.merge import merge_profiles
+        db_manager, statements, mock_log = db_with_users
+        session = db_manager.get_session()
+        
+        def confirm(main_user, merge_users):
+            assert not session.in_transaction()
+            return True
+        
+        with patch.object(db_manager, 'get_session', return_value=session), \
+                patch('src.commands.merge._confirm_merge', side_effect=confirm) as mock_confirm:
+            assert merge_profiles(main_id=1, merge_ids=[2]) == 0
+        
+        mock_confirm.assert_called_once()
+        mock_log.assert_called_once()
+    
+    def test_caller_session_left_open(self, db_with_users):
+        """Test a merge does not touch the caller's scoped session or its transaction."""
+        from src.commands.merge import merge_profiles
+        db_manager, statements, mock_log = db_with_users
+        caller_session = db_manager.Session()
+        caller_session.get(User, 1)
+        
+        assert merge_profiles(main_id=1, merge_ids=[2], no_interactive=True) == 0
+        
+        assert caller_session.in_transaction()
+        assert caller_session.get(User, 1) is not None
+        caller_session.commit()
+    
+    def test_user_deleted_before_write_detected(self, db_with_users, capsys):
+        """Test a merge user soft-deleted between read and write aborts with exit code 7."""
+        from src.commands.merge import merge_profiles
+        db_manager, statements, mock_log = db_with_users
+        
+        def concurrent_delete(main_user, merge_users):
+            with db_manager.session_scope() as other:
+                other.get(User, 2).soft_delete()
+            return True
+        
+        with patch('src.commands.merge._confirm_merge', side_effect=concurrent_delete):
+            assert merge_profiles(main_id=1, merge_ids=[2]) == 7
+        
+        assert "changed by another operation" in capsys.readouterr().err
+        mock_log.assert_not_called()
+    
+    def test_users_fetched_as_core_rows(self, db_with_users):
+        """Test merge reads plain rows that the session does not track."""
+        from sqlalchemy.engine import Row
+        from src.commands.merge import _fetch_users
+        db_manager, statements, mock_log = db_with_users
+        
+        with db_manager.session_scope() as session:
+            users = _fetch_users(session, [1, 3])
+            
+            assert list(users) == [1, 3]
+            assert all(isinstance(row, Row) for row in users.values())
+            assert users[3].phone == "555-0003" and users[3].version == 1
+            assert len(session.identity_map) == 0
+    
+    def test_repeated_merge_id_merged_once(self, db_with_users):
+        """Test a merge ID given twice on the command line is merged once."""
+        from click.testing import CliRunner
+        from main import cli
+        db_manager, statements, mock_log = db_with_users
+        
+        result = CliRunner().invoke(cli, ['merge', '-m', '1', '-i', '2', '-i', '2', '--no-interactive'])
+        
+        assert result.exit_code == 0, result.output
+        mock_log.assert_called_once_with(1, [2], {})
+        with db_manager.session_scope() as session:
+            assert session.get(User, 2).is_deleted()
+    
+    def test_missing_merge_user_reported(self, db_with_users):
+        """Test a merge ID missing from the batch result is still reported."""
+        from src.commands.merge import merge_profiles
+        
+        assert merge_profiles(main_id=1, merge_ids=[2, 99], no_interactive=True) == 4
+
+
+class TestCompareMergeFields:
+    """Test conflict and fill detection between two users."""
+    
+    def test_conflicts_and_fillable_fields(self):
+        """Test differing values conflict and values missing on main are fillable."""
+        from src.commands.merge import _compare_merge_fields, _normalize_merge_fields
+        
+        main_user = User(id=1, first_name="Main", last_name="User",
+                         email="main@example.com", phone="555-0001", usbc_id=" 123 ")
+        merge_user = User(id=2, first_name="Merge", last_name="User",
+                          email="merge@example.com", phone=None, address="1 Main St", usbc_id="123")
+        
+        conflicts, fillable = _compare_merge_fields(
+            _normalize_merge_fields(User._merge_getter(main_user)), merge_user
+        )
+        
+        assert conflicts == {'email': ("main@example.com", "merge@example.com")}
+        assert fillable == {'address': "1 Main St"}
+    
+    def test_identical_profiles_have_nothing_to_merge(self):
+        """Test a merge user with the same values yields no conflicts or fills."""
+        from src.commands.merge import _compare_merge_fields, _normalize_merge_fields
+        
+        fields = dict(email="same@example.com", phone="555-0001", address="1 Main St", usbc_id="1", tnba_id="2")
+        main_user = User(id=1, first_name="Main", last_name="User", **fields)
+        merge_user = User(id=2, first_name="Merge", last_name="User", **fields)
+        
+        main_fields = _normalize_merge_fields(User._merge_getter(main_user))
+        
+        assert _compare_merge_fields(main_fields, merge_user) == ({}, {})
+    
+    def test_normalize_merge_fields(self):
+        """Test values are paired with their stripped text, empty for missing values."""
+        from src.commands.merge import _normalize_merge_fields
+        
+        user = User(id=1, first_name="Main", last_name="User", email=" main@example.com ", tnba_id=None)
+        
+        assert _normalize_merge_fields(User._merge_getter(user)) == (
+            (" main@example.com ", "main@example.com"),
+            (None, ''),
+            (None, ''),
+            (None, ''),
+            (None, ''),
+        )
+
+
+class TestDryRunPreview:
+    """Test the dry-run preview output."""
+    
+    def test_conflict_details_name_each_user(self, capsys):
+        """Test conflict details are listed under the matching merge user."""
+        from src.commands.merge import _show_dry_run_preview
+        
+        main_user = User(id=1, first_name="Main", last_name="User")
+        merge_users = [
+            User(id=2, first_name="Ann", last_name="Lee"),
+            User(id=3, first_name="Bob", last_name="Ray"),
+        ]
+        all_conflicts = {3: {'phone': ("555-0001", "555-0003")}}
+        
+        _show_dry_run_preview(main_user, merge_users, all_conflicts)
+        
+        output = capsys.readouterr().out
+        assert "User 3 (Bob Ray):" in output
+        assert "User 2 (Ann Lee):" not in output
+    
+    def test_non_terminal_output_streams_rows(self, capsys):
+        """Test output to a pipe is printed as tab-separated lines."""
+        from src.commands.merge import _show_dry_run_preview
+        
+        main_user = User(id=1, first_name="Main", last_name="User")
+        merge_users = [User(id=2, first_name="Ann", last_name="Lee")]
+        
+        _show_dry_run_preview(main_user, merge_users, {2: {'phone': ("1", "2"), 'email': ("a", "b")}})
+        
+        lines = capsys.readouterr().out.splitlines()
+        assert "User ID\tName\tAction\tConflicts" in lines
+        assert "2\tAnn Lee\tSoft delete\tphone, email" in lines
+    
+    def test_terminal_output_uses_table_for_small_batches(self, capsys):
+        """Test a terminal gets the Rich table unless the batch is large."""
+        from rich.console import Console
+        from src.commands.merge import DRY_RUN_TABLE_LIMIT, _show_dry_run_preview
+        
+        main_user = User(id=1, first_name="Main", last_name="User")
+        small = [User(id=2, first_name="Ann", last_name="Lee")]
+        large = [User(id=i, first_name="U", last_name=str(i)) for i in range(2, DRY_RUN_TABLE_LIMIT + 3)]
+        
+        with patch.object(Console, 'is_terminal', new_callable=PropertyMock, return_value=True):
+            _show_dry_run_preview(main_user, small, {})
+            assert "Merge Summary" in capsys.readouterr().out
+            
+            _show_dry_run_preview(main_user, large, {})
+            output = capsys.readouterr().out
+            assert "Merge Summary" not in output
+            assert f"{DRY_RUN_TABLE_LIMIT + 2}\tU {DRY_RUN_TABLE_LIMIT + 2}\tSoft delete\tNone" in output
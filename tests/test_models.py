@@ -3,7 +3,7 @@
 import pytest
 from datetime import datetime
 
-from core.models import User, Base
+from core.models import User, Base, ProfileRole
 from storage.database import DatabaseManager
 
 
@@ -52,6 +52,108 @@ class TestUserModel:
         assert user.tnba_id == "67890"
         assert isinstance(user.created_at, datetime)
     
+    def test_role_expression_matches_get_role(self, session):
+        """Test the SQL role expression classifies users like get_role()."""
+        session.add_all([
+            User(email="john@example.com", first_name="John", last_name="Doe"),
+            User(email="jane@tournamentorg.com", first_name="Jane", last_name="Smith"),
+            User(email="root@admin.com", first_name="Root", last_name="Admin"),
+            User(email=None, first_name="Bob", last_name="Wilson"),
+            User(email="   ", first_name="Blank", last_name="Email"),
+        ])
+        session.commit()
+        
+        for role in ProfileRole:
+            matched = session.query(User).filter(User.role_expression() == role.value).all()
+            assert matched
+            assert all(user.get_role() == role for user in matched)
+        
+        assert session.query(User).filter(
+            User.role_expression() == ProfileRole.ORG_MEMBER.value
+        ).count() == 2
+    
+    def test_trigram_indexes_postgresql_only(self, db_manager):
+        """Test trigram search indexes are created only on PostgreSQL."""
+        from sqlalchemy import inspect
+        from sqlalchemy.dialects import postgresql
+        from sqlalchemy.schema import CreateIndex
+        
+        index_names = {index['name'] for index in inspect(db_manager.engine).get_indexes('users')}
+        assert not any(name.endswith('_trgm') for name in index_names)
+        
+        index = next(ix for ix in User.__table__.indexes if ix.name == 'ix_users_first_name_trgm')
+        ddl = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+        assert 'USING gin (first_name gin_trgm_ops)' in ddl
+    
+    def test_active_user_listing_uses_partial_indexes(self, db_manager):
+        """Test active-user listings in each order scan a partial index instead of sorting."""
+        from sqlalchemy import text
+        
+        orderings = {
+            'ix_users_active_id': 'ORDER BY id',
+            'ix_users_active_name': 'ORDER BY last_name, first_name, id',
+            'ix_users_active_created': 'ORDER BY created_at DESC, id',
+        }
+        with db_manager.engine.connect() as conn:
+            for index_name, order_by in orderings.items():
+                plan = conn.execute(text(
+                    f"EXPLAIN QUERY PLAN SELECT id FROM users WHERE deleted_at IS NULL {order_by} LIMIT 50"
+                )).all()
+                details = " ".join(row[-1] for row in plan)
+                assert index_name in details
+                assert "TEMP B-TREE" not in details
+    
+    def test_version_incremented_on_update(self, session):
+        """Test the row version starts at 1 and is bumped by each ORM update."""
+        user = User(first_name="John", last_name="Doe")
+        session.add(user)
+        session.commit()
+        assert user.version == 1
+        
+        user.phone = "555-1234"
+        session.commit()
+        assert user.version == 2
+    
+    def test_stale_update_rejected(self, session):
+        """Test an update based on an outdated version raises StaleDataError."""
+        from sqlalchemy import update
+        from sqlalchemy.orm.exc import StaleDataError
+        
+        user = User(first_name="John", last_name="Doe")
+        session.add(user)
+        session.commit()
+        
+        # Simulate another transaction changing the row behind the ORM's back
+        session.execute(
+            update(User).where(User.id == user.id).values(version=User.version + 1),
+            execution_options={"synchronize_session": False}
+        )
+        
+        user.phone = "555-1234"
+        with pytest.raises(StaleDataError):
+            session.commit()
+    
+    @pytest.mark.parametrize("email", [
+        None, "", "   ", "\t", "\u00a0", "bob@example.com", "bob@admin.com",
+        "Bob@Admin.com", "ann@TournamentOrg.com", "ann@tournamentorg.com", "admin.com",
+    ])
+    def test_role_expression_matches_get_role(self, session, email):
+        """Test the SQL role filter classifies edge-case emails like get_role()."""
+        user = User(email=email, first_name="Edge", last_name="Case")
+        session.add(user)
+        session.commit()
+        
+        sql_role = session.query(User.role_expression()).filter(User.id == user.id).scalar()
+        
+        assert sql_role == user.get_role().value
+    
+    def test_merge_getter_returns_mergeable_fields(self):
+        """Test the merge getter reads MERGEABLE_FIELDS in order."""
+        user = User(first_name="Jane", last_name="Doe", email="jane@example.com", tnba_id="T1")
+        
+        assert User._merge_getter(user) == ("jane@example.com", None, None, None, "T1")
+        assert len(User._merge_getter(user)) == len(User.MERGEABLE_FIELDS)
+    
     def test_user_creation_required_fields_only(self, session):
         """Test creating a user with only required fields."""
         user = User(
@@ -28,7 +28,7 @@ class TestProfileFunctions:
         with patch('core.profile.db_manager.get_session') as mock_get_session:
             mock_session = MagicMock()
             mock_get_session.return_value = mock_session
-            mock_session.query.return_value.filter.return_value.first.return_value = mock_user
+            mock_session.get.return_value = mock_user
             
             result = get_profile(user_id=1)
             assert result == mock_user
@@ -98,7 +98,7 @@ class TestProfileFunctions:
         with patch('core.profile.db_manager.get_session') as mock_get_session:
             mock_session = MagicMock()
             mock_get_session.return_value = mock_session
-            mock_session.query.return_value.filter.return_value.first.return_value = None
+            mock_session.get.return_value = None
             
             result = get_profile(user_id=999)
             assert result is None
@@ -117,7 +117,7 @@ class TestProfileFunctions:
         with patch('core.profile.db_manager.get_session') as mock_get_session:
             mock_session = MagicMock()
             mock_get_session.return_value = mock_session
-            mock_session.query.return_value.filter.return_value.first.return_value = mock_user
+            mock_session.get.return_value = mock_user
             
             result = edit_profile(user_id=1, first="Jane", phone="555-5678")
             assert result is True
@@ -131,7 +131,7 @@ class TestProfileFunctions:
         with patch('core.profile.db_manager.get_session') as mock_get_session:
             mock_session = MagicMock()
             mock_get_session.return_value = mock_session
-            mock_session.query.return_value.filter.return_value.first.return_value = None
+            mock_session.get.return_value = None
             
             result = edit_profile(user_id=999, first="Jane")
             assert result is False
@@ -150,7 +150,7 @@ class TestProfileFunctions:
         with patch('core.profile.db_manager.get_session') as mock_get_session:
             mock_session = MagicMock()
             mock_get_session.return_value = mock_session
-            mock_session.query.return_value.filter.return_value.first.return_value = mock_user
+            mock_session.get.return_value = mock_user
             
             with pytest.raises(ValueError, match="First name cannot be empty"):
                 edit_profile(user_id=1, first="")
@@ -170,7 +170,7 @@ class TestProfileFunctions:
         with patch('core.profile.db_manager.get_session') as mock_get_session:
             mock_session = MagicMock()
             mock_get_session.return_value = mock_session
-            mock_session.query.return_value.filter.return_value.first.return_value = mock_user
+            mock_session.get.return_value = mock_user
             
             result = delete_profile(user_id=1)
             assert result is True
@@ -183,7 +183,7 @@ class TestProfileFunctions:
         with patch('core.profile.db_manager.get_session') as mock_get_session:
             mock_session = MagicMock()
             mock_get_session.return_value = mock_session
-            mock_session.query.return_value.filter.return_value.first.return_value = None
+            mock_session.get.return_value = None
             
             result = delete_profile(user_id=999)
             assert result is False
@@ -7,9 +7,8 @@ from sqlalchemy.exc import IntegrityError
 from src.commands.remove_org_user import (
     remove_users_from_organization,
     validate_organization_exists,
-    validate_user_exists,
-    check_user_membership,
     deduplicate_user_ids,
+    fetch_user_memberships,
     remove_org_user_command
 )
 from core.models import Organization, User, OrganizationMembership
@@ -52,80 +51,6 @@ class TestValidateOrganizationExists:
             validate_organization_exists(mock_session, 999)
 
 
-class TestValidateUserExists:
-    """Test user existence validation."""
-    
-    def test_validate_user_exists_success(self):
-        """Test successful user validation."""
-        mock_session = Mock()
-        mock_query = Mock()
-        mock_filter = Mock()
-        mock_user = Mock(spec=User)
-        mock_user.id = 123
-        mock_user.first_name = "John"
-        mock_user.last_name = "Doe"
-        
-        mock_session.query.return_value = mock_query
-        mock_query.filter.return_value = mock_filter
-        mock_filter.first.return_value = mock_user
-        
-        result = validate_user_exists(mock_session, 123)
-        
-        assert result == mock_user
-        mock_session.query.assert_called_once_with(User)
-    
-    def test_validate_user_exists_not_found(self):
-        """Test user not found returns None."""
-        mock_session = Mock()
-        mock_query = Mock()
-        mock_filter = Mock()
-        
-        mock_session.query.return_value = mock_query
-        mock_query.filter.return_value = mock_filter
-        mock_filter.first.return_value = None
-        
-        result = validate_user_exists(mock_session, 999)
-        
-        assert result is None
-
-
-class TestCheckUserMembership:
-    """Test user membership checking."""
-    
-    def test_check_user_membership_exists(self):
-        """Test checking existing membership."""
-        mock_session = Mock()
-        mock_query = Mock()
-        mock_filter = Mock()
-        mock_membership = Mock(spec=OrganizationMembership)
-        mock_membership.id = 1
-        mock_membership.user_id = 123
-        mock_membership.organization_id = 1
-        
-        mock_session.query.return_value = mock_query
-        mock_query.filter.return_value = mock_filter
-        mock_filter.first.return_value = mock_membership
-        
-        result = check_user_membership(mock_session, 123, 1)
-        
-        assert result == mock_membership
-        mock_session.query.assert_called_once_with(OrganizationMembership)
-    
-    def test_check_user_membership_not_exists(self):
-        """Test checking non-existing membership."""
-        mock_session = Mock()
-        mock_query = Mock()
-        mock_filter = Mock()
-        
-        mock_session.query.return_value = mock_query
-        mock_query.filter.return_value = mock_filter
-        mock_filter.first.return_value = None
-        
-        result = check_user_membership(mock_session, 123, 1)
-        
-        assert result is None
-
-
 class TestDeduplicateUserIds:
     """Test user ID deduplication."""
     
@@ -157,6 +82,14 @@ class TestDeduplicateUserIds:
 class TestRemoveUsersFromOrganization:
     """Test removing users from organization."""
     
+    def _assert_bulk_deleted(self, mock_session, user_ids):
+        """Assert memberships were removed by a single DELETE for the given users."""
+        query = mock_session.query.return_value
+        mock_session.query.assert_called_once_with(OrganizationMembership)
+        query.filter.return_value.delete.assert_called_once_with(synchronize_session=False)
+        in_clause = query.filter.call_args[0][1]
+        assert in_clause.right.value == user_ids
+    
     @patch('src.commands.remove_org_user.db_manager')
     @patch('sys.exit')
     @patch('click.echo')
@@ -172,33 +105,22 @@ class TestRemoveUsersFromOrganization:
         """Test successfully removing single user."""
         # Setup mocks
         mock_session = Mock()
-        mock_db_manager.get_session.return_value = mock_session
+        mock_db_manager.session_scope.return_value.__enter__.return_value = mock_session
         
         # Mock organization exists
         mock_organization = Mock(spec=Organization)
         mock_organization.id = 1
         
-        # Mock user exists
-        mock_user = Mock(spec=User)
-        mock_user.id = 123
-        
-        # Mock membership exists
-        mock_membership = Mock(spec=OrganizationMembership)
-        mock_membership.id = 1
-        mock_membership.user_id = 123
-        mock_membership.organization_id = 1
-        
         with patch('src.commands.remove_org_user.validate_organization_exists', return_value=mock_organization), \
-             patch('src.commands.remove_org_user.validate_user_exists', return_value=mock_user), \
-             patch('src.commands.remove_org_user.check_user_membership', return_value=mock_membership), \
+             patch('src.commands.remove_org_user.fetch_user_memberships', return_value={123: True}), \
              patch('click.echo') as mock_echo:
             
             remove_users_from_organization(1, [123])
             
-            # Verify membership was deleted
-            mock_session.delete.assert_called_once_with(mock_membership)
+            # Verify membership was deleted with one bulk DELETE
+            self._assert_bulk_deleted(mock_session, [123])
             mock_session.commit.assert_called_once()
-            mock_session.close.assert_called_once()
+            mock_db_manager.session_scope.return_value.__exit__.assert_called_once()
             
             # Verify success message
             mock_echo.assert_called_with("User 123 successfully removed from organization 1")
@@ -208,42 +130,23 @@ class TestRemoveUsersFromOrganization:
         """Test successfully removing multiple users."""
         # Setup mocks
         mock_session = Mock()
-        mock_db_manager.get_session.return_value = mock_session
+        mock_db_manager.session_scope.return_value.__enter__.return_value = mock_session
         
         # Mock organization exists
         mock_organization = Mock(spec=Organization)
         mock_organization.id = 1
         
-        # Mock users exist
-        mock_user1 = Mock(spec=User)
-        mock_user1.id = 123
-        mock_user2 = Mock(spec=User)
-        mock_user2.id = 456
-        
-        # Mock memberships exist
-        mock_membership1 = Mock(spec=OrganizationMembership)
-        mock_membership1.id = 1
-        mock_membership1.user_id = 123
-        mock_membership1.organization_id = 1
-        
-        mock_membership2 = Mock(spec=OrganizationMembership)
-        mock_membership2.id = 2
-        mock_membership2.user_id = 456
-        mock_membership2.organization_id = 1
-        
         with patch('src.commands.remove_org_user.validate_organization_exists', return_value=mock_organization), \
-             patch('src.commands.remove_org_user.validate_user_exists', side_effect=[mock_user1, mock_user2]), \
-             patch('src.commands.remove_org_user.check_user_membership', side_effect=[mock_membership1, mock_membership2]), \
+             patch('src.commands.remove_org_user.fetch_user_memberships',
+                   return_value={123: True, 456: True}), \
              patch('click.echo') as mock_echo:
             
             remove_users_from_organization(1, [123, 456])
             
-            # Verify memberships were deleted
-            assert mock_session.delete.call_count == 2
-            mock_session.delete.assert_any_call(mock_membership1)
-            mock_session.delete.assert_any_call(mock_membership2)
+            # Verify both memberships were deleted with one bulk DELETE
+            self._assert_bulk_deleted(mock_session, [123, 456])
             mock_session.commit.assert_called_once()
-            mock_session.close.assert_called_once()
+            mock_db_manager.session_scope.return_value.__exit__.assert_called_once()
             
             # Verify success messages
             mock_echo.assert_any_call("Successfully removed the following users from organization 1:")
@@ -255,33 +158,22 @@ class TestRemoveUsersFromOrganization:
         """Test partial success - some users removed, some skipped."""
         # Setup mocks
         mock_session = Mock()
-        mock_db_manager.get_session.return_value = mock_session
+        mock_db_manager.session_scope.return_value.__enter__.return_value = mock_session
         
         # Mock organization exists
         mock_organization = Mock(spec=Organization)
         mock_organization.id = 1
         
-        # Mock users - one exists, one doesn't
-        mock_user1 = Mock(spec=User)
-        mock_user1.id = 123
-        
-        # Mock membership - only for first user
-        mock_membership1 = Mock(spec=OrganizationMembership)
-        mock_membership1.id = 1
-        mock_membership1.user_id = 123
-        mock_membership1.organization_id = 1
-        
         with patch('src.commands.remove_org_user.validate_organization_exists', return_value=mock_organization), \
-             patch('src.commands.remove_org_user.validate_user_exists', side_effect=[mock_user1, None]), \
-             patch('src.commands.remove_org_user.check_user_membership', return_value=mock_membership1), \
+             patch('src.commands.remove_org_user.fetch_user_memberships', return_value={123: True}), \
              patch('click.echo') as mock_echo:
             
             remove_users_from_organization(1, [123, 999])
             
-            # Verify first membership was deleted
-            mock_session.delete.assert_called_once_with(mock_membership1)
+            # Verify only the first membership was deleted
+            self._assert_bulk_deleted(mock_session, [123])
             mock_session.commit.assert_called_once()
-            mock_session.close.assert_called_once()
+            mock_db_manager.session_scope.return_value.__exit__.assert_called_once()
             
             # Verify success and skip messages
             mock_echo.assert_any_call("User 123 successfully removed from organization 1")
@@ -293,27 +185,22 @@ class TestRemoveUsersFromOrganization:
         """Test skipping users who are not members."""
         # Setup mocks
         mock_session = Mock()
-        mock_db_manager.get_session.return_value = mock_session
+        mock_db_manager.session_scope.return_value.__enter__.return_value = mock_session
         
         # Mock organization exists
         mock_organization = Mock(spec=Organization)
         mock_organization.id = 1
         
-        # Mock user exists but is not a member
-        mock_user = Mock(spec=User)
-        mock_user.id = 123
-        
         with patch('src.commands.remove_org_user.validate_organization_exists', return_value=mock_organization), \
-             patch('src.commands.remove_org_user.validate_user_exists', return_value=mock_user), \
-             patch('src.commands.remove_org_user.check_user_membership', return_value=None), \
+             patch('src.commands.remove_org_user.fetch_user_memberships', return_value={123: False}), \
              patch('click.echo') as mock_echo:
             
             remove_users_from_organization(1, [123])
             
             # Verify no membership was deleted
-            mock_session.delete.assert_not_called()
+            mock_session.query.assert_not_called()
             mock_session.commit.assert_not_called()
-            mock_session.close.assert_called_once()
+            mock_db_manager.session_scope.return_value.__exit__.assert_called_once()
             
             # Verify skip message
             mock_echo.assert_any_call("Skipped the following users:")
@@ -325,7 +212,7 @@ class TestRemoveUsersFromOrganization:
         """Test organization not found raises ClickException."""
         # Setup mocks
         mock_session = Mock()
-        mock_db_manager.get_session.return_value = mock_session
+        mock_db_manager.session_scope.return_value.__enter__.return_value = mock_session
         
         with patch('src.commands.remove_org_user.validate_organization_exists', 
                    side_effect=click.ClickException("Organization with ID 999 not found")):
@@ -338,32 +225,21 @@ class TestRemoveUsersFromOrganization:
         """Test removing users with duplicate IDs."""
         # Setup mocks
         mock_session = Mock()
-        mock_db_manager.get_session.return_value = mock_session
+        mock_db_manager.session_scope.return_value.__enter__.return_value = mock_session
         
         # Mock organization exists
         mock_organization = Mock(spec=Organization)
         mock_organization.id = 1
         
-        # Mock user exists
-        mock_user = Mock(spec=User)
-        mock_user.id = 123
-        
-        # Mock membership exists
-        mock_membership = Mock(spec=OrganizationMembership)
-        mock_membership.id = 1
-        mock_membership.user_id = 123
-        mock_membership.organization_id = 1
-        
         with patch('src.commands.remove_org_user.validate_organization_exists', return_value=mock_organization), \
-             patch('src.commands.remove_org_user.validate_user_exists', return_value=mock_user), \
-             patch('src.commands.remove_org_user.check_user_membership', return_value=mock_membership), \
+             patch('src.commands.remove_org_user.fetch_user_memberships', return_value={123: True}), \
              patch('click.echo') as mock_echo:
             
             # Pass duplicate user IDs
             remove_users_from_organization(1, [123, 123, 123])
             
             # Verify membership was deleted only once (deduplication worked)
-            mock_session.delete.assert_called_once_with(mock_membership)
+            self._assert_bulk_deleted(mock_session, [123])
             mock_session.commit.assert_called_once()
             
             # Verify success message for single user (due to deduplication)
@@ -375,35 +251,24 @@ class TestRemoveUsersFromOrganization:
         """Test database error handling during commit."""
         # Setup mocks
         mock_session = Mock()
-        mock_db_manager.get_session.return_value = mock_session
+        mock_db_manager.session_scope.return_value.__enter__.return_value = mock_session
         
         # Mock organization exists
         mock_organization = Mock(spec=Organization)
         mock_organization.id = 1
         
-        # Mock user exists
-        mock_user = Mock(spec=User)
-        mock_user.id = 123
-        
-        # Mock membership exists
-        mock_membership = Mock(spec=OrganizationMembership)
-        mock_membership.id = 1
-        mock_membership.user_id = 123
-        mock_membership.organization_id = 1
-        
         # Mock commit raises IntegrityError
         mock_session.commit.side_effect = IntegrityError("statement", "params", "orig")
         
         with patch('src.commands.remove_org_user.validate_organization_exists', return_value=mock_organization), \
-             patch('src.commands.remove_org_user.validate_user_exists', return_value=mock_user), \
-             patch('src.commands.remove_org_user.check_user_membership', return_value=mock_membership), \
+             patch('src.commands.remove_org_user.fetch_user_memberships', return_value={123: True}), \
              patch('click.echo') as mock_echo:
             
             remove_users_from_organization(1, [123])
             
             # Verify rollback was called
             mock_session.rollback.assert_called_once()
-            mock_session.close.assert_called_once()
+            mock_db_manager.session_scope.return_value.__exit__.assert_called_once()
             
             # Verify error message and exit (match the actual SQLAlchemy error format)
             error_calls = [call for call in mock_echo.call_args_list if call.kwargs.get('err') is True]
@@ -513,4 +378,66 @@ class TestRemoveOrgUserCommand:
             )
             
             assert result.exit_code == 1
-            assert "An unexpected error occurred: Database connection failed" in result.output
\ No newline at end of file
+            assert "An unexpected error occurred: Database connection failed" in result.output
+
+class TestFetchUserMemberships:
+    """Test the batched membership lookup and removal queries."""
+    
+    def test_fetch_user_memberships_single_query(self):
+        """Test existing users map to a membership flag, in one query."""
+        from sqlalchemy import event
+        from core.models import Organization
+        from storage.database import DatabaseManager
+        
+        db_manager = DatabaseManager("sqlite:///:memory:")
+        db_manager.create_tables()
+        try:
+            with db_manager.session_scope() as session:
+                session.add(Organization(id=1, name="Org"))
+                session.add_all([User(id=i, first_name=f"User{i}", last_name="Test") for i in (1, 2, 4)])
+                session.flush()
+                session.get(User, 4).soft_delete()
+                session.add(OrganizationMembership(user_id=1, organization_id=1))
+            
+            statements = []
+            event.listen(
+                db_manager.engine,
+                'before_cursor_execute',
+                lambda conn, cursor, statement, *args: statements.append(statement)
+            )
+            with db_manager.session_scope() as session:
+                memberships = fetch_user_memberships(session, [1, 2, 3, 4], 1)
+                
+                assert memberships == {1: True, 2: False}
+            assert len(statements) == 1
+        finally:
+            db_manager.close()
+    
+    def test_remove_memberships_with_one_delete(self):
+        """Test removing several users issues a single DELETE statement."""
+        from sqlalchemy import event
+        from storage.database import DatabaseManager
+        
+        db_manager = DatabaseManager("sqlite:///:memory:")
+        db_manager.create_tables()
+        try:
+            with db_manager.session_scope() as session:
+                session.add(Organization(id=1, name="Org"))
+                session.add_all([User(id=i, first_name=f"User{i}", last_name="Test") for i in (1, 2, 3)])
+                session.flush()
+                session.add_all([OrganizationMembership(user_id=i, organization_id=1) for i in (1, 2)])
+            
+            statements = []
+            event.listen(
+                db_manager.engine,
+                'before_cursor_execute',
+                lambda conn, cursor, statement, *args: statements.append(statement)
+            )
+            with patch('src.commands.remove_org_user.db_manager', db_manager), patch('click.echo'):
+                remove_users_from_organization(1, [1, 2, 3])
+            
+            assert len([s for s in statements if s.startswith("DELETE")]) == 1
+            with db_manager.session_scope() as session:
+                assert session.query(OrganizationMembership).count() == 0
+        finally:
+            db_manager.close()
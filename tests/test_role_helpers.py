@@ -4,12 +4,19 @@ import pytest
 import warnings
 from datetime import datetime, timezone
 
-from core.models import User, ProfileRole
+from core.models import User, ProfileRole, classify_role
 
 
 class TestRoleHelpers:
     """Test the new role helper methods."""
     
+    def test_classify_role_from_email(self):
+        """Test classify_role matches get_role for the same email."""
+        assert classify_role("john@example.com") == ProfileRole.REGISTERED_USER
+        assert classify_role("jane@tournamentorg.com") == ProfileRole.ORG_MEMBER
+        assert classify_role("   ") == ProfileRole.UNREGISTERED_USER
+        assert classify_role(None) == ProfileRole.UNREGISTERED_USER
+    
     def test_is_registered_user_with_email(self):
         """Test is_registered_user returns True for users with email."""
         user = User(
@@ -0,0 +1,39 @@
+"""Tests for input normalization helpers."""
+
+from core.validation import normalize_text
+
+
+class TestNormalizeText:
+    """Test cases for normalize_text."""
+    
+    def test_strips_whitespace(self):
+        """Test that surrounding whitespace is removed."""
+        assert normalize_text("  Admin  ", 64) == ("Admin", None)
+    
+    def test_empty_rejected(self):
+        """Test that empty and whitespace-only values are rejected."""
+        assert normalize_text("   ", 64) == ("", "cannot be empty")
+        assert normalize_text("", 64) == ("", "cannot be empty")
+    
+    def test_empty_allowed(self):
+        """Test that empty values pass when allowed."""
+        assert normalize_text("   ", 255, allow_empty=True) == ("", None)
+    
+    def test_max_length_enforced(self):
+        """Test that values longer than the limit are rejected."""
+        assert normalize_text("a" * 64, 64) == ("a" * 64, None)
+        assert normalize_text("a" * 65, 64) == ("a" * 65, "cannot exceed 64 characters")
+    
+    def test_results_are_cached(self):
+        """Test that repeated validation of the same value hits the cache."""
+        normalize_text.cache_clear()
+        normalize_text("Manager", 64)
+        normalize_text("Manager", 64)
+        assert normalize_text.cache_info().hits == 1
+    
+    def test_invalid_results_are_cached(self):
+        """Test that rejected values are cached as well."""
+        normalize_text.cache_clear()
+        normalize_text("   ", 64)
+        normalize_text("   ", 64)
+        assert normalize_text.cache_info().hits == 1
@@ -1,17 +1,56 @@
 """CSV export utilities for the 4th Arrow Tournament Control application."""
 
 import csv
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Iterable, Dict, Any, Sequence
 
+# Number of rows handed to the CSV writer at once
+EXPORT_BATCH_SIZE = 1000
 
-def export_users_to_csv(users_data: List[Dict[str, Any]], output_path: Path) -> None:
+# File buffer size for exports (1 MiB), so large exports make few write calls
+EXPORT_BUFFER_SIZE = 1 << 20
+
+# Column order of exported user rows
+USER_CSV_FIELDS = ('id', 'name', 'role', 'email', 'created_at')
+
+
+def export_users_to_csv(users_data: Iterable[Dict[str, Any]], output_path: Path) -> int:
     """Export user data to RFC 4180 compliant CSV file.
     
+    Rows are consumed and written in batches, so a streaming iterable is never
+    held in memory all at once.
+    
+    Args:
+        users_data: Iterable of dictionaries containing user data
+        output_path: Path where CSV file should be written
+        
+    Returns:
+        int: Number of user rows written
+        
+    Raises:
+        OSError: If file cannot be written to specified path
+        PermissionError: If insufficient permissions to write file
+    """
+    return export_user_rows_to_csv(
+        ([user.get(field, '') for field in USER_CSV_FIELDS] for user in users_data),
+        output_path
+    )
+
+
+def export_user_rows_to_csv(rows: Iterable[Sequence[Any]], output_path: Path) -> int:
+    """Export user rows already in USER_CSV_FIELDS order to a CSV file.
+    
+    Rows are handed to the C csv writer in batches as they are, so no
+    dictionary is built or looked up per row.
+    
     Args:
-        users_data: List of dictionaries containing user data
+        rows: Iterable of rows with one value per USER_CSV_FIELDS column
         output_path: Path where CSV file should be written
         
+    Returns:
+        int: Number of user rows written
+        
     Raises:
         OSError: If file cannot be written to specified path
         PermissionError: If insufficient permissions to write file
@@ -19,12 +58,20 @@ def export_users_to_csv(users_data: List[Dict[str, Any]], output_path: Path) ->
     # Ensure parent directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    fieldnames = ['id', 'name', 'role', 'email', 'created_at']
+    with open(output_path, 'w', newline='', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as csvfile:
+        writer = csv.writer(csvfile, quoting=csv.QUOTE_MINIMAL)
+        writer.writerow(USER_CSV_FIELDS)
+        
+        count = 0
+        rows = iter(rows)
+        while True:
+            batch = list(islice(rows, EXPORT_BATCH_SIZE))
+            if not batch:
+                break
+            writer.writerows(batch)
+            count += len(batch)
     
-    with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames, quoting=csv.QUOTE_MINIMAL)
-        writer.writeheader()
-        writer.writerows(users_data)
+    return count
 
 
 def validate_csv_path(path_str: str) -> Path: